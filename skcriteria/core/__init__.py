@@ -14,6 +14,7 @@
 # IMPORTS
 # =============================================================================
 
+from .batch import DecisionMatrixBatch, RankResultBatch
 from .data import (
     DecisionMatrix,
     KernelResult,
@@ -28,8 +29,13 @@ from .methods import (
     SKCMethodABC,
     SKCTransformerABC,
     SKCWeighterABC,
+    arrays_to_dm,
+    dm_to_arrays,
 )
+from .options import get_option, option_context, reset_option, set_option
 from .plot import DecisionMatrixPlotter
+from .shared import SharedDecisionMatrix
+from .stats import CriteriaStats
 
 # =============================================================================
 # ALL
@@ -37,15 +43,25 @@ from .plot import DecisionMatrixPlotter
 
 __all__ = [
     "mkdm",
+    "CriteriaStats",
     "DecisionMatrix",
+    "DecisionMatrixBatch",
     "DecisionMatrixPlotter",
     "KernelResult",
     "Objective",
     "RankResult",
+    "RankResultBatch",
     "ResultABC",
     "SKCDecisionMakerABC",
     "SKCMatrixAndWeightTransformerABC",
     "SKCMethodABC",
     "SKCTransformerABC",
     "SKCWeighterABC",
+    "SharedDecisionMatrix",
+    "arrays_to_dm",
+    "dm_to_arrays",
+    "get_option",
+    "option_context",
+    "reset_option",
+    "set_option",
 ]
@@ -0,0 +1,370 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Batches of decision problems that share the same criteria.
+
+A batch stores many small decision problems (with the same criteria and
+objectives, but different alternatives and weights) as a single 3D array,
+so the methods with batched kernels can evaluate all of them in one
+vectorized call.
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+import pandas as pd
+
+from . import options
+from .data import DecisionMatrix, Objective, RankResult
+from ..utils import Bunch
+
+
+# =============================================================================
+# DECISION MATRIX BATCH
+# =============================================================================
+
+
+def _frozen(arr):
+    arr = arr.view()
+    arr.flags.writeable = False
+    return arr
+
+
+class DecisionMatrixBatch:
+    """Stack of decision problems that share the same criteria.
+
+    Parameters
+    ----------
+    matrix: Iterable
+        Array of shape ``(n_problems, n_alternatives, n_criteria)`` with the
+        alternatives matrix of every problem.
+    objectives: Iterable
+        The sense of optimality of every criteria (shared by all the
+        problems). You can use any alias provided by the objective class.
+    weights: Iterable o None (default ``None``)
+        Weights of every problem with shape ``(n_problems, n_criteria)``.
+        A single array of ``n_criteria`` elements is used for all the
+        problems. If is ``None`` all the criteria are weighted with 1.
+    alternatives: Iterable o None (default ``None``)
+        Names of the alternatives of every problem with shape
+        ``(n_problems, n_alternatives)`` (or a single array of
+        ``n_alternatives`` names for all the problems). If is ``None``,
+        the alternatives are named "A[n]".
+    criteria: Iterable o None (default ``None``)
+        Names of the criteria. If is ``None``, the criteria are named "C[m]".
+    copy: bool (default ``True``)
+        If ``False`` and ``matrix`` is a :py:class:`numpy.ndarray`, the batch
+        wraps a read-only view of the buffer instead of a copy.
+
+    """
+
+    def __init__(
+        self,
+        matrix,
+        objectives,
+        weights=None,
+        alternatives=None,
+        criteria=None,
+        copy=True,
+    ):
+        matrix = np.array(matrix, copy=copy)
+        if matrix.ndim != 3:
+            raise ValueError(
+                f"'matrix' must have 3 dimensions, found {matrix.ndim} instead"
+            )
+        matrix = matrix.astype(options.storage_dtype(matrix.dtype), copy=False)
+        p_number, a_number, c_number = matrix.shape
+
+        criteria = np.asarray(
+            [f"C{idx}" for idx in range(c_number)]
+            if criteria is None
+            else criteria
+        )
+        if criteria.shape != (c_number,):
+            raise ValueError(f"'criteria' must have {c_number} elements")
+
+        alternatives = np.asarray(
+            [f"A{idx}" for idx in range(a_number)]
+            if alternatives is None
+            else alternatives
+        )
+        try:
+            alternatives = np.broadcast_to(alternatives, (p_number, a_number))
+        except ValueError:
+            raise ValueError(
+                f"'alternatives' must have {a_number} elements by problem"
+            )
+
+        objectives = np.array(
+            [Objective.construct_from_alias(a).value for a in objectives],
+            dtype=np.int8,
+        )
+        if objectives.shape != (c_number,):
+            raise ValueError(f"'objectives' must have {c_number} elements")
+
+        weights = np.asarray(
+            np.ones(c_number) if weights is None else weights,
+            dtype=options.float_dtype(matrix.dtype),
+        )
+        try:
+            weights = np.broadcast_to(weights, (p_number, c_number))
+        except ValueError:
+            raise ValueError(
+                f"'weights' must have {c_number} elements by problem"
+            )
+
+        self._matrix = _frozen(matrix)
+        self._objectives = _frozen(objectives)
+        self._weights = _frozen(weights)
+        self._alternatives = _frozen(alternatives)
+        self._criteria = _frozen(criteria)
+
+    @classmethod
+    def from_decision_matrices(cls, dms):
+        """Stack decision matrices with the same criteria into a batch.
+
+        Parameters
+        ----------
+        dms: Iterable of :py:class:`skcriteria.core.data.DecisionMatrix`
+            The decision matrices to stack. All of them must have the same
+            shape, criteria and objectives.
+
+        Returns
+        -------
+        :py:class:`DecisionMatrixBatch`
+            A new batch.
+
+        """
+        dms = list(dms)
+        if not dms:
+            raise ValueError("At least one decision matrix is required")
+
+        first = dms[0]
+        for dm in dms[1:]:
+            if not (
+                dm.shape == first.shape
+                and np.array_equal(dm.criteria, first.criteria)
+                and np.array_equal(dm._objectives, first._objectives)
+            ):
+                raise ValueError(
+                    "All the decision matrices must have the same shape, "
+                    "criteria and objectives"
+                )
+
+        return cls(
+            matrix=np.stack([dm.matrix_view for dm in dms]),
+            objectives=first._objectives,
+            weights=np.stack([dm._weights for dm in dms]),
+            alternatives=np.stack([dm.alternatives for dm in dms]),
+            criteria=first.criteria,
+            copy=False,
+        )
+
+    # PROPERTIES ==============================================================
+
+    @property
+    def matrix(self):
+        """Read-only array with the alternatives matrix of every problem."""
+        return self._matrix
+
+    @property
+    def weights(self):
+        """Read-only array with the weights of every problem."""
+        return self._weights
+
+    @property
+    def alternatives(self):
+        """Names of the alternatives of every problem."""
+        return self._alternatives
+
+    @property
+    def criteria(self):
+        """Names of the criteria."""
+        return self._criteria
+
+    @property
+    def objectives(self):
+        """Objectives of the criteria as ``Objective`` instances."""
+        return pd.Series(
+            [Objective(o) for o in self._objectives],
+            index=self._criteria,
+            name="Objectives",
+        )
+
+    @property
+    def iobjectives(self):
+        """Objectives of the criteria as ``int``."""
+        return pd.Series(
+            self._objectives,
+            dtype=np.int8,
+            index=self._criteria,
+        )
+
+    @property
+    def shape(self):
+        """Tuple with (n_problems, n_alternatives, n_criteria)."""
+        return self._matrix.shape
+
+    def __len__(self):
+        """Return the number of problems.
+
+        batch.__len__() <==> len(batch).
+
+        """
+        return len(self._matrix)
+
+    # UTILITIES ===============================================================
+
+    def __getitem__(self, idx):
+        """Decision matrix of the problem ``idx``.
+
+        The decision matrix (with the numpy engine) shares the memory of the
+        batch.
+
+        """
+        return DecisionMatrix._from_parts(
+            matrix=self._matrix[idx],
+            alternatives=self._alternatives[idx],
+            criteria=self._criteria,
+            objectives=self._objectives,
+            weights=self._weights[idx],
+        )
+
+    def __iter__(self):
+        """Iterate over the decision matrices of every problem."""
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def to_dict(self, copy=True):
+        """Return a dict representation of the data.
+
+        All the values are represented as numpy array.
+
+        Parameters
+        ----------
+        copy: bool (default ``True``)
+            If ``False`` the read-only internal arrays are returned instead
+            of copies.
+
+        """
+        data = {
+            "matrix": self._matrix,
+            "objectives": self._objectives,
+            "weights": self._weights,
+            "alternatives": self._alternatives,
+            "criteria": self._criteria,
+        }
+        if copy:
+            data = {k: np.array(v) for k, v in data.items()}
+        return data
+
+    def __repr__(self):
+        """batch.__repr__() <==> repr(batch)."""
+        p_number, a_number, c_number = self.shape
+        return (
+            f"<{type(self).__name__} {p_number} Problems x "
+            f"{a_number} Alternatives x {c_number} Criteria>"
+        )
+
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+
+class RankResultBatch:
+    """Rankings of every problem of a batch.
+
+    Parameters
+    ----------
+    method: str
+        Name of the method that generated the result.
+    alternatives: array-like
+        Names of the alternatives of every problem.
+    values: array-like
+        Array of shape ``(n_problems, n_alternatives)`` with the ranking of
+        every problem.
+    extra: dict-like
+        Extra information provided by the method. The arrays have one
+        element by problem in the first axis.
+
+    """
+
+    def __init__(self, method, alternatives, values, extra):
+        self._method = str(method)
+        self._alternatives = np.asarray(alternatives)
+        self._values = np.asarray(values, dtype=np.int32)
+        self._extra = Bunch("extra", extra)
+
+    @property
+    def method(self):
+        """Name of the method that generated the result."""
+        return self._method
+
+    @property
+    def alternatives(self):
+        """Names of the alternatives of every problem."""
+        return self._alternatives
+
+    @property
+    def rank_(self):
+        """Array with the ranking of every problem."""
+        return self._values
+
+    @property
+    def extra_(self):
+        """Additional information about the result.
+
+        Note
+        ----
+        ``e_`` is an alias for this property
+
+        """
+        return self._extra
+
+    e_ = extra_
+
+    @property
+    def shape(self):
+        """Tuple with (n_problems, n_alternatives)."""
+        return self._values.shape
+
+    def __len__(self):
+        """Return the number of problems.
+
+        result.__len__() <==> len(result).
+
+        """
+        return len(self._values)
+
+    def __getitem__(self, idx):
+        """Return the result of the problem ``idx`` as a ``RankResult``."""
+        extra = {
+            k: v[idx] if isinstance(v, np.ndarray) else v
+            for k, v in self._extra.items()
+        }
+        return RankResult(
+            self._method,
+            alternatives=self._alternatives[idx],
+            values=self._values[idx],
+            extra=extra,
+        )
+
+    def __repr__(self):
+        """result.__repr__() <==> repr(result)."""
+        p_number, a_number = self.shape
+        return (
+            f"<{type(self).__name__} {p_number} Problems x "
+            f"{a_number} Alternatives [Method: {self._method}]>"
+        )
@@ -22,21 +22,30 @@ the alternative matrix,   weights and objectives (MIN, MAX) of the criteria.
 import abc
 import enum
 import functools
+import hashlib
 
 import numpy as np
 
 import pandas as pd
 from pandas.io.formats import format as pd_fmt
 
-import pyquery as pq
+from scipy import sparse
 
+from . import options
+from .indexing import DecisionMatrixILocIndexer, DecisionMatrixLocIndexer
 from .plot import DecisionMatrixPlotter
-from ..utils import Bunch, doc_inherit
-
+from .shared import SharedDecisionMatrix
+from .stats import CriteriaStats
+from ..utils import Bunch, archive, buffer, chunks, doc_inherit, rank
 
 # =============================================================================
 # CONSTANTS
 # =============================================================================
+
+#: Version of the binary format used by the ``save()`` methods.
+FORMAT_VERSION = 1
+
+
 class Objective(enum.Enum):
     """Representation of criteria objectives (Minimize, Maximize)."""
 
@@ -117,6 +126,161 @@ class Objective(enum.Enum):
 # =============================================================================
 
 
+def _get_engine(engine):
+    """Validate the engine or retrieve the default one if is None."""
+    if engine is None:
+        return options.get_option("engine")
+    if engine not in options.ENGINES:
+        raise ValueError(f"Invalid engine '{engine}'")
+    return engine
+
+
+def _is_frozen(arr, dtype):
+    """Check if ``arr`` is a read-only 1D array of the given dtype."""
+    return (
+        isinstance(arr, np.ndarray)
+        and arr.ndim == 1
+        and arr.dtype == dtype
+        and not arr.flags.writeable
+    )
+
+
+# parameters of copy() that don't require to rebuild the alternatives matrix
+_SHARED_COPY_PARAMS = frozenset(
+    {"objectives", "weights", "alternatives", "criteria", "engine"}
+)
+
+
+# functions called every time a decision matrix is derived from another one
+# by adding or removing alternatives.
+_alternatives_hooks = []
+
+
+def register_alternatives_hook(hook):
+    """Register a function to be notified when the alternatives change.
+
+    The ``hook`` is called as ``hook(parent, child, event, value)`` every
+    time a new decision matrix (``child``) is derived from another one
+    (``parent``) by ``DecisionMatrix.append_alternatives()`` (``event`` is
+    ``"append"`` and ``value`` the array with the new rows) or by
+    ``DecisionMatrix.drop_alternatives()`` (``event`` is ``"drop"`` and
+    ``value`` a boolean mask of the dropped alternatives of the parent).
+
+    Useful for caches of per-criterion statistics that can be updated
+    incrementally instead of computed again.
+
+    The function can be used as a decorator.
+
+    """
+    _alternatives_hooks.append(hook)
+    return hook
+
+
+def unregister_alternatives_hook(hook):
+    """Remove a function registered with ``register_alternatives_hook()``."""
+    _alternatives_hooks.remove(hook)
+
+
+def _notify_alternatives_hooks(parent, child, event, value):
+    for hook in _alternatives_hooks:
+        hook(parent, child, event, value)
+
+
+def _append_stats_hook(parent, child, event, value):
+    # the statistics already computed by the parent are updated with the
+    # appended rows instead of being computed again over the whole matrix
+    if (
+        event == "append"
+        and parent._stats is not None
+        and child._engine != "sparse"
+    ):
+        child._stats = parent._stats.append(child.matrix_view, value)
+
+
+register_alternatives_hook(_append_stats_hook)
+
+
+def _as_sparse(matrix, copy=False):
+    """Sparse matrix (CSR, or CSC if is already CSC) with read-only values."""
+    if sparse.issparse(matrix) and matrix.format == "csc":
+        matrix = sparse.csc_matrix(matrix, copy=copy)
+    else:
+        matrix = sparse.csr_matrix(matrix, copy=copy)
+    # a new matrix over the same buffers, so the read-only flag doesn't
+    # change the matrix of the caller
+    matrix = type(matrix)(
+        (matrix.data.view(), matrix.indices, matrix.indptr),
+        shape=matrix.shape,
+        copy=False,
+    )
+    matrix.data.flags.writeable = False
+    return matrix
+
+
+def _fill_masked(matrix):
+    """Replace the masked values of a masked array with NaN."""
+    if not np.ma.is_masked(matrix):
+        return np.ma.getdata(matrix)
+    dtype = options.float_dtype(matrix.dtype)
+    return matrix.astype(dtype).filled(np.nan)
+
+
+def _pack_valid(matrix):
+    """Bit-packed mask with a 1 for every value that is not missing."""
+    a_number, c_number = matrix.shape
+    bits = np.empty((a_number, -(-c_number // 8)), dtype=np.uint8)
+    kind = matrix.dtype.kind
+    if kind not in "fcO":
+        bits[:] = np.packbits(np.ones(c_number, dtype=bool))
+    else:
+        isna = np.isnan if kind in "fc" else pd.isna
+        for rows in chunks.row_chunks(matrix):
+            bits[rows] = np.packbits(~isna(matrix[rows]), axis=1)
+    bits.flags.writeable = False
+    return bits
+
+
+def _hash_labels(hasher, labels):
+    # the labels are hashed by value, so the result doesn't depend on the
+    # dtype used to store them (numpy strings or python objects).
+    hasher.update(f"{len(labels)};".encode())
+    for rows in chunks.row_chunks(labels):
+        block = "".join(f"{v!r}," for v in labels[rows].tolist())
+        hasher.update(block.encode())
+
+
+def _hash_values(hasher, arr):
+    hasher.update(f"{arr.dtype.str}{arr.shape};".encode())
+    if arr.dtype.hasobject:
+        _hash_labels(hasher, arr)
+        return
+    for rows in chunks.row_chunks(arr):
+        hasher.update(np.ascontiguousarray(arr[rows]).data)
+
+
+def _any_nan(arr):
+    if arr.dtype.kind not in "fc":
+        return False
+    return any(np.isnan(arr[rows]).any() for rows in chunks.row_chunks(arr))
+
+
+def _allclose_by_chunks(arr, other, **kwargs):
+    # the arrays are compared by blocks of rows, stopping at the first block
+    # with a difference.
+    return all(
+        np.allclose(arr[rows], other[rows], **kwargs)
+        for rows in chunks.row_chunks(arr)
+    )
+
+
+def _extend_rows(rbuffer, arr, rows):
+    """Extend ``arr`` with ``rows`` using the growable buffer of the array."""
+    if rbuffer is None:
+        capacity = int(len(arr) * buffer.GROWTH_FACTOR) + len(rows)
+        rbuffer = buffer.RowBuffer(arr, capacity=capacity)
+    return rbuffer.extend(len(arr), rows)
+
+
 class DecisionMatrix:
     """Representation of all data needed in the MCDA analysis.
 
@@ -187,30 +351,164 @@ class DecisionMatrix:
     weights: :py:class:`numpy.ndarray`
         An iterable with the weights also with the same amount of elements
         as criteria.
+    copy: bool (default ``True``)
+        If ``True`` the ``data_df`` is copied. If ``False`` the decision
+        matrix wraps the provided dataframe without copying it; the caller
+        keeps the ownership of the data and must not modify it while the
+        decision matrix is in use.
+    engine: str or None (default ``None``)
+        How the alternatives matrix is stored. ``"pandas"`` keeps a
+        :py:class:`pandas.DataFrame` (one dtype per criteria), and
+        ``"numpy"`` keeps a single 2D :py:class:`numpy.ndarray` plus the
+        labels, the dataframe is only created when is needed (``matrix``,
+        ``describe()``, ``plot`` or the representation). ``"sparse"`` keeps
+        a :py:mod:`scipy.sparse` CSR (or CSC) matrix, useful for wide
+        matrices with mostly zeros; the methods that don't support sparse
+        matrices receive a dense copy. If is ``None`` the global option
+        ``engine`` is used (see ``skcriteria.core.options``).
 
     """
 
-    def __init__(self, data_df, objectives, weights):
+    def __init__(self, data_df, objectives, weights, copy=True, engine=None):
 
-        self._data_df = (
+        data_df = (
             data_df.copy()
-            if isinstance(data_df, pd.DataFrame)
-            else pd.DataFrame(data_df)
+            if isinstance(data_df, pd.DataFrame) and copy
+            else pd.DataFrame(data_df, copy=copy)
         )
 
-        self._objectives = np.asarray(objectives, dtype=object)
-        self._weights = np.asanyarray(weights, dtype=float)
+        engine = _get_engine(engine)
+        if engine == "pandas":
+            self._setup(
+                data_df=data_df, objectives=objectives, weights=weights
+            )
+        else:
+            matrix = data_df.to_numpy()
+            self._setup(
+                matrix=_as_sparse(matrix) if engine == "sparse" else matrix,
+                alternatives=data_df.index.to_numpy(),
+                criteria=data_df.columns.to_numpy(),
+                objectives=objectives,
+                weights=weights,
+            )
+
+    def _setup(
+        self,
+        *,
+        objectives,
+        weights,
+        data_df=None,
+        matrix=None,
+        alternatives=None,
+        criteria=None,
+    ):
+        """Configure the internal state of the decision matrix.
+
+        If ``data_df`` is provided the matrix is stored with the pandas
+        engine, otherwise ``matrix``, ``alternatives`` and ``criteria`` are
+        stored with the numpy engine (or the sparse engine if ``matrix`` is
+        a :py:mod:`scipy.sparse` matrix).
+
+        """
+        if data_df is not None:
+            self._engine = "pandas"
+            matrix = None
+            alternatives = data_df.index.to_numpy()
+            criteria = data_df.columns.to_numpy()
+            dtypes = data_df.dtypes
+        elif sparse.issparse(matrix):
+            self._engine = "sparse"
+            matrix = _as_sparse(matrix)
+            dtypes = [matrix.dtype]
+        else:
+            self._engine = "numpy"
+            matrix = matrix.view()
+            matrix.flags.writeable = False
+            dtypes = [matrix.dtype]
+
+        self._df = data_df
+        self._matrix = matrix
+
+        # growable buffers of the matrix and the alternatives (only used by
+        # the numpy engine after append_alternatives())
+        self._row_buffers = None
+
+        # memoized content hash (see fingerprint())
+        self._fingerprint = None
+
+        # lazy statistics of the criteria (see stats)
+        self._stats = None
+
+        # lazy bit-packed mask of the values that are not missing
+        # (see valid_mask)
+        self._valid_bits = None
+
+        self._alternatives = alternatives.view()
+        self._alternatives.flags.writeable = False
+
+        self._criteria = criteria.view()
+        self._criteria.flags.writeable = False
+
+        # the aliases are resolved only once and stored as integers. The
+        # internal read-only arrays of another decision matrix are shared.
+        if _is_frozen(objectives, np.int8):
+            self._objectives = objectives
+        else:
+            self._objectives = np.array(
+                [Objective.construct_from_alias(a).value for a in objectives],
+                dtype=np.int8,
+            )
+            self._objectives.flags.writeable = False
+
+        # the weights follow the precision of the matrix
+        wdtype = options.float_dtype(*dtypes)
+        if _is_frozen(weights, wdtype):
+            self._weights = weights
+        else:
+            self._weights = np.array(weights, dtype=wdtype)
+            self._weights.flags.writeable = False
 
         if not (
-            len(self._data_df.columns)
-            == len(self._weights)
-            == len(self._objectives)
+            len(self._criteria) == len(self._weights) == len(self._objectives)
         ):
             raise ValueError(
                 "The number of weights, and objectives must be equal to the "
                 "number of criteria (number of columns in data_df)"
             )
 
+    @classmethod
+    def _from_parts(cls, **kwargs):
+        """Create a decision matrix directly from the internal state.
+
+        This constructor skips ``__init__`` and receives the same parameters
+        as ``DecisionMatrix._setup()``. No copy of the arrays is made.
+
+        """
+        dm = cls.__new__(cls)
+        dm._setup(**kwargs)
+        return dm
+
+    def __reduce_ex__(self, protocol):
+        """Reduce the decision matrix to its internal arrays for pickle.
+
+        Only the arrays needed to rebuild the decision matrix are pickled
+        (not the lazy dataframe of the numpy engine nor the spare capacity
+        of the buffers used by ``append_alternatives()``). With the pickle
+        protocol 5 the contiguous arrays are sent as out-of-band buffers
+        (see :py:class:`pickle.PickleBuffer`).
+
+        """
+        parts = {"objectives": self._objectives, "weights": self._weights}
+        if self._engine != "pandas":
+            parts.update(
+                matrix=self._matrix,
+                alternatives=self._alternatives,
+                criteria=self._criteria,
+            )
+        else:
+            parts.update(data_df=self._df)
+        return (_unpickle_decision_matrix, (type(self), parts))
+
     # CUSTOM CONSTRUCTORS =====================================================
 
     @classmethod
@@ -222,6 +520,8 @@ class DecisionMatrix:
         alternatives=None,
         criteria=None,
         dtypes=None,
+        copy=True,
+        engine=None,
     ):
         """Create a new DecisionMatrix object.
 
@@ -232,7 +532,8 @@ class DecisionMatrix:
         ----------
         matrix: Iterable
             The matrix of alternatives. Where every row is an alternative
-            and every column is a criteria.
+            and every column is a criteria. The missing values are NaN (or
+            the masked values of a :py:class:`numpy.ma.MaskedArray`).
 
         objectives: Iterable
             The array with the sense of optimality of every
@@ -254,7 +555,28 @@ class DecisionMatrix:
 
         dtypes: Iterable o None (default ``None``)
             Optional types of the criteria. If is None, the type is inferred
-            automatically by pandas.
+            automatically by pandas. If the global option ``precision`` is
+            ``"float32"`` the floating point criteria are stored as
+            ``float32``.
+
+        copy: bool (default ``True``)
+            If ``True`` the values of ``matrix`` are copied into the new
+            decision matrix. If ``False`` and ``matrix`` is a 2D
+            :py:class:`numpy.ndarray` of a single dtype, the decision matrix
+            wraps a read-only view of the buffer and no copy of the
+            alternatives matrix is made. In this case the caller keeps the
+            ownership of the array and must not modify it while the decision
+            matrix is in use. A copy is still needed if ``dtypes`` requires a
+            type conversion.
+
+        engine: str or None (default ``None``)
+            Storage engine of the decision matrix (``"pandas"``,
+            ``"numpy"`` or ``"sparse"``). If is ``None`` the global option
+            ``engine`` is used, or ``"sparse"`` if ``matrix`` is a
+            :py:mod:`scipy.sparse` matrix. The numpy and sparse engines store
+            all the criteria with a single dtype, so if ``dtypes`` is
+            provided they are promoted to a common type with
+            :py:func:`numpy.result_type`.
 
         Returns
         -------
@@ -284,6 +606,10 @@ class DecisionMatrix:
         constructor of the DecisionMatrix class but is slower.
 
         """
+        # the masked values are stored as missing values (NaN)
+        if np.ma.isMaskedArray(matrix):
+            matrix = _fill_masked(matrix)
+
         # first we need the number of alternatives and criteria
         try:
             a_number, c_number = np.shape(matrix)
@@ -310,17 +636,161 @@ class DecisionMatrix:
         if len(criteria) != c_number:
             raise ValueError(f"'criteria' must have {c_number} elements")
 
+        if dtypes is not None and len(dtypes) != c_number:
+            raise ValueError(f"'dtypes' must have {c_number} elements")
+
         weights = np.asarray(np.ones(c_number) if weights is None else weights)
 
-        data_df = pd.DataFrame(matrix, index=alternatives, columns=criteria)
+        if engine is None and sparse.issparse(matrix):
+            engine = "sparse"
+        engine = _get_engine(engine)
 
-        if dtypes is not None and len(dtypes) != c_number:
-            raise ValueError(f"'dtypes' must have {c_number} elements")
-        elif dtypes is not None:
-            dtypes = {c: dt for c, dt in zip(criteria, dtypes)}
-            data_df = data_df.astype(dtypes)
+        if engine == "sparse":
+            matrix = _as_sparse(matrix, copy=copy)
+            dtype = (
+                matrix.dtype if dtypes is None else np.result_type(*dtypes)
+            )
+            matrix = matrix.astype(options.storage_dtype(dtype), copy=False)
+            return cls._from_parts(
+                matrix=matrix,
+                alternatives=alternatives,
+                criteria=criteria,
+                objectives=objectives,
+                weights=weights,
+            )
+
+        if sparse.issparse(matrix):
+            matrix = matrix.toarray()
+
+        if engine == "numpy":
+            dtype = None if dtypes is None else np.result_type(*dtypes)
+            matrix = np.array(matrix, dtype=dtype, copy=copy)
+            matrix = matrix.astype(
+                options.storage_dtype(matrix.dtype), copy=False
+            )
+            return cls._from_parts(
+                matrix=matrix,
+                alternatives=alternatives,
+                criteria=criteria,
+                objectives=objectives,
+                weights=weights,
+            )
+
+        if not copy and isinstance(matrix, np.ndarray):
+            # a read-only view protect the buffer owned by the caller
+            matrix = matrix.view()
+            matrix.flags.writeable = False
+
+        data_df = pd.DataFrame(
+            matrix, index=alternatives, columns=criteria, copy=False
+        )
+
+        if dtypes is None and options.get_option("precision") == "float32":
+            dtypes = data_df.dtypes
+
+        if dtypes is not None:
+            # only the criteria with a different dtype are converted
+            dtypes = {
+                c: options.storage_dtype(dt)
+                for c, dt, cdt in zip(criteria, dtypes, data_df.dtypes)
+                if cdt != options.storage_dtype(dt)
+            }
+            if dtypes:
+                data_df = data_df.astype(dtypes)
+                copy = False  # astype already creates a new dataframe
+
+        return cls(
+            data_df=data_df,
+            objectives=objectives,
+            weights=weights,
+            copy=copy,
+            engine="pandas",
+        )
+
+    @classmethod
+    def from_memmap(
+        cls,
+        path,
+        objectives,
+        weights=None,
+        alternatives=None,
+        criteria=None,
+        mmap_mode="r",
+    ):
+        """Create a DecisionMatrix backed by a memory mapped ``.npy`` file.
+
+        The alternatives matrix is not loaded in memory, instead the decision
+        matrix (with the numpy engine) wraps a :py:class:`numpy.memmap`, and
+        the pages of the file are read by the operating system only when
+        they are accessed.
+
+        Parameters
+        ----------
+        path: str or path-like
+            Path to the ``.npy`` file with the alternatives matrix (for
+            example created with ``DecisionMatrix.to_memmap()`` or
+            :py:func:`numpy.save`).
+        objectives, weights, alternatives, criteria:
+            Same parameters as ``DecisionMatrix.from_mcda_data()``.
+        mmap_mode: str (default ``"r"``)
+            Mode to open the file (see :py:func:`numpy.load`). ``"r"`` opens
+            the file as read-only.
+
+        Returns
+        -------
+        :py:class:`DecisionMatrix`
+            A new decision matrix.
+
+        """
+        matrix = np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+        return cls.from_mcda_data(
+            matrix=matrix,
+            objectives=objectives,
+            weights=weights,
+            alternatives=alternatives,
+            criteria=criteria,
+            copy=False,
+            engine="numpy",
+        )
 
-        return cls(data_df=data_df, objectives=objectives, weights=weights)
+    @classmethod
+    def load(cls, path, mmap_mode=None, engine=None):
+        """Load a decision matrix saved with ``DecisionMatrix.save()``.
+
+        Parameters
+        ----------
+        path: str or path-like
+            Path of the file to read.
+        mmap_mode: None or str (default ``None``)
+            If is not ``None``, the arrays are memory mapped from the file
+            with the given mode (see :py:class:`numpy.memmap`) instead of
+            being read in memory.
+        engine: str or None (default ``None``)
+            Storage engine of the decision matrix. If is ``None`` the engine
+            of the saved decision matrix is used.
+
+        Returns
+        -------
+        :py:class:`DecisionMatrix`
+            The loaded decision matrix.
+
+        """
+        header, arrays = archive.load_arrays(path, mmap_mode=mmap_mode)
+        _check_format_header(header, cls)
+
+        engine = header["engine"] if engine is None else engine
+        dtypes = header["dtypes"] if _get_engine(engine) == "pandas" else None
+
+        return cls.from_mcda_data(
+            matrix=arrays["matrix"],
+            objectives=arrays["objectives"],
+            weights=arrays["weights"],
+            alternatives=arrays["alternatives"],
+            criteria=arrays["criteria"],
+            dtypes=dtypes,
+            copy=False,
+            engine=engine,
+        )
 
     # MCDA ====================================================================
     #     This properties are usefull to access interactively to the
@@ -330,20 +800,19 @@ class DecisionMatrix:
     @property
     def alternatives(self):
         """Names of the alternatives."""
-        return self._data_df.index.to_numpy()
+        return self._alternatives
 
     @property
     def criteria(self):
         """Names of the criteria."""
-        return self._data_df.columns.to_numpy()
+        return self._criteria
 
     @property
     def weights(self):
         """Weights of the criteria."""
         return pd.Series(
             self._weights,
-            dtype=float,
-            index=self._data_df.columns,
+            index=self._criteria,
             name="Weights",
         )
 
@@ -351,8 +820,8 @@ class DecisionMatrix:
     def objectives(self):
         """Objectives of the criteria as ``Objective`` instances."""
         return pd.Series(
-            [Objective.construct_from_alias(a) for a in self._objectives],
-            index=self._data_df.columns,
+            [Objective(o) for o in self._objectives],
+            index=self._criteria,
             name="Objectives",
         )
 
@@ -367,9 +836,9 @@ class DecisionMatrix:
 
         """
         return pd.Series(
-            [o.value for o in self.objectives],
+            self._objectives,
             dtype=np.int8,
-            index=self._data_df.columns,
+            index=self._criteria,
         )
 
     @property
@@ -384,29 +853,266 @@ class DecisionMatrix:
         """
         return self._data_df.copy()
 
+    @property
+    def matrix_view(self):
+        """Alternatives matrix as a read-only :py:class:`numpy.ndarray`.
+
+        Unlike ``DecisionMatrix.matrix`` no copy is made when all the
+        criteria share the same dtype; the returned array is a view over the
+        internal data with the ``writeable`` flag disabled.
+
+        With the sparse engine a new dense matrix is created every time (see
+        ``DecisionMatrix.sparse_view``).
+
+        """
+        if self._engine == "numpy":
+            return self._matrix
+        view = self._data_df.to_numpy().view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def sparse_view(self):
+        """Alternatives matrix as a read-only :py:mod:`scipy.sparse` matrix.
+
+        With the sparse engine the internal CSR (or CSC) matrix is returned
+        without copies. With the other engines a new CSR matrix is created.
+
+        """
+        if self._engine == "sparse":
+            return self._matrix
+        return _as_sparse(self.matrix_view)
+
+    def _iter_columns(self):
+        """Iterate over the values of every criteria without copies."""
+        if self._engine == "numpy":
+            yield from self._matrix.T
+        elif self._engine == "sparse":
+            # only one criteria is densified at a time
+            columns = self._matrix.tocsc()
+            for idx in range(len(self._criteria)):
+                yield columns[:, idx].toarray().ravel()
+        else:
+            for idx in range(len(self._criteria)):
+                yield self._df.iloc[:, idx].to_numpy()
+
     @property
     def dtypes(self):
         """Dtypes of the criteria."""
-        return self._data_df.dtypes.copy()
+        if self._engine != "pandas":
+            return pd.Series(
+                [self._matrix.dtype] * len(self._criteria),
+                index=self._criteria,
+                dtype=object,
+            )
+        return self._df.dtypes.copy()
+
+    @property
+    def engine(self):
+        """Storage engine (``pandas``, ``numpy`` or ``sparse``)."""
+        return self._engine
 
     @property
     def plot(self):
         """Plot accessor."""
         return DecisionMatrixPlotter(self)
 
+    @property
+    def stats(self):
+        """Lazy cache of statistics of every criteria.
+
+        See :py:class:`skcriteria.core.stats.CriteriaStats`.
+
+        """
+        if self._stats is None:
+            # the statistics of a sparse matrix are computed without
+            # densifying it
+            self._stats = CriteriaStats(
+                self._matrix if self._engine == "sparse" else self.matrix_view
+            )
+        return self._stats
+
+    @property
+    def valid_mask(self):
+        """Read-only boolean array with ``False`` in the missing values.
+
+        The missing values are stored as NaN in the alternatives matrix
+        (a :py:class:`numpy.ma.MaskedArray` provided to ``from_mcda_data()``
+        is stored in this way). Internally the mask is stored packed as bits
+        (see :py:func:`numpy.packbits`), and is computed the first time is
+        requested.
+
+        """
+        bits = self._get_valid_bits()
+        mask = np.unpackbits(bits, axis=1, count=len(self._criteria))
+        mask = mask.view(bool)
+        mask.flags.writeable = False
+        return mask
+
+    @property
+    def has_missing(self):
+        """True if some value of the alternatives matrix is missing."""
+        bits = self._get_valid_bits()
+        full = np.packbits(np.ones(len(self._criteria), dtype=bool))
+        return not np.all(bits == full)
+
+    def _get_valid_bits(self):
+        if self._valid_bits is None:
+            self._valid_bits = _pack_valid(self.matrix_view)
+        return self._valid_bits
+
+    @property
+    def iloc(self):
+        """Select alternatives and criteria by position.
+
+        See :py:class:`skcriteria.core.indexing.DecisionMatrixILocIndexer`.
+
+        """
+        return DecisionMatrixILocIndexer(self)
+
+    @property
+    def loc(self):
+        """Select alternatives and criteria by name.
+
+        See :py:class:`skcriteria.core.indexing.DecisionMatrixLocIndexer`.
+
+        """
+        return DecisionMatrixLocIndexer(self)
+
+    def _sparse_df(self, rows=slice(None)):
+        """Dense dataframe with some rows of the sparse matrix."""
+        matrix = self._matrix[rows].toarray()
+        matrix.flags.writeable = False
+        return pd.DataFrame(
+            matrix,
+            index=self._alternatives[rows],
+            columns=self._criteria,
+            copy=False,
+        )
+
+    @property
+    def _data_df(self):
+        """Alternatives matrix as dataframe (created lazily if is needed).
+
+        With the sparse engine the dense dataframe is created every time and
+        never kept, so the decision matrix doesn't hold a dense copy.
+
+        """
+        if self._engine == "sparse":
+            return self._sparse_df()
+        if self._df is None:
+            self._df = pd.DataFrame(
+                self._matrix,
+                index=self._alternatives,
+                columns=self._criteria,
+                copy=False,
+            )
+        return self._df
+
     # UTILITIES ===============================================================
 
     def copy(self, **kwargs):
-        """Return a deep copy of the current DecisionMatrix.
+        """Return a copy of the current DecisionMatrix.
 
         This method is also useful for manually modifying the values of the
         DecisionMatrix object.
 
+        The internal arrays of a decision matrix are read-only, so the copy
+        shares the parts that are not replaced (the alternatives matrix,
+        the names, the objectives and the weights) with this decision matrix
+        and only the new values are allocated. The matrix is only rebuilt
+        with ``from_mcda_data()`` if ``matrix``, ``dtypes``, ``copy`` or a
+        different ``engine`` is provided.
+
         Parameters
         ----------
         kwargs :
             The same parameters supported by ``from_mcda_data()``. The values
-            provided replace the existing ones in the obSject to be copied.
+            provided replace the existing ones in the object to be copied.
+
+        Returns
+        -------
+        :py:class:`DecisionMatrix`
+            A new decision matrix.
+
+        """
+        if kwargs.get("engine", self._engine) != self._engine or not (
+            _SHARED_COPY_PARAMS.issuperset(kwargs)
+        ):
+            dmdict = self.to_dict()
+            dmdict.update(engine=self._engine)
+            dmdict.update(kwargs)
+            return self.from_mcda_data(**dmdict)
+
+        a_number, c_number = self.shape
+        alternatives = kwargs.get("alternatives")
+        if alternatives is not None:
+            alternatives = np.asarray(alternatives)
+            if len(alternatives) != a_number:
+                raise ValueError(
+                    f"'alternatives' must have {a_number} elements"
+                )
+
+        criteria = kwargs.get("criteria")
+        if criteria is not None:
+            criteria = np.asarray(criteria)
+            if len(criteria) != c_number:
+                raise ValueError(f"'criteria' must have {c_number} elements")
+
+        parts = {
+            "objectives": kwargs.get("objectives", self._objectives),
+            "weights": kwargs.get("weights", self._weights),
+        }
+        if parts["weights"] is None:
+            parts["weights"] = np.ones(c_number)
+
+        if self._engine != "pandas":
+            parts.update(
+                matrix=self._matrix,
+                alternatives=(
+                    self._alternatives
+                    if alternatives is None
+                    else alternatives
+                ),
+                criteria=self._criteria if criteria is None else criteria,
+            )
+        elif alternatives is None and criteria is None:
+            parts.update(data_df=self._df)
+        else:
+            # a shallow copy of the dataframe shares the values
+            data_df = self._df.copy(deep=False)
+            if alternatives is not None:
+                data_df.index = alternatives
+            if criteria is not None:
+                data_df.columns = criteria
+            parts.update(data_df=data_df)
+
+        dm = self._from_parts(**parts)
+
+        # the statistics and the mask only depend on the (shared) matrix
+        dm._stats = self._stats
+        dm._valid_bits = self._valid_bits
+        return dm
+
+    def append_alternatives(self, matrix, alternatives=None):
+        """Return a new decision matrix with more alternatives.
+
+        The criteria, objectives and weights are shared with this decision
+        matrix. With the numpy engine the alternatives are stored in a
+        growable buffer, so appending ``k`` alternatives costs amortized
+        ``O(k)`` and, while the new rows are appended to the last matrix
+        derived from the buffer, the matrix is never rebuilt. With the pandas
+        engine the dataframe is concatenated.
+
+        Parameters
+        ----------
+        matrix: Iterable
+            The values of the new alternatives, a 2D array-like with one row
+            by alternative (a 1D array-like is a single alternative).
+        alternatives: Iterable o None (default ``None``)
+            Names of the new alternatives. If is ``None`` the alternatives
+            are named "A[n]" where n is the number of the row in the new
+            decision matrix.
 
         Returns
         -------
@@ -414,10 +1120,210 @@ class DecisionMatrix:
             A new decision matrix.
 
         """
-        dmdict = self.to_dict()
-        dmdict.update(kwargs)
+        matrix = np.asarray(matrix)
+        if matrix.ndim == 1:
+            matrix = matrix[np.newaxis]
+        matrix = matrix.astype(options.storage_dtype(matrix.dtype), copy=False)
 
-        return self.from_mcda_data(**dmdict)
+        length, criteria_number = self.shape
+        a_number, c_number = np.shape(matrix)
+        if c_number != criteria_number:
+            raise ValueError(f"'matrix' must have {criteria_number} columns")
+
+        alternatives = np.asarray(
+            [f"A{idx}" for idx in range(length, length + a_number)]
+            if alternatives is None
+            else alternatives
+        )
+        if len(alternatives) != a_number:
+            raise ValueError(f"'alternatives' must have {a_number} elements")
+
+        if self._engine == "numpy":
+            mbuffer, abuffer = self._row_buffers or (None, None)
+            mbuffer = _extend_rows(mbuffer, self._matrix, matrix)
+            abuffer = _extend_rows(abuffer, self._alternatives, alternatives)
+
+            new_length = length + a_number
+            dm = self._from_parts(
+                matrix=mbuffer.view(new_length),
+                alternatives=abuffer.view(new_length),
+                criteria=self._criteria,
+                objectives=self._objectives,
+                weights=self._weights,
+            )
+            dm._row_buffers = (mbuffer, abuffer)
+        elif self._engine == "sparse":
+            dm = self._from_parts(
+                matrix=sparse.vstack(
+                    [self._matrix, sparse.csr_matrix(matrix)],
+                    format=self._matrix.format,
+                ),
+                alternatives=np.concatenate(
+                    [self._alternatives, alternatives]
+                ),
+                criteria=self._criteria,
+                objectives=self._objectives,
+                weights=self._weights,
+            )
+        else:
+            new_df = pd.DataFrame(
+                matrix, index=alternatives, columns=self._criteria
+            )
+            dm = self._from_parts(
+                data_df=pd.concat([self._df, new_df]),
+                objectives=self._objectives,
+                weights=self._weights,
+            )
+
+        _notify_alternatives_hooks(self, dm, "append", matrix)
+        return dm
+
+    def drop_alternatives(self, alternatives):
+        """Return a new decision matrix without some alternatives.
+
+        The criteria, objectives and weights are shared with this decision
+        matrix. With the numpy engine, if only the last alternatives are
+        dropped the new decision matrix is a view of this one (no copy is
+        made), otherwise the remaining alternatives are copied.
+
+        Parameters
+        ----------
+        alternatives: Iterable
+            Names of the alternatives to drop.
+
+        Returns
+        -------
+        :py:class:`DecisionMatrix`
+            A new decision matrix.
+
+        Raises
+        ------
+        KeyError:
+            If some alternative is not in the decision matrix.
+
+        """
+        alternatives = list(alternatives)
+        missing = set(alternatives).difference(self._alternatives)
+        if missing:
+            raise KeyError(f"Unknown alternatives {sorted(map(str, missing))}")
+
+        dropped = np.isin(self._alternatives, alternatives)
+        keep = ~dropped
+
+        if self._engine == "numpy":
+            length = int(np.sum(keep))
+            only_last = bool(np.all(keep[:length]))
+            matrix, alts = (
+                (self._matrix[:length], self._alternatives[:length])
+                if only_last
+                else (self._matrix[keep], self._alternatives[keep])
+            )
+            dm = self._from_parts(
+                matrix=matrix,
+                alternatives=alts,
+                criteria=self._criteria,
+                objectives=self._objectives,
+                weights=self._weights,
+            )
+            if only_last:
+                dm._row_buffers = self._row_buffers
+        elif self._engine == "sparse":
+            dm = self._from_parts(
+                matrix=self._matrix[keep],
+                alternatives=self._alternatives[keep],
+                criteria=self._criteria,
+                objectives=self._objectives,
+                weights=self._weights,
+            )
+        else:
+            dm = self._from_parts(
+                data_df=self._df[keep],
+                objectives=self._objectives,
+                weights=self._weights,
+            )
+
+        _notify_alternatives_hooks(self, dm, "drop", dropped)
+        return dm
+
+    def to_memmap(self, path, chunk_size=None):
+        """Write the alternatives matrix into a ``.npy`` file.
+
+        The matrix is written by blocks of alternatives, so no extra copy
+        of the whole matrix is created.
+
+        Parameters
+        ----------
+        path: str or path-like
+            Path of the ``.npy`` file to write.
+        chunk_size: int or None (default ``None``)
+            Maximum number of elements written at the same time
+            (see ``skcriteria.utils.chunks.row_chunks()``).
+
+        Returns
+        -------
+        :py:class:`DecisionMatrix`
+            A new decision matrix with the same data as this one but backed
+            by the written file (see ``DecisionMatrix.from_memmap()``).
+
+        """
+        matrix = self.matrix_view
+        mmap = np.lib.format.open_memmap(
+            path, mode="w+", dtype=matrix.dtype, shape=matrix.shape
+        )
+        for rows in chunks.row_chunks(matrix, chunk_size):
+            mmap[rows] = matrix[rows]
+        mmap.flush()
+        del mmap
+
+        return self.from_memmap(
+            path,
+            objectives=self._objectives,
+            weights=self._weights,
+            alternatives=self._alternatives,
+            criteria=self._criteria,
+        )
+
+    def share(self):
+        """Copy the decision matrix into a shared memory block.
+
+        The returned handle is cheap to pickle and can be sent to other
+        processes, where ``handle.attach()`` rebuilds a read-only decision
+        matrix over the same memory without copies.
+
+        Returns
+        -------
+        :py:class:`skcriteria.core.shared.SharedDecisionMatrix`
+            The handle of the block. Use it as a context manager (or call
+            ``close()``) to release the memory.
+
+        """
+        return SharedDecisionMatrix(self)
+
+    def save(self, path):
+        """Save the decision matrix in a binary file.
+
+        The file (conventionally with the extension ``.skcdm``) is an
+        uncompressed zip file with the raw arrays in ``.npy`` format and a
+        small JSON header. The arrays can be memory mapped when the file is
+        loaded with ``DecisionMatrix.load()``.
+
+        Parameters
+        ----------
+        path: str or path-like or file-like
+            Where to write the decision matrix.
+
+        """
+        header = _make_format_header(
+            self, engine=self._engine, dtypes=[str(dt) for dt in self.dtypes]
+        )
+        arrays = {
+            "matrix": self.matrix_view,
+            "objectives": self._objectives,
+            "weights": self._weights,
+            "alternatives": _labels_to_array(self._alternatives),
+            "criteria": _labels_to_array(self._criteria),
+        }
+        archive.save_arrays(path, header, arrays)
 
     def to_dataframe(self):
         """Convert the entire DecisionMatrix into a dataframe.
@@ -455,15 +1361,39 @@ class DecisionMatrix:
         df = pd.DataFrame(data, index=index, columns=self.criteria, copy=True)
         return df
 
-    def to_dict(self):
+    def to_dict(self, copy=True, sparse=False):
         """Return a dict representation of the data.
 
         All the values are represented as numpy array.
+
+        Parameters
+        ----------
+        copy: bool (default ``True``)
+            If ``False`` the matrix, objectives and weights are returned as
+            read-only views of the internal data instead of copies.
+        sparse: bool (default ``False``)
+            If ``True`` and the decision matrix uses the sparse engine, the
+            matrix is returned as a :py:mod:`scipy.sparse` matrix instead of
+            a dense array.
+
         """
+        if sparse and self._engine == "sparse":
+            matrix = self._matrix.copy() if copy else self._matrix
+            objectives = self._objectives.copy() if copy else self._objectives
+            weights = self._weights.copy() if copy else self._weights
+        elif copy:
+            matrix = self.matrix.to_numpy()
+            objectives = self._objectives.copy()
+            weights = self._weights.copy()
+        else:
+            matrix = self.matrix_view
+            objectives = self._objectives
+            weights = self._weights
+
         return {
-            "matrix": self.matrix.to_numpy(),
-            "objectives": self.iobjectives.to_numpy(),
-            "weights": self.weights.to_numpy(),
+            "matrix": matrix,
+            "objectives": objectives,
+            "weights": weights,
             "dtypes": self.dtypes.to_numpy(),
             "alternatives": self.alternatives,
             "criteria": self.criteria,
@@ -497,7 +1427,7 @@ class DecisionMatrix:
         dm.shape <==> np.shape(dm)
 
         """
-        return np.shape(self._data_df)
+        return len(self._alternatives), len(self._criteria)
 
     def __len__(self):
         """Return the number ot alternatives.
@@ -505,7 +1435,38 @@ class DecisionMatrix:
         dm.__len__() <==> len(dm).
 
         """
-        return len(self._data_df)
+        return len(self._alternatives)
+
+    def fingerprint(self):
+        """Return a stable hash of the content of the decision matrix.
+
+        The hash (BLAKE2b) is computed over the names of the criteria and
+        the alternatives, the objectives, the weights and the raw values of
+        every criteria (including their dtypes), and is memoized in the
+        instance, so only the first call reads the data. The result doesn't
+        depend on the storage engine nor the memory layout of the matrix.
+
+        Two decision matrices with the same fingerprint hold the same data.
+        Values with different binary representations (like ``0.0`` and
+        ``-0.0`` or NaNs with different payloads) produce different
+        fingerprints.
+
+        Returns
+        -------
+        str
+            A 32 characters hexadecimal string.
+
+        """
+        if self._fingerprint is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            _hash_labels(hasher, self._criteria)
+            _hash_labels(hasher, self._alternatives)
+            _hash_values(hasher, self._objectives)
+            _hash_values(hasher, self._weights)
+            for column in self._iter_columns():
+                _hash_values(hasher, column)
+            self._fingerprint = hasher.hexdigest()
+        return self._fingerprint
 
     def equals(self, other):
         """Return True if the decision matrix are equal.
@@ -548,8 +1509,13 @@ class DecisionMatrix:
         - If ``other`` is the same object return ``True``.
         - If ``other`` is not instance of 'DecisionMatrix', has different shape
           'criteria', 'alternatives' or 'objectives' returns ``False``.
+        - If the fingerprints of both decision matrices are already computed
+          and are the same, the data is identical and only the NaNs are
+          checked (see ``DecisionMatrix.fingerprint()``).
         - Next check the 'weights' and the matrix itself using the provided
-          tolerance.
+          tolerance. The internal buffers are compared by blocks of rows
+          without copies, and the comparison stops in the first block with
+          a difference.
 
         Parameters
         ----------
@@ -578,35 +1544,46 @@ class DecisionMatrix:
         :py:func:`numpy.allclose`.
 
         """
-        return (self is other) or (
+        if self is other:
+            return True
+
+        if not (
             isinstance(other, DecisionMatrix)
-            and np.shape(self) == np.shape(other)
-            and np.array_equal(self.criteria, other.criteria)
-            and np.array_equal(self.alternatives, other.alternatives)
-            and np.array_equal(self.objectives, other.objectives)
-            and np.allclose(
-                self.weights,
-                other.weights,
-                rtol=rtol,
-                atol=atol,
-                equal_nan=equal_nan,
-            )
-            and np.allclose(
-                self.matrix,
-                other.matrix,
-                rtol=rtol,
-                atol=atol,
-                equal_nan=equal_nan,
+            and self.shape == other.shape
+            and np.array_equal(self._criteria, other._criteria)
+            and np.array_equal(self._objectives, other._objectives)
+            and np.array_equal(self._alternatives, other._alternatives)
+        ):
+            return False
+
+        # the same fingerprint implies the same bytes (but not the opposite:
+        # 0.0 and -0.0 are equal), and the bytes are equal except for NaNs.
+        if (
+            self._fingerprint is not None
+            and self._fingerprint == other._fingerprint
+        ):
+            return equal_nan or not (
+                _any_nan(self._weights)
+                or any(_any_nan(col) for col in self._iter_columns())
             )
-        )
+
+        kwargs = {"rtol": rtol, "atol": atol, "equal_nan": equal_nan}
+        if not np.allclose(self._weights, other._weights, **kwargs):
+            return False
+
+        if self._engine == other._engine == "numpy":
+            pairs = [(self._matrix, other._matrix)]
+        else:
+            pairs = zip(self._iter_columns(), other._iter_columns())
+        return all(_allclose_by_chunks(a, b, **kwargs) for a, b in pairs)
 
     # repr ====================================================================
     def _get_cow_headers(self):
         """Columns names with COW (Criteria, Objective, Weight)."""
         headers = []
         fmt_weights = pd_fmt.format_array(self.weights, None)
-        for c, o, w in zip(self.criteria, self.objectives, fmt_weights):
-            header = f"{c}[{o.to_string()}{w}]"
+        for c, o, w in zip(self.criteria, self._objectives, fmt_weights):
+            header = f"{c}[{Objective(o).to_string()}{w}]"
             headers.append(header)
         return headers
 
@@ -616,15 +1593,37 @@ class DecisionMatrix:
         dimensions = f"{a_number} Alternatives x {c_number} Criteria"
         return dimensions
 
+    def _get_repr_df(self):
+        """Dataframe with the rows to display."""
+        # only the first and the last rows are displayed when the matrix is
+        # bigger than "display.max_rows", so the rest are never formatted
+        # (nor densified with the sparse engine). The frame keeps more rows
+        # than the limit so pandas still renders the "..." row.
+        rows = slice(None)
+        max_rows = pd.get_option("display.max_rows")
+        if max_rows and len(self._alternatives) > max_rows:
+            half = max_rows // 2 + 1
+            size = len(self._alternatives)
+            rows = np.r_[:half, size - half:size]
+
+        if self._engine == "sparse":
+            return self._sparse_df(rows)
+        return self._data_df.iloc[rows]
+
     def __repr__(self):
         """dm.__repr__() <==> repr(dm)."""
         header = self._get_cow_headers()
         dimensions = self._get_axc_dimensions()
 
-        kwargs = {"header": header, "show_dimensions": False}
+        kwargs = {
+            "header": header,
+            "show_dimensions": False,
+            "max_rows": pd.get_option("display.max_rows"),
+            "min_rows": pd.get_option("display.min_rows"),
+        }
 
         # retrieve the original string
-        original_string = self._data_df.to_string(**kwargs)
+        original_string = self._get_repr_df().to_string(**kwargs)
 
         # add dimension
         string = f"{original_string}\n[{dimensions}]"
@@ -636,12 +1635,16 @@ class DecisionMatrix:
 
         Mainly for IPython notebook.
         """
-        header = dict(zip(self.criteria, self._get_cow_headers()))
         dimensions = self._get_axc_dimensions()
 
+        # the COW headers are set as the columns of a shallow copy, so
+        # pandas renders them directly
+        df = self._get_repr_df().copy(deep=False)
+        df.columns = self._get_cow_headers()
+
         # retrieve the original string
         with pd.option_context("display.show_dimensions", False):
-            original_html = self._data_df._repr_html_()
+            original_html = df._repr_html_()
 
         # add dimension
         html = (
@@ -651,14 +1654,46 @@ class DecisionMatrix:
             "</div>"
         )
 
-        # now we need to change the table header
-        d = pq.PyQuery(html)
-        for th in d("div.decisionmatrix table.dataframe > thead > tr > th"):
-            crit = th.text
-            if crit:
-                th.text = header[crit]
+        return html
+
+
+# =============================================================================
+# BINARY FORMAT
+# =============================================================================
+
+
+def _make_format_header(obj, **kwargs):
+    """Create the header of the binary format of an object."""
+    header = {"format": type(obj).__name__, "version": FORMAT_VERSION}
+    header.update(kwargs)
+    return header
+
+
+def _check_format_header(header, cls):
+    """Validate that the header was created for a given class."""
+    fmt, version = header.get("format"), header.get("version")
+    if fmt != cls.__name__:
+        raise ValueError(f"The file contains a '{fmt}', not a {cls.__name__}")
+    if not isinstance(version, int) or version > FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version {version}")
+
+
+def _labels_to_array(labels):
+    """Convert the labels to an array without python objects."""
+    arr = np.asarray(labels)
+    if arr.dtype.hasobject:
+        arr = np.asarray(arr.tolist())
+    return arr
+
+
+# =============================================================================
+# PICKLE
+# =============================================================================
+
 
-        return str(d)
+def _unpickle_decision_matrix(cls, parts):
+    """Rebuild a decision matrix reduced by ``__reduce_ex__``."""
+    return cls._from_parts(**parts)
 
 
 # =============================================================================
@@ -699,6 +1734,7 @@ class ResultABC(metaclass=abc.ABCMeta):
     """
 
     _skcriteria_result_column = None
+    _skcriteria_result_dtype = None
 
     def __init_subclass__(cls):
         """Validate if the subclass are well formed."""
@@ -714,6 +1750,7 @@ class ResultABC(metaclass=abc.ABCMeta):
             values,
             index=alternatives,
             columns=[self._skcriteria_result_column],
+            dtype=self._skcriteria_result_dtype,
         )
 
     @abc.abstractmethod
@@ -721,6 +1758,10 @@ class ResultABC(metaclass=abc.ABCMeta):
         """Validate that the values are the expected by the result type."""
         raise NotImplementedError()
 
+    def _result_options(self):
+        """Extra parameters of the result type used to pickle and save it."""
+        return {}
+
     @property
     def values(self):
         """Values assigned to each alternative by the method.
@@ -753,6 +1794,100 @@ class ResultABC(metaclass=abc.ABCMeta):
 
     e_ = extra_
 
+    def __reduce_ex__(self, protocol):
+        """Reduce the result to its arrays for pickle.
+
+        With the pickle protocol 5 the values and the array extras are sent
+        as out-of-band buffers (see :py:class:`pickle.PickleBuffer`).
+
+        """
+        args = (
+            self._method,
+            self.alternatives,
+            self.values,
+            dict(self._extra),
+        )
+        options = self._result_options()
+        if options:
+            return (functools.partial(type(self), **options), args)
+        return (type(self), args)
+
+    # IO ======================================================================
+
+    def save(self, path):
+        """Save the result in a binary file.
+
+        The file is an uncompressed zip file with the raw arrays in ``.npy``
+        format and a small JSON header (the same format used by
+        ``DecisionMatrix.save()``).
+
+        Only the extra values that are scalars (``None``, ``bool``, ``int``,
+        ``float`` or ``str``) or can be converted to arrays without python
+        objects are supported.
+
+        Parameters
+        ----------
+        path: str or path-like or file-like
+            Where to write the result.
+
+        """
+        arrays = {
+            "values": self.values,
+            "alternatives": _labels_to_array(self.alternatives),
+        }
+        scalars = {}
+        for key, value in self._extra.items():
+            if value is None or isinstance(value, (bool, int, float, str)):
+                scalars[key] = value
+                continue
+            arr = np.asarray(value)
+            if arr.dtype.hasobject:
+                raise ValueError(f"The extra value '{key}' can't be saved")
+            arrays[f"extra.{key}"] = arr
+
+        header = _make_format_header(
+            self,
+            method=self.method,
+            extra=scalars,
+            options=self._result_options(),
+        )
+        archive.save_arrays(path, header, arrays)
+
+    @classmethod
+    def load(cls, path, mmap_mode=None):
+        """Load a result saved with ``save()``.
+
+        Parameters
+        ----------
+        path: str or path-like
+            Path of the file to read.
+        mmap_mode: None or str (default ``None``)
+            If is not ``None``, the arrays are memory mapped from the file
+            with the given mode (see :py:class:`numpy.memmap`) instead of
+            being read in memory.
+
+        Returns
+        -------
+        The loaded result.
+
+        """
+        header, arrays = archive.load_arrays(path, mmap_mode=mmap_mode)
+        _check_format_header(header, cls)
+
+        extra = dict(header["extra"])
+        for name, arr in arrays.items():
+            if name.startswith("extra."):
+                _, key = name.split(".", 1)
+                extra[key] = arr
+
+        return cls(
+            method=header["method"],
+            alternatives=arrays["alternatives"],
+            values=arrays["values"],
+            extra=extra,
+            **header.get("options", {}),
+        )
+
     # CMP =====================================================================
 
     @property
@@ -806,9 +1941,46 @@ class RankResult(ResultABC):
     This type of results is used by methods that generate a ranking of
     alternatives.
 
+    Parameters
+    ----------
+    top_k: int or None (default ``None``)
+        If is not ``None``, the result only holds the ``top_k`` first ranked
+        alternatives. If more alternatives are given, the best ones are
+        selected without sorting the rest.
+    alternatives_extra: iterable (default ``()``)
+        The extra values with an element by alternative (see
+        ``skcriteria.utils.rank.take_alternatives()``). Only the elements of
+        the ``top_k`` selected alternatives are kept, so they line up with
+        the ``alternatives``.
+
     """
 
     _skcriteria_result_column = "Rank"
+    _skcriteria_result_dtype = np.int32
+
+    def __init__(
+        self,
+        method,
+        alternatives,
+        values,
+        extra,
+        top_k=None,
+        alternatives_extra=(),
+    ):
+        if top_k is not None:
+            if top_k < 1:
+                raise ValueError("'top_k' must be greater than 0")
+            values = np.asarray(values)
+            if len(values) > top_k:
+                self._validate_result(values)
+                selected = rank.top_k_values(values, top_k)
+                alternatives = np.asarray(alternatives)[selected]
+                values = values[selected]
+                extra = rank.take_alternatives(
+                    extra, selected, alternatives_extra
+                )
+        self._top_k = top_k
+        super().__init__(method, alternatives, values, extra)
 
     @doc_inherit(ResultABC._validate_result)
     def _validate_result(self, values):
@@ -817,11 +1989,24 @@ class RankResult(ResultABC):
         if not np.array_equal(np.sort(values), expected):
             raise ValueError(f"The data {values} doesn't look like a ranking")
 
+    @doc_inherit(ResultABC._result_options)
+    def _result_options(self):
+        return {} if self._top_k is None else {"top_k": self._top_k}
+
     @property
     def rank_(self):
         """Alias for ``values``."""
         return self.values
 
+    @property
+    def top_k(self):
+        """How many first ranked alternatives the result holds.
+
+        ``None`` if the result holds the ranking of all the alternatives.
+
+        """
+        return self._top_k
+
     def _repr_html_(self):
         """Return a html representation for a particular result.
 
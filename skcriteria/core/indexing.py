@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Accessors to select alternatives and criteria of a DecisionMatrix."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import operator
+
+import numpy as np
+
+import pandas as pd
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _split_key(key):
+    if not isinstance(key, tuple):
+        return key, slice(None)
+    if len(key) != 2:
+        raise IndexError(
+            "A decision matrix only has two dimensions "
+            "(alternatives and criteria)"
+        )
+    return key
+
+
+def _as_slice(positions):
+    # positions with a constant (and positive) step are converted to a
+    # slice, so the selection is a view instead of a copy.
+    if len(positions) == 1:
+        return slice(positions[0], positions[0] + 1)
+    steps = np.diff(positions)
+    if len(steps) and steps[0] > 0 and np.all(steps == steps[0]):
+        return slice(positions[0], positions[-1] + 1, steps[0])
+    return positions
+
+
+def _to_positions(key, size):
+    if isinstance(key, slice):
+        return key
+
+    if np.ndim(key) == 0:
+        position = operator.index(key)
+        if not -size <= position < size:
+            raise IndexError(
+                f"Index {position} is out of bounds for axis with size {size}"
+            )
+        # a single position is converted to a slice, so the result keeps
+        # the two dimensions.
+        position %= size
+        return slice(position, position + 1)
+
+    key = np.asarray(key)
+    if key.dtype == bool:
+        if key.shape != (size,):
+            raise IndexError(
+                f"Boolean index has {len(key)} elements, expected {size}"
+            )
+        key = np.flatnonzero(key)
+    elif key.size == 0:
+        key = key.astype(int)
+    elif key.dtype.kind not in "iu":
+        raise IndexError(
+            "Only integers, slices and integer or boolean arrays are "
+            "valid indices"
+        )
+
+    positions = np.where(key < 0, key + size, key)
+    if np.any((positions < 0) | (positions >= size)):
+        raise IndexError(f"Index out of bounds for axis with size {size}")
+    return _as_slice(positions)
+
+
+def _labels_to_positions(key, labels):
+    index = pd.Index(labels)
+
+    if isinstance(key, slice):
+        # like pandas, the label based slices include both endpoints
+        start = 0 if key.start is None else index.get_loc(key.start)
+        stop = (
+            len(index) if key.stop is None else index.get_loc(key.stop) + 1
+        )
+        return slice(start, stop, key.step)
+
+    if np.ndim(key) == 0:
+        return index.get_loc(key)
+
+    key = np.asarray(key)
+    if key.dtype == bool:
+        return key
+
+    positions = index.get_indexer(key)
+    missing = positions < 0
+    if np.any(missing):
+        raise KeyError(f"{key[missing].tolist()} not found")
+    return positions
+
+
+def _take(dm, rows, columns):
+    parts = {
+        "objectives": dm._objectives[columns],
+        "weights": dm._weights[columns],
+    }
+    if dm.engine != "pandas":
+        parts.update(
+            matrix=dm._matrix[rows][:, columns],
+            alternatives=dm._alternatives[rows],
+            criteria=dm._criteria[columns],
+        )
+    else:
+        parts.update(data_df=dm._df.iloc[rows, columns])
+    return type(dm)._from_parts(**parts)
+
+
+# =============================================================================
+# INDEXERS
+# =============================================================================
+
+
+class DecisionMatrixILocIndexer:
+    """Select alternatives and criteria of a DecisionMatrix by position.
+
+    ``dm.iloc[alternatives]`` and ``dm.iloc[alternatives, criteria]`` accept
+    integers, slices and arrays of integers or booleans, and always return a
+    new DecisionMatrix (a single integer selects one alternative or
+    criteria). The selected criteria carry their objectives and weights.
+
+    Slices (and arrays of positions with a constant step) return views that
+    share the memory of the original decision matrix; other selections
+    copy the data.
+
+    """
+
+    def __init__(self, dm):
+        self._dm = dm
+
+    def __getitem__(self, key):
+        """dm.iloc.__getitem__(key) <==> dm.iloc[key]."""
+        a_number, c_number = self._dm.shape
+        rows, columns = _split_key(key)
+        return _take(
+            self._dm,
+            _to_positions(rows, a_number),
+            _to_positions(columns, c_number),
+        )
+
+
+class DecisionMatrixLocIndexer:
+    """Select alternatives and criteria of a DecisionMatrix by name.
+
+    ``dm.loc[alternatives]`` and ``dm.loc[alternatives, criteria]`` accept
+    names, lists of names, boolean arrays and slices of names (which,
+    like in pandas, include both endpoints). The result is the same as the
+    equivalent selection with ``dm.iloc``.
+
+    """
+
+    def __init__(self, dm):
+        self._dm = dm
+
+    def __getitem__(self, key):
+        """dm.loc.__getitem__(key) <==> dm.loc[key]."""
+        rows, columns = _split_key(key)
+        return self._dm.iloc[
+            _labels_to_positions(rows, self._dm._alternatives),
+            _labels_to_positions(columns, self._dm._criteria),
+        ]
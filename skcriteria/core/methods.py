@@ -17,8 +17,14 @@
 import abc
 import inspect
 
-from .data import DecisionMatrix
-from ..utils import doc_inherit
+import numpy as np
+
+from scipy import sparse
+
+from .batch import DecisionMatrixBatch, RankResultBatch
+from .data import DecisionMatrix, RankResult
+from .stats import CriteriaStats
+from ..utils import doc_inherit, rank
 
 
 # =============================================================================
@@ -32,6 +38,100 @@ _IGNORE_PARAMS = (
 )
 
 
+def _accepts(method, pname):
+    # the methods written before the statistics cache (or the output arrays)
+    # existed don't have the "stats" (or "out") parameter, so it is only
+    # sent if it is accepted.
+    for name, param in inspect.signature(method).parameters.items():
+        if name == pname or param.kind == inspect.Parameter.VAR_KEYWORD:
+            return True
+    return False
+
+
+def _method_data(method, dm):
+    # the sparse matrices are only sent to the methods that support them
+    # (the rest receive a dense matrix), and the statistics cache only to
+    # the methods that receive a dense matrix.
+    is_sparse = dm.engine == "sparse" and method._supports_sparse()
+    data = dm.to_dict(copy=False, sparse=is_sparse)
+    data["stats"] = None if is_sparse else dm.stats
+    return data
+
+
+def _array_data(method, data):
+    # the same as _method_data() but with the arrays of a decision matrix
+    # given by the user.
+    data = dict(data)
+    data.setdefault("stats", None)
+    if sparse.issparse(data["matrix"]):
+        data["stats"] = None
+        if not method._supports_sparse():
+            data["matrix"] = data["matrix"].toarray()
+    return data
+
+
+def dm_to_arrays(dm):
+    """Convert a decision matrix into the data of the array-level protocol.
+
+    The arrays are read-only views of the decision matrix (the sparse matrix
+    if the decision matrix uses the sparse engine), and the ``stats`` key
+    has the statistics cache of the matrix.
+
+    Parameters
+    ----------
+    dm: :py:class:`skcriteria.data.DecisionMatrix`
+        The decision matrix.
+
+    Returns
+    -------
+    :py:class:`dict`
+        The data of the decision matrix, as returned by
+        ``DecisionMatrix.to_dict(copy=False)``, with the extra ``stats``
+        key.
+
+    """
+    data = dm.to_dict(copy=False, sparse=True)
+    data["stats"] = None if dm.engine == "sparse" else dm.stats
+    return data
+
+
+def arrays_to_dm(data, engine=None):
+    """Create a decision matrix from the data of the array-level protocol.
+
+    The arrays are wrapped without copies and the statistics cache (if is
+    not ``None``) is reused by the new decision matrix.
+
+    Parameters
+    ----------
+    data: :py:class:`dict`
+        The data returned by ``transform_arrays()``.
+    engine: str or None (default ``None``)
+        The engine of the new decision matrix. The ``"sparse"`` engine is
+        only used if the matrix is sparse (otherwise ``"numpy"`` is used).
+        ``None`` selects the sparse engine for a sparse matrix and the
+        default engine otherwise.
+
+    Returns
+    -------
+    :py:class:`skcriteria.data.DecisionMatrix`
+        The new decision matrix.
+
+    """
+    data = dict(data)
+    stats = data.pop("stats", None)
+
+    # the sparse engine is kept only if the matrix is still sparse
+    if sparse.issparse(data["matrix"]):
+        engine = "sparse"
+    elif engine == "sparse":
+        engine = "numpy"
+
+    dm = DecisionMatrix.from_mcda_data(**data, copy=False, engine=engine)
+    if stats is not None:
+        dm._stats = stats
+    return dm
+
+
 class SKCMethodABC(metaclass=abc.ABCMeta):
     """Base class for all class in scikit-criteria.
 
@@ -41,11 +141,17 @@ class SKCMethodABC(metaclass=abc.ABCMeta):
 
     - ``_skcriteria_dm_type``: The type of the decision maker.
 
+    The methods that can operate over a :py:mod:`scipy.sparse` matrix must
+    set ``_skcriteria_supports_sparse`` to ``True``; the others receive a
+    dense matrix when the decision matrix uses the sparse engine. The
+    methods whose support depends on their parameters redefine
+    ``_supports_sparse()`` instead.
 
     """
 
     _skcriteria_dm_type = None
     _skcriteria_parameters = None
+    _skcriteria_supports_sparse = False
 
     def __init_subclass__(cls):
         """Validate if the subclass are well formed."""
@@ -81,6 +187,10 @@ class SKCMethodABC(metaclass=abc.ABCMeta):
         str_parameters = ", ".join(parameters)
         return f"{cls_name}({str_parameters})"
 
+    def _supports_sparse(self):
+        """Return True if the method can operate over a sparse matrix."""
+        return self._skcriteria_supports_sparse
+
 
 # =============================================================================
 # SKCTransformer MIXIN
@@ -88,9 +198,123 @@ class SKCMethodABC(metaclass=abc.ABCMeta):
 
 
 class SKCTransformerABC(SKCMethodABC):
-    """Mixin class for all transformer in scikit-criteria."""
+    """Mixin class for all transformer in scikit-criteria.
+
+    The transformers can be fitted with a reference decision matrix (see
+    ``fit()``): the parameters of the transformation are learned from it
+    and stored in attributes ending with an underscore, and ``transform()``
+    applies them to any decision matrix instead of computing them again.
+    Without ``fit()`` every decision matrix is transformed with their own
+    parameters.
+
+    The transformers that compute their parameters with the statistics
+    cache declare the names of the statistics that they use in
+    ``_skcriteria_fit_stats``. ``fit()`` learns these statistics from the
+    reference matrix (``stats_`` and one attribute per statistic, like
+    ``mins_`` or ``maxs_``), and ``transform()`` sends them to
+    ``_transform_data`` instead of the statistics of the transformed matrix.
+
+    """
 
     _skcriteria_dm_type = "transformer"
+    _skcriteria_fit_stats = ()
+
+    def _fit_data(self, matrix, stats=None, **kwargs):
+        """Learn the parameters of the transformation.
+
+        The default implementation learns the statistics declared in
+        ``_skcriteria_fit_stats`` (nothing if there are none).
+
+        Parameters
+        ----------
+        matrix: :py:class:`numpy.ndarray` or :py:mod:`scipy.sparse` matrix
+            The reference matrix. The default implementation receives the
+            sparse matrices as is (the statistics are computed without
+            densifying them); the overwritten implementations receive a
+            dense matrix unless the transformer supports sparse matrices.
+        stats: :py:class:`skcriteria.core.stats.CriteriaStats` or None
+            The cached statistics of the reference matrix.
+        kwargs:
+            The rest of the reference decision matrix as separated
+            parameters.
+
+        """
+        if not self._skcriteria_fit_stats:
+            return
+        if stats is None:
+            stats = CriteriaStats(matrix)
+
+        # only the statistics are kept (not the reference matrix)
+        self.stats_ = stats.subset(self._skcriteria_fit_stats)
+        for name in self._skcriteria_fit_stats:
+            setattr(self, f"{name}_", getattr(self.stats_, name))
+
+    def fit_arrays(self, data):
+        """Learn the parameters of the transformation from arrays.
+
+        Parameters
+        ----------
+        data: :py:class:`dict`
+            The data of the reference decision matrix as returned by
+            ``DecisionMatrix.to_dict()``, optionally with the statistics
+            cache of the matrix in the ``stats`` key.
+
+        Returns
+        -------
+        self
+            The fitted transformer.
+
+        """
+        data = dict(data)
+        data.setdefault("stats", None)
+
+        # only the statistics are learned by the default implementation, so
+        # the sparse matrix is densified only for the transformers that fit
+        # other things and don't support sparse matrices (the statistics are
+        # the same for both representations).
+        fits_sparse = (
+            self._supports_sparse()
+            or type(self)._fit_data is SKCTransformerABC._fit_data
+        )
+        if sparse.issparse(data["matrix"]) and not fits_sparse:
+            data["matrix"] = data["matrix"].toarray()
+
+        self._fit_data(**data)
+        return self
+
+    def fit(self, dm):
+        """Learn the parameters of the transformation from `dm`.
+
+        Parameters
+        ----------
+        dm: :py:class:`skcriteria.data.DecisionMatrix`
+            The reference decision matrix.
+
+        Returns
+        -------
+        self
+            The fitted transformer.
+
+        """
+        data = dm.to_dict(copy=False)
+        data["stats"] = dm.stats
+        return self.fit_arrays(data)
+
+    def fit_transform(self, dm):
+        """Learn the parameters of the transformation and transform `dm`.
+
+        Parameters
+        ----------
+        dm: :py:class:`skcriteria.data.DecisionMatrix`
+            The decision matrix to learn from and transform.
+
+        Returns
+        -------
+        :py:class:`skcriteria.data.DecisionMatrix`
+            Transformed decision matrix.
+
+        """
+        return self.fit(dm).transform(dm)
 
     @abc.abstractmethod
     def _transform_data(self, **kwargs):
@@ -110,6 +334,50 @@ class SKCTransformerABC(SKCMethodABC):
         """
         raise NotImplementedError()
 
+    def transform_arrays(self, data):
+        """Perform the transformation over the arrays of a decision matrix.
+
+        This is the array-level protocol of the transformers: no decision
+        matrix is created and nothing is validated, so many transformations
+        can be chained over the raw arrays and only the final output is
+        wrapped (see ``dm_to_arrays()`` and ``arrays_to_dm()``).
+
+        Parameters
+        ----------
+        data: :py:class:`dict`
+            The data of a decision matrix as returned by
+            ``DecisionMatrix.to_dict()``, optionally with the statistics
+            cache of the matrix in the ``stats`` key. The arrays are not
+            modified.
+
+        Returns
+        -------
+        :py:class:`dict`
+            The transformed data, with the same keys. ``stats`` is ``None``
+            if the matrix was transformed.
+
+        """
+        return self._transform_arrays(data)
+
+    def _transform_arrays(self, data, **kwargs):
+        data = _array_data(self, data)
+        stats = data["stats"]
+
+        # a fitted transformer uses the statistics of the reference matrix
+        data["stats"] = getattr(self, "stats_", stats)
+
+        transformed_data = self._transform_data(**data, **kwargs)
+
+        # if the matrix is not transformed (nor overwritten) the statistics
+        # are still valid
+        matrix = transformed_data["matrix"]
+        transformed_data["stats"] = (
+            stats
+            if matrix is data["matrix"] and matrix is not kwargs.get("out")
+            else None
+        )
+        return transformed_data
+
     def transform(self, dm):
         """Perform transformation on `dm`.
 
@@ -124,13 +392,14 @@ class SKCTransformerABC(SKCMethodABC):
             Transformed decision matrix.
 
         """
-        data = dm.to_dict()
-
-        transformed_data = self._transform_data(**data)
-
-        transformed_dm = DecisionMatrix.from_mcda_data(**transformed_data)
+        return self._transform_dm(dm)
 
-        return transformed_dm
+    def _transform_dm(self, dm, **kwargs):
+        # the transformers receive read-only views of the data, so the
+        # new decision matrix can safely wrap the arrays without a copy.
+        data = _method_data(self, dm)
+        transformed_data = self._transform_arrays(data, **kwargs)
+        return arrays_to_dm(transformed_data, engine=dm.engine)
 
 
 class SKCMatrixAndWeightTransformerABC(SKCTransformerABC):
@@ -141,7 +410,14 @@ class SKCMatrixAndWeightTransformerABC(SKCTransformerABC):
     is altered.
 
     This mixin require to redefine ``_transform_weights`` and
-    ``_transform_matrix``, instead of ``_transform_data``.
+    ``_transform_matrix``, instead of ``_transform_data``. The matrix must
+    be transformed along the axis ``-2`` (the alternatives) and the weights
+    along the axis ``-1``, so the same implementation works with a batch of
+    problems (see ``transform_batch()``).
+
+    The transformed matrix can be written into an array given by the caller
+    with the ``out`` parameter of ``transform()`` and ``transform_arrays()``
+    if ``_transform_matrix`` accepts it.
 
     """
 
@@ -171,6 +447,19 @@ class SKCMatrixAndWeightTransformerABC(SKCTransformerABC):
             )
         self._target = target
 
+    def __init_subclass__(cls):
+        """Check if the matrix transformation accepts the statistics."""
+        super().__init_subclass__()
+        cls._skcriteria_matrix_stats = _accepts(cls._transform_matrix, "stats")
+        cls._skcriteria_matrix_out = _accepts(cls._transform_matrix, "out")
+
+    @doc_inherit(SKCMethodABC._supports_sparse)
+    def _supports_sparse(self):
+        # the matrix is not touched if only the weights are transformed
+        return (
+            self._target == self._TARGET_WEIGHTS or super()._supports_sparse()
+        )
+
     @abc.abstractmethod
     def _transform_weights(self, weights):
         """Execute the transform method over the weights.
@@ -189,13 +478,19 @@ class SKCMatrixAndWeightTransformerABC(SKCTransformerABC):
         raise NotImplementedError()
 
     @abc.abstractmethod
-    def _transform_matrix(self, matrix):
+    def _transform_matrix(self, matrix, stats=None, out=None):
         """Execute the transform method over the matrix.
 
         Parameters
         ----------
         matrix: :py:class:`numpy.ndarray`
             The decision matrix to transform
+        stats: :py:class:`skcriteria.core.stats.CriteriaStats` or None
+            The cached statistics of the matrix (``None`` if they are not
+            available).
+        out: :py:class:`numpy.ndarray` or None
+            An array with the shape of the matrix where the transformed
+            matrix must be stored (``None`` to allocate a new one).
 
         Returns
         -------
@@ -206,12 +501,26 @@ class SKCMatrixAndWeightTransformerABC(SKCTransformerABC):
         raise NotImplementedError()
 
     @doc_inherit(SKCTransformerABC._transform_data)
-    def _transform_data(self, matrix, weights, **kwargs):
+    def _transform_data(
+        self, matrix, weights, stats=None, out=None, **kwargs
+    ):
         norm_mtx = matrix
         norm_weights = weights
 
         if self._target in (self._TARGET_MATRIX, self._TARGET_BOTH):
-            norm_mtx = self._transform_matrix(matrix)
+            matrix_kwargs = {}
+            if self._skcriteria_matrix_stats:
+                matrix_kwargs["stats"] = stats
+            if out is not None and self._skcriteria_matrix_out:
+                matrix_kwargs["out"] = out
+
+            norm_mtx = self._transform_matrix(matrix, **matrix_kwargs)
+
+            # the transformers without support for the output array are
+            # copied into it
+            if out is not None and norm_mtx is not out:
+                np.copyto(out, norm_mtx)
+                norm_mtx = out
 
         if self._target in (self._TARGET_WEIGHTS, self._TARGET_BOTH):
             norm_weights = self._transform_weights(weights)
@@ -220,6 +529,76 @@ class SKCMatrixAndWeightTransformerABC(SKCTransformerABC):
 
         return kwargs
 
+    def transform_arrays(self, data, out=None):
+        """Perform the transformation over the arrays of a decision matrix.
+
+        See ``SKCTransformerABC.transform_arrays()``.
+
+        Parameters
+        ----------
+        data: :py:class:`dict`
+            The data of a decision matrix as returned by
+            ``DecisionMatrix.to_dict()``, optionally with the statistics
+            cache of the matrix in the ``stats`` key.
+        out: :py:class:`numpy.ndarray` or None (default ``None``)
+            An array with the shape of the matrix where the transformed
+            matrix is stored. It can be ``data["matrix"]`` itself (if is
+            writeable) to transform the matrix in place. Ignored if the
+            target is only the weights.
+
+        Returns
+        -------
+        :py:class:`dict`
+            The transformed data.
+
+        """
+        return self._transform_arrays(data, out=out)
+
+    def transform(self, dm, out=None):
+        """Perform transformation on `dm`.
+
+        Parameters
+        ----------
+        dm: :py:class:`skcriteria.data.DecisionMatrix`
+            The decision matrix to transform.
+        out: :py:class:`numpy.ndarray` or None (default ``None``)
+            An array with the shape of the matrix where the transformed
+            matrix is stored. The new decision matrix wraps this array
+            without copies, so no extra memory is allocated for the matrix.
+            Ignored if the target is only the weights.
+
+        Returns
+        -------
+        :py:class:`skcriteria.data.DecisionMatrix`
+            Transformed decision matrix.
+
+        """
+        return self._transform_dm(dm, out=out)
+
+    def transform_batch(self, batch):
+        """Perform the transformation on every problem of a batch.
+
+        All the problems are transformed in a single vectorized call.
+
+        Parameters
+        ----------
+        batch: :py:class:`skcriteria.core.batch.DecisionMatrixBatch`
+            The problems to transform.
+
+        Returns
+        -------
+        :py:class:`skcriteria.core.batch.DecisionMatrixBatch`
+            Transformed problems.
+
+        """
+        data = batch.to_dict(copy=False)
+        data["stats"] = getattr(self, "stats_", None)
+
+        transformed_data = self._transform_data(**data)
+        transformed_data.pop("dtypes")
+
+        return DecisionMatrixBatch(**transformed_data, copy=False)
+
 
 # =============================================================================
 # SK WEIGHTER
@@ -232,10 +611,19 @@ class SKCWeighterABC(SKCTransformerABC):
     This mixin require to redefine ``_weight_matrix``, instead of
     ``_transform_data``.
 
+    ``fit()`` computes the weights of the reference decision matrix
+    (``weights_``), and ``transform()`` assigns them to any decision matrix
+    with the same criteria.
+
     """
 
+    def __init_subclass__(cls):
+        """Check if the weights calculation accepts the statistics."""
+        super().__init_subclass__()
+        cls._skcriteria_weight_stats = _accepts(cls._weight_matrix, "stats")
+
     @abc.abstractmethod
-    def _weight_matrix(self, matrix, objectives, weights):
+    def _weight_matrix(self, matrix, objectives, weights, stats=None):
         """Calculate a new array of weights.
 
         Parameters
@@ -246,6 +634,9 @@ class SKCWeighterABC(SKCTransformerABC):
             The objectives in numeric format.
         weights: :py:class:`numpy.ndarray`
             The original weights
+        stats: :py:class:`skcriteria.core.stats.CriteriaStats` or None
+            The cached statistics of the matrix (``None`` if they are not
+            available).
 
         Returns
         -------
@@ -255,12 +646,33 @@ class SKCWeighterABC(SKCTransformerABC):
         """
         raise NotImplementedError()
 
+    def _compute_weights(self, matrix, objectives, weights, stats):
+        if self._skcriteria_weight_stats:
+            return self._weight_matrix(
+                matrix=matrix,
+                objectives=objectives,
+                weights=weights,
+                stats=stats,
+            )
+        return self._weight_matrix(
+            matrix=matrix, objectives=objectives, weights=weights
+        )
+
+    @doc_inherit(SKCTransformerABC._fit_data)
+    def _fit_data(self, matrix, objectives, weights, stats=None, **kwargs):
+        self.weights_ = self._compute_weights(
+            matrix, objectives, weights, stats
+        )
+
     @doc_inherit(SKCTransformerABC._transform_data)
     def _transform_data(self, matrix, objectives, weights, **kwargs):
 
-        new_weights = self._weight_matrix(
-            matrix=matrix, objectives=objectives, weights=weights
-        )
+        if hasattr(self, "weights_"):
+            new_weights = self.weights_
+        else:
+            new_weights = self._compute_weights(
+                matrix, objectives, weights, kwargs.get("stats")
+            )
 
         kwargs.update(
             matrix=matrix, objectives=objectives, weights=new_weights
@@ -274,10 +686,44 @@ class SKCWeighterABC(SKCTransformerABC):
 # =============================================================================
 
 
+def _stack_extra(extras):
+    # the arrays with the same shape are stacked (one element by weights
+    # vector) and the rest are stored in an object array
+    stacked = {}
+    for key, first in extras[0].items():
+        values = [extra[key] for extra in extras]
+        if isinstance(first, np.ndarray) and all(
+            np.shape(value) == first.shape for value in values
+        ):
+            stacked[key] = np.stack(values)
+        else:
+            stacked[key] = np.empty(len(values), dtype=object)
+            stacked[key][:] = values
+    return stacked
+
+
 class SKCDecisionMakerABC(SKCMethodABC):
-    """Mixin class for all decisor based methods in scikit-criteria."""
+    """Mixin class for all decisor based methods in scikit-criteria.
+
+    The decision makers that can evaluate a batch of problems in their
+    ``_evaluate_data`` method must set ``_skcriteria_supports_batch`` to
+    ``True``.
+
+    The decision makers can redefine ``_evaluate_weights_data`` to evaluate
+    many weights vectors in a single vectorized call (see
+    ``evaluate_weights()``), and ``_evaluate_top_k_data`` to select the best
+    alternatives without ranking all of them (see ``evaluate()``). The names
+    of the extra values with an element by alternative (like the scores) are
+    listed in ``_skcriteria_alternatives_extra``, so only the elements of the
+    selected alternatives are kept (see
+    ``skcriteria.utils.rank.take_alternatives()`` for the values with the
+    alternatives along other axes).
+
+    """
 
     _skcriteria_dm_type = "decision_maker"
+    _skcriteria_supports_batch = False
+    _skcriteria_alternatives_extra = ()
 
     @abc.abstractmethod
     def _evaluate_data(self, **kwargs):
@@ -287,13 +733,63 @@ class SKCDecisionMakerABC(SKCMethodABC):
     def _make_result(self, alternatives, values, extra):
         raise NotImplementedError()
 
-    def evaluate(self, dm):
-        """Validate the dm and calculate and evaluate the alternatives.
+    def _evaluate_top_k_data(self, top_k, **kwargs):
+        """Select the ``top_k`` first ranked alternatives.
+
+        The default implementation ranks all the alternatives with
+        ``_evaluate_data`` and then selects the best ones.
 
         Parameters
         ----------
-        dm: :py:class:`skcriteria.data.DecisionMatrix`
-            Decision matrix on which the ranking will be calculated.
+        top_k: int
+            How many alternatives are selected.
+        kwargs:
+            The decision matrix as separated parameters.
+
+        Returns
+        -------
+        tuple
+            The indexes of the selected alternatives (the best first) and the
+            extra information of all the alternatives.
+
+        """
+        ranking, extra = self._evaluate_data(**kwargs)
+        return rank.top_k_values(ranking, top_k), extra
+
+    def _evaluate_top_k(self, data, top_k):
+        if top_k < 1:
+            raise ValueError("'top_k' must be greater than 0")
+
+        selected, extra = self._evaluate_top_k_data(top_k=top_k, **data)
+
+        extra = rank.take_alternatives(
+            extra, selected, self._skcriteria_alternatives_extra
+        )
+
+        return RankResult(
+            type(self).__name__,
+            alternatives=np.asarray(data["alternatives"])[selected],
+            values=np.arange(1, len(selected) + 1),
+            extra=extra,
+            top_k=top_k,
+        )
+
+    def evaluate_arrays(self, data, top_k=None):
+        """Evaluate the alternatives given the arrays of a decision matrix.
+
+        This is the array-level protocol of the decision makers: no decision
+        matrix is needed and nothing is validated (see
+        ``SKCTransformerABC.transform_arrays()``).
+
+        Parameters
+        ----------
+        data: :py:class:`dict`
+            The data of a decision matrix as returned by
+            ``DecisionMatrix.to_dict()``, optionally with the statistics
+            cache of the matrix in the ``stats`` key.
+        top_k: int or None (default ``None``)
+            If is not ``None`` only the ``top_k`` first ranked alternatives
+            are selected (see ``evaluate()``).
 
         Returns
         -------
@@ -301,7 +797,9 @@ class SKCDecisionMakerABC(SKCMethodABC):
             Ranking.
 
         """
-        data = dm.to_dict()
+        data = _array_data(self, data)
+        if top_k is not None:
+            return self._evaluate_top_k(data, top_k)
 
         result_data, extra = self._evaluate_data(**data)
 
@@ -311,3 +809,124 @@ class SKCDecisionMakerABC(SKCMethodABC):
         )
 
         return result
+
+    def evaluate(self, dm, top_k=None):
+        """Validate the dm and calculate and evaluate the alternatives.
+
+        Parameters
+        ----------
+        dm: :py:class:`skcriteria.data.DecisionMatrix`
+            Decision matrix on which the ranking will be calculated.
+        top_k: int or None (default ``None``)
+            If is not ``None`` the result only holds the ``top_k`` first
+            ranked alternatives, and the extra values with an element by
+            alternative (like the scores) only hold the selected ones. The
+            decision makers based on a score select the alternatives with
+            :py:func:`numpy.argpartition` instead of ranking all of them.
+
+        Returns
+        -------
+        :py:class:`skcriteria.data.RankResult`
+            Ranking.
+
+        """
+        data = _method_data(self, dm)
+        return self.evaluate_arrays(data, top_k=top_k)
+
+    def _evaluate_weights_data(self, weights, **kwargs):
+        """Evaluate the alternatives with every weights vector.
+
+        The default implementation calls ``_evaluate_data`` once by weights
+        vector.
+
+        Parameters
+        ----------
+        weights: :py:class:`numpy.ndarray`
+            Array of shape ``(n_weights, n_criteria)``.
+        kwargs:
+            The rest of the decision matrix as separated parameters.
+
+        Returns
+        -------
+        tuple
+            The rankings with shape ``(n_weights, n_alternatives)`` and the
+            extra information of every weights vector.
+
+        """
+        results = [self._evaluate_data(weights=w, **kwargs) for w in weights]
+        ranks = np.stack([values for values, _ in results])
+        return ranks, _stack_extra([extra for _, extra in results])
+
+    def evaluate_weights(self, dm, weights):
+        """Evaluate the alternatives with many weights vectors.
+
+        The decision makers with a score linear or separable in the weights
+        evaluate all the weights vectors in one vectorized call, instead of
+        one ``evaluate()`` by ``dm.copy(weights=w)``.
+
+        Parameters
+        ----------
+        dm: :py:class:`skcriteria.data.DecisionMatrix`
+            Decision matrix on which the rankings will be calculated (their
+            weights are ignored).
+        weights: array-like
+            Array of shape ``(n_weights, n_criteria)`` with a weights vector
+            by row.
+
+        Returns
+        -------
+        :py:class:`skcriteria.core.batch.RankResultBatch`
+            Ranking with every weights vector (the extra arrays, like the
+            scores, have one row by weights vector).
+
+        """
+        weights = np.asarray(weights)
+        if weights.ndim != 2 or weights.shape[1] != dm.shape[1]:
+            raise ValueError(
+                "'weights' must have shape (n_weights, n_criteria), "
+                f"found {weights.shape}"
+            )
+
+        data = _method_data(self, dm)
+        data["weights"] = weights
+
+        ranks, extra = self._evaluate_weights_data(**data)
+
+        return RankResultBatch(
+            type(self).__name__,
+            alternatives=np.broadcast_to(data["alternatives"], ranks.shape),
+            values=ranks,
+            extra=extra,
+        )
+
+    def evaluate_batch(self, batch):
+        """Evaluate the alternatives of every problem of a batch.
+
+        All the problems are evaluated in a single vectorized call.
+
+        Parameters
+        ----------
+        batch: :py:class:`skcriteria.core.batch.DecisionMatrixBatch`
+            Problems on which the rankings will be calculated.
+
+        Returns
+        -------
+        :py:class:`skcriteria.core.batch.RankResultBatch`
+            Ranking of every problem.
+
+        """
+        if not self._skcriteria_supports_batch:
+            raise TypeError(
+                f"{type(self).__name__} can't evaluate a batch of problems"
+            )
+
+        data = batch.to_dict(copy=False)
+
+        result_data, extra = self._evaluate_data(**data)
+
+        return RankResultBatch(
+            type(self).__name__,
+            alternatives=data["alternatives"],
+            values=result_data,
+            extra=extra,
+        )
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Global options of scikit-criteria.
+
+The options change the default behavior of the library objects. Every option
+can be overridden in the objects that use them.
+
+Available options:
+
+- ``engine``: Default storage engine of ``DecisionMatrix``. Can be
+  ``"pandas"`` (default), ``"numpy"`` or ``"sparse"``.
+- ``precision``: Floating point precision used to store the decision
+  matrices and to compute the transformations and the scores. Can be
+  ``"float64"`` (default) or ``"float32"``.
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import contextlib
+
+import numpy as np
+
+# =============================================================================
+# OPTIONS
+# =============================================================================
+
+#: Storage engines supported by the DecisionMatrix.
+ENGINES = ("pandas", "numpy", "sparse")
+
+
+def _validate_engine(engine):
+    if engine not in ENGINES:
+        engines = ", ".join(f"'{e}'" for e in ENGINES)
+        raise ValueError(f"'engine' must be {engines}. Found '{engine}'")
+    return engine
+
+
+#: Floating point precisions supported.
+PRECISIONS = ("float64", "float32")
+
+
+def _validate_precision(precision):
+    precision = np.dtype(precision).name
+    if precision not in PRECISIONS:
+        precisions = ", ".join(f"'{p}'" for p in PRECISIONS)
+        raise ValueError(
+            f"'precision' must be {precisions}. Found '{precision}'"
+        )
+    return precision
+
+
+# name -> (default value, validator)
+_OPTIONS = {
+    "engine": ("pandas", _validate_engine),
+    "precision": ("float64", _validate_precision),
+}
+
+_values = {name: default for name, (default, _) in _OPTIONS.items()}
+
+
+# =============================================================================
+# API
+# =============================================================================
+
+
+def _check_name(name):
+    if name not in _OPTIONS:
+        raise KeyError(f"Unknown option '{name}'")
+
+
+def get_option(name):
+    """Retrieve the current value of an option.
+
+    Parameters
+    ----------
+    name : str
+        Name of the option.
+
+    Returns
+    -------
+    object
+        The value of the option.
+
+    """
+    _check_name(name)
+    return _values[name]
+
+
+def set_option(name, value):
+    """Set the value of an option.
+
+    Parameters
+    ----------
+    name : str
+        Name of the option.
+    value : object
+        New value of the option.
+
+    """
+    _check_name(name)
+    _, validator = _OPTIONS[name]
+    _values[name] = validator(value)
+
+
+def reset_option(name):
+    """Reset an option to their default value.
+
+    Parameters
+    ----------
+    name : str
+        Name of the option.
+
+    """
+    _check_name(name)
+    default, _ = _OPTIONS[name]
+    _values[name] = default
+
+
+@contextlib.contextmanager
+def option_context(**options):
+    """Context manager to temporarily set options inside a ``with`` block.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> with option_context(engine="numpy"):
+        ...     dm = mkdm(...)
+
+    """
+    old = {name: get_option(name) for name in options}
+    try:
+        for name, value in options.items():
+            set_option(name, value)
+        yield
+    finally:
+        _values.update(old)
+
+
+# =============================================================================
+# PRECISION
+# =============================================================================
+
+
+def _is_float(dtype):
+    try:
+        return np.issubdtype(dtype, np.floating)
+    except TypeError:  # pandas extension types
+        return False
+
+
+def float_dtype(*dtypes):
+    """Floating point dtype to compute with data of the given dtypes.
+
+    The result is ``float32`` if the option ``precision`` is ``"float32"``
+    or if all the floating point dtypes are of single (or less) precision,
+    so a matrix stored in ``float32`` is computed in ``float32`` regardless
+    of the global option. Otherwise the result is ``float64``.
+
+    Parameters
+    ----------
+    dtypes:
+        The dtypes of the data. The non floating point dtypes are ignored.
+
+    Returns
+    -------
+    :py:class:`numpy.dtype`
+        ``float32`` or ``float64``.
+
+    """
+    floats = [np.dtype(dt) for dt in dtypes if _is_float(dt)]
+    if get_option("precision") == "float32" or (
+        floats and all(dt.itemsize <= 4 for dt in floats)
+    ):
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
+def storage_dtype(dtype):
+    """Dtype used to store a criteria of the given dtype.
+
+    If the option ``precision`` is ``"float32"`` the floating point criteria
+    are stored in ``float32``, otherwise the dtype is not changed.
+
+    """
+    if get_option("precision") == "float32" and _is_float(dtype):
+        return np.dtype(np.float32)
+    return dtype
+
+
+def as_float_array(arr, copy=False):
+    """Convert ``arr`` to an array of the dtype given by ``float_dtype()``.
+
+    Parameters
+    ----------
+    arr: array like
+        The values to convert.
+    copy: bool (default ``False``)
+        If ``True`` a new array is always created.
+
+    Returns
+    -------
+    :py:class:`numpy.ndarray`
+        A floating point array.
+
+    """
+    arr = np.asarray(arr)
+    return np.array(arr, dtype=float_dtype(arr.dtype), copy=copy)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Decision matrices stored in shared memory.
+
+A :py:class:`SharedDecisionMatrix` is a small picklable handle of a decision
+matrix copied into a :py:mod:`multiprocessing.shared_memory` block. Sending
+the handle to another process (for example as argument of a
+``ProcessPoolExecutor`` task) only pickles the name and the layout of the
+block, and the worker rebuilds a read-only decision matrix over the same
+memory without copies.
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover
+    # python < 3.8
+    shared_memory = None
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+#: Alignment in bytes of every array inside the shared memory block.
+ALIGNMENT = 64
+
+# The blocks attached by this process. The blocks stay mapped until the
+# handle is closed (or detached) and no decision matrix uses them, so the
+# arrays of the decision matrices never point to released memory.
+_SEGMENTS = {}
+
+
+# =============================================================================
+# HANDLE
+# =============================================================================
+
+
+def _fixed_width(arr):
+    # the labels stored as python objects are converted to a numpy dtype
+    # when is possible; otherwise they are pickled with the handle.
+    if arr.dtype.hasobject:
+        converted = np.asarray(arr.tolist())
+        if converted.tolist() == arr.tolist():
+            return converted
+    return arr
+
+
+def _attach_segment(name):
+    segment = _SEGMENTS.get(name)
+    if segment is None:
+        segment = shared_memory.SharedMemory(name=name)
+        _SEGMENTS[name] = segment
+    return segment
+
+
+def _release_segment(name):
+    # unmap the block from this process, unless some array still uses it
+    segment = _SEGMENTS.pop(name, None)
+    if segment is not None:
+        try:
+            segment.close()
+        except BufferError:
+            _SEGMENTS[name] = segment
+    return segment
+
+
+class SharedDecisionMatrix:
+    """Picklable handle of a decision matrix stored in shared memory.
+
+    The alternatives matrix, the objectives, the weights and the names of
+    the alternatives and criteria are copied once into a single shared
+    memory block. The process that creates the handle owns the block, and
+    must release it with ``close()`` (or using the handle as a context
+    manager) when all the workers finish. The workers unmap the block with
+    ``detach()`` (or also using their copy of the handle as a context
+    manager) when they no longer need the attached decision matrix.
+
+    Parameters
+    ----------
+    dm: :py:class:`skcriteria.core.data.DecisionMatrix`
+        The decision matrix to share.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> def evaluate(handle):
+        ...     with handle:
+        ...         return WeightedSumModel().evaluate(handle.attach())
+
+        >>> with dm.share() as handle, ProcessPoolExecutor() as executor:
+        ...     results = list(executor.map(evaluate, [handle] * 4))
+
+    """
+
+    def __init__(self, dm):
+        if shared_memory is None:  # pragma: no cover
+            raise RuntimeError("Shared memory requires Python 3.8 or newer")
+
+        arrays, inline, layout = {}, {}, {}
+        offset = 0
+        for key, arr in (
+            ("matrix", dm.matrix_view),
+            ("objectives", dm._objectives),
+            ("weights", dm._weights),
+            ("alternatives", _fixed_width(dm._alternatives)),
+            ("criteria", _fixed_width(dm._criteria)),
+        ):
+            if arr.dtype.hasobject:
+                inline[key] = arr
+                continue
+            offset = -(-offset // ALIGNMENT) * ALIGNMENT
+            layout[key] = (arr.dtype.str, arr.shape, offset)
+            arrays[key] = arr
+            offset += arr.nbytes
+
+        segment = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for key, arr in arrays.items():
+            dtype, shape, start = layout[key]
+            target = np.ndarray(
+                shape, dtype=dtype, buffer=segment.buf, offset=start
+            )
+            target[...] = arr
+            del target
+
+        _SEGMENTS[segment.name] = segment
+
+        self._name = segment.name
+        self._cls = type(dm)
+        self._shape = dm.shape
+        self._layout = layout
+        self._inline = inline
+        self._owner = True
+
+    # PICKLE ==================================================================
+
+    def __getstate__(self):
+        """Return the state to pickle (without the ownership)."""
+        state = self.__dict__.copy()
+        state["_owner"] = False
+        return state
+
+    # PROPERTIES ==============================================================
+
+    @property
+    def name(self):
+        """Name of the shared memory block."""
+        return self._name
+
+    @property
+    def shape(self):
+        """Shape of the shared decision matrix."""
+        return self._shape
+
+    @property
+    def owner(self):
+        """True if this handle created (and must release) the block."""
+        return self._owner
+
+    # API =====================================================================
+
+    def attach(self):
+        """Rebuild the decision matrix over the shared memory.
+
+        Returns
+        -------
+        :py:class:`skcriteria.core.data.DecisionMatrix`
+            A read-only decision matrix (with the numpy engine) that shares
+            the memory of the block.
+
+        """
+        segment = _attach_segment(self._name)
+        parts = dict(self._inline)
+        for key, (dtype, shape, start) in self._layout.items():
+            # frombuffer keeps the buffer exported while the array lives, so
+            # the block can't be unmapped under the decision matrix
+            arr = np.frombuffer(
+                segment.buf,
+                dtype=dtype,
+                count=int(np.prod(shape)),
+                offset=start,
+            ).reshape(shape)
+            arr.flags.writeable = False
+            parts[key] = arr
+        return self._cls._from_parts(**parts)
+
+    def detach(self):
+        """Unmap the shared memory block from this process.
+
+        The block is not released, so the handle can be attached again. If
+        some decision matrix returned by ``attach()`` is still alive, the
+        block stays mapped (it can't be unmapped while it is used).
+
+        """
+        _release_segment(self._name)
+
+    def close(self):
+        """Release the shared memory block.
+
+        The owner handle unmaps and releases the block, and the decision
+        matrices returned by ``attach()`` in the owner process must not be
+        used after this call. Any other handle only unmaps the block from
+        its process (see ``detach()``).
+
+        """
+        if not self._owner:
+            self.detach()
+            return
+        segment = _release_segment(self._name)
+        if segment is None:
+            # detached by another handle of this process
+            segment = shared_memory.SharedMemory(name=self._name)
+            segment.close()
+        segment.unlink()
+        self._owner = False
+
+    def __enter__(self):
+        """Return the handle itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Release or detach the shared memory block (see ``close()``)."""
+        self.close()
+
+    def __repr__(self):
+        """handle.__repr__() <==> repr(handle)."""
+        a_number, c_number = self._shape
+        return (
+            f"<{type(self).__name__} {self._name!r} "
+            f"{a_number} Alternatives x {c_number} Criteria>"
+        )
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Lazy cache of the statistics of every criteria of a matrix.
+
+The scalers, distances, weighters and decision makers reduce the matrix
+along the alternatives again and again (to find the minimum and maximum of
+every criteria, the sums, the norms...). A :py:class:`CriteriaStats` computes
+each of these reductions the first time is requested and memoizes it, so
+all the methods applied to the same decision matrix share them.
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+from scipy import sparse
+
+from .options import as_float_array, float_dtype
+from ..utils import nanops
+
+# =============================================================================
+# STATS
+# =============================================================================
+
+
+class CriteriaStats:
+    """Statistics of every criteria of a matrix computed on demand.
+
+    All the statistics are reductions along the alternatives axis (``-2``,
+    so the matrix can be also a batch of problems). The minimum and maximum
+    are computed over the raw values and the rest over the matrix converted
+    to float (see ``skcriteria.core.options.as_float_array()``), exactly as
+    the functions that consume them. The missing values (NaN) are ignored.
+
+    The matrix can be also a :py:mod:`scipy.sparse` matrix, and the
+    statistics are computed from their stored values without densifying it.
+
+    Parameters
+    ----------
+    matrix: :py:class:`numpy.ndarray`, sparse matrix or None
+        The alternatives matrix (no copy is made, so the matrix must not be
+        modified). ``None`` is used by the statistics without matrix (see
+        ``subset()``).
+
+    """
+
+    def __init__(self, matrix):
+        if matrix is not None and not sparse.issparse(matrix):
+            matrix = np.asarray(matrix)
+        self._matrix = matrix
+        self._cache = {}
+
+    def _get(self, name, func):
+        if name not in self._cache:
+            self._cache[name] = func()
+        return self._cache[name]
+
+    def _values(self):
+        if self._matrix is None:
+            raise ValueError(
+                "The statistic can't be computed without the matrix"
+            )
+        return self._matrix
+
+    def _float_matrix(self):
+        matrix = self._values()
+        if sparse.issparse(matrix):
+            return matrix.astype(float_dtype(matrix.dtype), copy=False)
+        return as_float_array(matrix)
+
+    # STATISTICS ==============================================================
+
+    @property
+    def mins(self):
+        """Minimum of every criteria."""
+        return self._get(
+            "mins", lambda: nanops.nanmin(self._values(), axis=-2)
+        )
+
+    @property
+    def maxs(self):
+        """Maximum of every criteria."""
+        return self._get(
+            "maxs", lambda: nanops.nanmax(self._values(), axis=-2)
+        )
+
+    @property
+    def sums(self):
+        """Sum of every criteria."""
+        return self._get(
+            "sums", lambda: nanops.nansum(self._float_matrix(), axis=-2)
+        )
+
+    @property
+    def sumsq(self):
+        """Sum of the squares of every criteria."""
+
+        def sumsq():
+            matrix = self._float_matrix()
+            if sparse.issparse(matrix):
+                return nanops.nansum(matrix.multiply(matrix), axis=-2)
+            return nanops.nansum(matrix * matrix, axis=-2)
+
+        return self._get("sumsq", sumsq)
+
+    @property
+    def counts(self):
+        """Number of values (not missing) of every criteria."""
+        return self._get(
+            "counts", lambda: nanops.nancount(self._values(), axis=-2)
+        )
+
+    @property
+    def mean(self):
+        """Arithmetic mean of every criteria."""
+        return self._get("mean", lambda: self.sums / self.counts)
+
+    @property
+    def std(self):
+        """Standard deviation of every criteria."""
+        return self._get(
+            "std", lambda: nanops.nanstd(self._float_matrix(), axis=-2)
+        )
+
+    @property
+    def norm(self):
+        """Euclidean norm of every criteria."""
+        return self._get("norm", lambda: np.sqrt(self.sumsq))
+
+    # UTILITIES ===============================================================
+
+    @property
+    def computed(self):
+        """Names of the statistics already computed."""
+        return frozenset(self._cache)
+
+    def keepdims(self, name, dtype=None):
+        """Return a statistic with the alternatives axis kept (with size 1).
+
+        The result can be broadcasted against the matrix, like a reduction
+        with ``keepdims=True``.
+
+        Parameters
+        ----------
+        name: str
+            Name of the statistic.
+        dtype: dtype or None (default ``None``)
+            If is not ``None`` the statistic is converted to this dtype.
+
+        """
+        value = np.expand_dims(getattr(self, name), -2)
+        if dtype is not None:
+            value = value.astype(dtype, copy=False)
+        return value
+
+    def subset(self, names):
+        """Return the given statistics without the matrix.
+
+        The statistics are computed if they are not cached. The result
+        doesn't keep a reference to the matrix, so is small enough to be
+        stored as the state of a fitted transformer; only the statistics
+        that can be derived from ``names`` are available.
+
+        Parameters
+        ----------
+        names: iterable of str
+            Names of the statistics.
+
+        Returns
+        -------
+        :py:class:`CriteriaStats`
+            The statistics without matrix.
+
+        """
+        stats = type(self)(None)
+        for name in names:
+            stats._cache[name] = getattr(self, name)
+        return stats
+
+    def append(self, matrix, rows):
+        """Return the statistics of a matrix with new alternatives.
+
+        The minimum, maximum, sum, sum of squares and counts already
+        computed are updated with the new rows; the other statistics are
+        computed again on demand.
+
+        Parameters
+        ----------
+        matrix: :py:class:`numpy.ndarray`
+            The matrix with the new alternatives at the end.
+        rows: :py:class:`numpy.ndarray`
+            The new alternatives.
+
+        Returns
+        -------
+        :py:class:`CriteriaStats`
+            The statistics of ``matrix``.
+
+        """
+        stats = type(self)(matrix)
+        if not len(rows):
+            stats._cache.update(self._cache)
+            return stats
+
+        new = type(self)(rows)
+        cache = self._cache
+        if "mins" in cache:
+            stats._cache["mins"] = np.fmin(cache["mins"], new.mins)
+        if "maxs" in cache:
+            stats._cache["maxs"] = np.fmax(cache["maxs"], new.maxs)
+        if "sums" in cache:
+            stats._cache["sums"] = cache["sums"] + new.sums
+        if "sumsq" in cache:
+            stats._cache["sumsq"] = cache["sumsq"] + new.sumsq
+        if "counts" in cache:
+            stats._cache["counts"] = cache["counts"] + new.counts
+        return stats
+
+    def __repr__(self):
+        """stats.__repr__() <==> repr(stats)."""
+        computed = ", ".join(sorted(self._cache))
+        return f"<{type(self).__name__} computed=[{computed}]>"
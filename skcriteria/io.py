@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Functions to read decision matrices from files."""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+import pandas as pd
+
+from scipy import sparse
+
+from .core import DecisionMatrix, options
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+#: Default number of alternatives of every block of ``read_csv_chunks()``.
+CHUNKSIZE = 2**16
+
+
+# =============================================================================
+# CSV
+# =============================================================================
+
+
+def _alternatives_of(block, index_col):
+    if index_col is None:
+        # the index of the blocks continues between chunks, so the default
+        # names are the same as if the whole file is read at once.
+        return np.array([f"A{idx}" for idx in block.index])
+    return block.index.to_numpy()
+
+
+def _block_dtype(dtype, first_dtype):
+    # pandas infers the dtypes of every chunk, so the blocks are stored with
+    # the dtype of the first one (unless some value doesn't fit, like a
+    # float in an integer criteria) and the precision option
+    return options.storage_dtype(np.result_type(dtype, first_dtype))
+
+
+def read_csv_chunks(
+    path,
+    objectives,
+    weights=None,
+    chunksize=CHUNKSIZE,
+    *,
+    index_col=None,
+    engine=None,
+    **kwargs,
+):
+    """Read a CSV file of alternatives as a stream of decision matrices.
+
+    Every row of the file is an alternative and every column a criteria.
+    The file is read by blocks of ``chunksize`` alternatives, so files bigger
+    than the memory can be processed with the methods that evaluate every
+    alternative independently (for example ``WeightedSumModel``,
+    ``RatioMOORA`` or the scalers that don't need global statistics).
+
+    The first block is created (and validated) with
+    ``DecisionMatrix.from_mcda_data()``; the next blocks reuse the same
+    criteria, objectives and weights arrays and skip the validation, and
+    are stored with the dtypes of the first one.
+
+    Parameters
+    ----------
+    path: str, path-like or file-like
+        The CSV file to read.
+    objectives: Iterable
+        The sense of optimality of every criteria.
+    weights: Iterable o None (default ``None``)
+        Optional weights of the criteria. If is ``None`` all the criteria
+        are weighted with 1.
+    chunksize: int (default ``CHUNKSIZE``)
+        Maximum number of alternatives of every block.
+    index_col: int, str or None (default ``None``)
+        Column with the names of the alternatives. If is ``None`` the
+        alternatives are named "A[n]" where n is the number of the row in
+        the file starting at 0.
+    engine: str or None (default ``None``)
+        Storage engine of the decision matrices (see ``DecisionMatrix``).
+    kwargs:
+        Extra parameters passed to :py:func:`pandas.read_csv`.
+
+    Yields
+    ------
+    :py:class:`skcriteria.core.data.DecisionMatrix`
+        A decision matrix for every block of alternatives.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from skcriteria.madm.simple import WeightedSumModel
+        >>> wsm = WeightedSumModel()
+        >>> for dm in read_csv_chunks("big.csv", [max, max, max]):
+        ...     result = wsm.evaluate(dm)
+
+    """
+    reader = pd.read_csv(
+        path, chunksize=chunksize, index_col=index_col, **kwargs
+    )
+
+    first = None
+    with reader:
+        for block in reader:
+            alternatives = _alternatives_of(block, index_col)
+
+            if first is None:
+                first = DecisionMatrix.from_mcda_data(
+                    matrix=block.to_numpy(),
+                    objectives=objectives,
+                    weights=weights,
+                    alternatives=alternatives,
+                    criteria=block.columns.to_numpy(),
+                    dtypes=block.dtypes.to_numpy(),
+                    copy=False,
+                    engine=engine,
+                )
+                yield first
+                continue
+
+            parts = {
+                "objectives": first._objectives,
+                "weights": first._weights,
+            }
+            if first.engine != "pandas":
+                matrix = block.to_numpy()
+                matrix = matrix.astype(
+                    _block_dtype(matrix.dtype, first._matrix.dtype),
+                    copy=False,
+                )
+                parts.update(
+                    matrix=(
+                        sparse.csr_matrix(matrix)
+                        if first.engine == "sparse"
+                        else matrix
+                    ),
+                    alternatives=alternatives,
+                    criteria=first._criteria,
+                )
+            else:
+                block = block.astype(
+                    {
+                        column: _block_dtype(dtype, first_dtype)
+                        for column, dtype, first_dtype in zip(
+                            block.columns, block.dtypes, first.dtypes
+                        )
+                    },
+                    copy=False,
+                )
+                block.index = alternatives
+                parts.update(data_df=block)
+
+            yield DecisionMatrix._from_parts(**parts)
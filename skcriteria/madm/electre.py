@@ -29,6 +29,7 @@ can apply another MCDA with a restricted set of alternatives saving much time.
 import numpy as np
 
 from ..core import KernelResult, Objective, SKCDecisionMakerABC
+from ..core.options import float_dtype
 from ..utils import doc_inherit
 
 # =============================================================================
@@ -52,7 +53,9 @@ def concordance(matrix, objectives, weights):
 
     matrix_objectives = np.tile(objectives, (matrix_len, 1))
     matrix_weights = np.tile(weights, (matrix_len, 1))
-    matrix_concordance = np.empty((matrix_len, matrix_len), dtype=float)
+    matrix_concordance = np.empty(
+        (matrix_len, matrix_len), dtype=float_dtype(np.asarray(weights).dtype)
+    )
 
     for idx, row in enumerate(matrix):
         new_row = _conc_row(row, matrix, matrix_objectives, matrix_weights)
@@ -78,13 +81,22 @@ def _disc_row(row, mtx, matrix_objectives, max_range):
     return new_row
 
 
-def discordance(matrix, objectives):
-    """Calculate the discordance matrix."""
+def discordance(matrix, objectives, stats=None):
+    """Calculate the discordance matrix.
+
+    ``stats`` are the optional cached statistics of the matrix.
+
+    """
     matrix_len = len(matrix)
 
     matrix_objectives = np.tile(objectives, (matrix_len, 1))
-    max_range = (np.max(matrix, axis=0) - np.min(matrix, axis=0)).max()
-    matrix_discordance = np.empty((matrix_len, matrix_len), dtype=float)
+    if stats is None:
+        max_range = (np.max(matrix, axis=0) - np.min(matrix, axis=0)).max()
+    else:
+        max_range = (stats.maxs - stats.mins).max()
+    matrix_discordance = np.empty(
+        (matrix_len, matrix_len), dtype=float_dtype(np.asarray(matrix).dtype)
+    )
 
     for idx, row in enumerate(matrix):
         matrix_discordance[idx] = _disc_row(
@@ -100,11 +112,11 @@ def discordance(matrix, objectives):
 # =============================================================================
 
 
-def electre1(matrix, objectives, weights, p=0.65, q=0.35):
+def electre1(matrix, objectives, weights, p=0.65, q=0.35, stats=None):
     """Execute ELECTRE1 without any validation."""
     # get the concordance and discordance info
     matrix_concordance = concordance(matrix, objectives, weights)
-    matrix_discordance = discordance(matrix, objectives)
+    matrix_discordance = discordance(matrix, objectives, stats=stats)
 
     with np.errstate(invalid="ignore"):
         outrank = (matrix_concordance >= p) & (matrix_discordance <= q)
@@ -166,9 +178,11 @@ class ELECTRE1(SKCDecisionMakerABC):
         self._q = float(q)
 
     @doc_inherit(SKCDecisionMakerABC._evaluate_data)
-    def _evaluate_data(self, matrix, objectives, weights, **kwargs):
+    def _evaluate_data(
+        self, matrix, objectives, weights, stats=None, **kwargs
+    ):
         kernel, outrank, matrix_concordance, matrix_discordance = electre1(
-            matrix, objectives, weights, self.p, self.q
+            matrix, objectives, weights, self.p, self.q, stats=stats
         )
         return kernel, {
             "outrank": outrank,
@@ -176,6 +190,18 @@ class ELECTRE1(SKCDecisionMakerABC):
             "matrix_discordance": matrix_discordance,
         }
 
+    @doc_inherit(SKCDecisionMakerABC._evaluate_weights_data)
+    def _evaluate_weights_data(self, **kwargs):
+        raise TypeError(
+            "ELECTRE1 returns a kernel and can't evaluate many weights"
+        )
+
+    @doc_inherit(SKCDecisionMakerABC._evaluate_top_k_data)
+    def _evaluate_top_k_data(self, **kwargs):
+        raise TypeError(
+            "ELECTRE1 returns a kernel and can't select the top-k alternatives"
+        )
+
     @doc_inherit(SKCDecisionMakerABC._make_result)
     def _make_result(self, alternatives, values, extra):
         return KernelResult(
@@ -20,25 +20,52 @@ import itertools as it
 import numpy as np
 
 from ..core import Objective, RankResult, SKCDecisionMakerABC
-from ..utils import doc_inherit, rank
+from ..core.options import float_dtype
+from ..utils import chunks, doc_inherit, nanops, rank
 
 # =============================================================================
 # Ratio MOORA
 # =============================================================================
 
 
-def ratio(matrix, objectives, weights):
-    """Execute ratio MOORA without any validation."""
+def _ratio_score(matrix, objectives, weights):
     # change the sign the minimization criteria
     # If we multiply by -1 (min) the weights,
     # when we multipliying this weights by the matrix we emulate
     # the -+ ratio mora strategy
-    objective_x_weights = weights * objectives
+    objective_x_weights = np.multiply(weights, objectives)
+
+    # calculate ranking by inner prodcut (a 1D array even with only one
+    # alternative, so a block of a single row can be evaluated)
+    return nanops.nanmatvec(matrix, objective_x_weights)
+
+
+def ratio(matrix, objectives, weights):
+    """Execute ratio MOORA without any validation.
+
+    The matrix can be also a batch of problems with shape
+    ``(n_problems, n_alternatives, n_criteria)`` and the weights of every
+    problem with shape ``(n_problems, n_criteria)``, or a
+    :py:mod:`scipy.sparse` matrix. The missing values (NaN) don't add to the
+    score.
+
+    """
+    score = _ratio_score(matrix, objectives, weights)
+    return rank.rank_values(score, reverse=True, axis=-1), score
 
-    # calculate ranking by inner prodcut
-    rank_mtx = np.inner(matrix, objective_x_weights)
-    score = np.squeeze(np.asarray(rank_mtx))
-    return rank.rank_values(score, reverse=True), score
+
+def ratio_multiweight(matrix, objectives, weights):
+    """Execute ratio MOORA with many weights vectors.
+
+    ``weights`` has shape ``(n_weights, n_criteria)``, and the scores of
+    all the weights vectors are computed with a single matrix product.
+    Returns the rankings and scores with shape
+    ``(n_weights, n_alternatives)``.
+
+    """
+    objective_x_weights = np.multiply(weights, objectives)
+    score = nanops.nanmatmul(matrix, np.transpose(objective_x_weights)).T
+    return rank.rank_values(score, reverse=True, axis=-1), score
 
 
 class RatioMOORA(SKCDecisionMakerABC):
@@ -68,11 +95,27 @@ class RatioMOORA(SKCDecisionMakerABC):
 
     """
 
+    _skcriteria_supports_batch = True
+    _skcriteria_supports_sparse = True
+    _skcriteria_alternatives_extra = ("score",)
+
     @doc_inherit(SKCDecisionMakerABC._evaluate_data)
     def _evaluate_data(self, matrix, objectives, weights, **kwargs):
         rank, score = ratio(matrix, objectives, weights)
         return rank, {"score": score}
 
+    @doc_inherit(SKCDecisionMakerABC._evaluate_weights_data)
+    def _evaluate_weights_data(self, matrix, objectives, weights, **kwargs):
+        rank, score = ratio_multiweight(matrix, objectives, weights)
+        return rank, {"score": score}
+
+    @doc_inherit(SKCDecisionMakerABC._evaluate_top_k_data)
+    def _evaluate_top_k_data(
+        self, matrix, objectives, weights, top_k, **kwargs
+    ):
+        score = _ratio_score(matrix, objectives, weights)
+        return rank.top_k_values(score, top_k, reverse=True), {"score": score}
+
     @doc_inherit(SKCDecisionMakerABC._make_result)
     def _make_result(self, alternatives, values, extra):
         return RankResult(
@@ -85,20 +128,83 @@ class RatioMOORA(SKCDecisionMakerABC):
 # =============================================================================
 
 
-def refpoint(matrix, objectives, weights):
-    """Execute reference point MOORA without any validation."""
-    # max and min reference points
-    rpmax = np.max(matrix, axis=0)
-    rpmin = np.min(matrix, axis=0)
+def _refpoint_score(matrix, objectives, weights, stats=None):
+    # max and min reference points (of every problem)
+    if stats is None:
+        rpmax = np.max(matrix, axis=-2)
+        rpmin = np.min(matrix, axis=-2)
+    else:
+        rpmax, rpmin = stats.maxs, stats.mins
 
     # merge two reference points acoording objectives
     mask = np.where(objectives == Objective.MAX.value, objectives, 0)
     reference_point = np.where(mask, rpmax, rpmin)
 
-    # create rank matrix
-    rank_mtx = np.max(np.abs(weights * (matrix - reference_point)), axis=1)
-    score = np.squeeze(np.asarray(rank_mtx))
-    return rank.rank_values(score), score, reference_point
+    # the reference point and the weights are broadcasted to every
+    # alternative of their problem
+    rpoint = reference_point[..., np.newaxis, :]
+    weights = np.asarray(weights)[..., np.newaxis, :]
+
+    # create rank matrix, by blocks of alternatives to bound the size of
+    # the temporary arrays (and to read memory mapped matrices by pages)
+    rank_mtx = np.empty(matrix.shape[:-1], dtype=float_dtype(matrix.dtype))
+    for rows in chunks.row_chunks(np.swapaxes(matrix, 0, -2)):
+        distance = np.abs(weights * (matrix[..., rows, :] - rpoint))
+        rank_mtx[..., rows] = np.max(distance, axis=-1)
+
+    return rank_mtx, reference_point
+
+
+def refpoint(matrix, objectives, weights, stats=None):
+    """Execute reference point MOORA without any validation.
+
+    The matrix can be also a batch of problems with shape
+    ``(n_problems, n_alternatives, n_criteria)`` and the weights of every
+    problem with shape ``(n_problems, n_criteria)``. ``stats`` are the
+    optional cached statistics of the matrix.
+
+    """
+    score, reference_point = _refpoint_score(
+        matrix, objectives, weights, stats=stats
+    )
+    return rank.rank_values(score, axis=-1), score, reference_point
+
+
+def refpoint_multiweight(matrix, objectives, weights, stats=None):
+    """Execute reference point MOORA with many weights vectors.
+
+    ``weights`` has shape ``(n_weights, n_criteria)``. The distances of the
+    alternatives to the reference point are computed once and only scaled
+    by every weights vector (by blocks of weights vectors to bound the size
+    of the temporary arrays). Returns the rankings and scores with shape
+    ``(n_weights, n_alternatives)``.
+
+    """
+    if stats is None:
+        rpmax = np.max(matrix, axis=-2)
+        rpmin = np.min(matrix, axis=-2)
+    else:
+        rpmax, rpmin = stats.maxs, stats.mins
+
+    mask = np.where(objectives == Objective.MAX.value, objectives, 0)
+    reference_point = np.where(mask, rpmax, rpmin)
+
+    # |w * (x - r)| == |w| * |x - r|
+    distance = np.abs(np.subtract(matrix, reference_point))
+    weights = np.abs(weights)
+
+    score = np.empty(
+        (len(weights), len(distance)), dtype=float_dtype(matrix.dtype)
+    )
+    chunk_size = chunks.CHUNK_SIZE // max(len(distance), 1)
+    for rows in chunks.row_chunks(weights, chunk_size):
+        wdistance = weights[rows, np.newaxis, :] * distance
+        score[rows] = np.max(wdistance, axis=-1)
+
+    reference_point = np.broadcast_to(
+        reference_point, (len(weights),) + reference_point.shape
+    )
+    return rank.rank_values(score, axis=-1), score, reference_point
 
 
 class ReferencePointMOORA(SKCDecisionMakerABC):
@@ -131,11 +237,39 @@ class ReferencePointMOORA(SKCDecisionMakerABC):
 
     """
 
+    _skcriteria_supports_batch = True
+    _skcriteria_alternatives_extra = ("score",)
+
     @doc_inherit(SKCDecisionMakerABC._evaluate_data)
-    def _evaluate_data(self, matrix, objectives, weights, **kwargs):
-        rank, score, reference_point = refpoint(matrix, objectives, weights)
+    def _evaluate_data(
+        self, matrix, objectives, weights, stats=None, **kwargs
+    ):
+        rank, score, reference_point = refpoint(
+            matrix, objectives, weights, stats=stats
+        )
         return rank, {"score": score, "reference_point": reference_point}
 
+    @doc_inherit(SKCDecisionMakerABC._evaluate_weights_data)
+    def _evaluate_weights_data(
+        self, matrix, objectives, weights, stats=None, **kwargs
+    ):
+        rank, score, reference_point = refpoint_multiweight(
+            matrix, objectives, weights, stats=stats
+        )
+        return rank, {"score": score, "reference_point": reference_point}
+
+    @doc_inherit(SKCDecisionMakerABC._evaluate_top_k_data)
+    def _evaluate_top_k_data(
+        self, matrix, objectives, weights, top_k, stats=None, **kwargs
+    ):
+        score, reference_point = _refpoint_score(
+            matrix, objectives, weights, stats=stats
+        )
+        return rank.top_k_values(score, top_k), {
+            "score": score,
+            "reference_point": reference_point,
+        }
+
     @doc_inherit(SKCDecisionMakerABC._make_result)
     def _make_result(self, alternatives, values, extra):
         return RankResult(
@@ -217,6 +351,8 @@ class FullMultiplicativeForm(SKCDecisionMakerABC):
 
     """
 
+    _skcriteria_alternatives_extra = ("score",)
+
     @doc_inherit(SKCDecisionMakerABC._evaluate_data)
     def _evaluate_data(self, matrix, objectives, weights, **kwargs):
         if np.any(matrix <= 0):
@@ -303,6 +439,14 @@ class MultiMOORA(SKCDecisionMakerABC):
 
     """
 
+    _skcriteria_alternatives_extra = (
+        "score",
+        "rank_matrix",
+        "ratio_score",
+        "refpoint_score",
+        "fmf_score",
+    )
+
     @doc_inherit(SKCDecisionMakerABC._evaluate_data)
     def _evaluate_data(self, matrix, objectives, weights, **kwargs):
         if np.any(matrix <= 0):
@@ -21,7 +21,8 @@ import numpy as np
 from scipy.spatial import distance
 
 from ..core import Objective, RankResult, SKCDecisionMakerABC
-from ..utils import doc_inherit, rank
+from ..core.options import float_dtype
+from ..utils import doc_inherit, nanops, rank
 
 # =============================================================================
 # CONSTANTS
@@ -59,33 +60,151 @@ _VALID_DISTANCES = [
 # =============================================================================
 
 
-def topsis(matrix, objectives, weights, metric="euclidean", **kwargs):
-    """Execute TOPSIS without any validation."""
-    # apply weights
-    wmtx = np.multiply(matrix, weights)
+def _distances_to(wmtx, point, metric, **kwargs):
+    """Distance of every alternative to the point of their problem."""
+    if wmtx.ndim == 2:
+        return distance.cdist(
+            wmtx, point[True], metric=metric, out=None, **kwargs
+        ).flatten()
+
+    # batch of problems: one point by problem
+    if metric == "euclidean" and not kwargs:
+        diff = wmtx - point[:, np.newaxis, :]
+        return np.sqrt(np.sum(np.square(diff), axis=-1))
+    return np.array(
+        [
+            _distances_to(pmtx, ppoint, metric, **kwargs)
+            for pmtx, ppoint in zip(wmtx, point)
+        ]
+    )
+
+
+def _nan_distances_to(wmtx, point, metric, **kwargs):
+    """Distance of every alternative to the point ignoring missing values.
+
+    The missing values take the value of the point, so they don't add to
+    the distance. Only computed again if some distance is NaN.
+
+    """
+    distances = _distances_to(wmtx, point, metric, **kwargs)
+    missing = np.isnan(distances)
+    if missing.any():
+        filled = np.where(
+            np.isnan(wmtx), np.asarray(point)[..., np.newaxis, :], wmtx
+        )
+        distances = np.where(
+            missing, _distances_to(filled, point, metric, **kwargs), distances
+        )
+    return distances
 
-    # extract mins and maxes
-    mins = np.min(wmtx, axis=0)
-    maxs = np.max(wmtx, axis=0)
+
+def _topsis_similarity(matrix, objectives, weights, metric, stats, **kwargs):
+    # apply weights
+    weights = np.asarray(weights)
+    wmtx = np.multiply(matrix, weights[..., np.newaxis, :])
+
+    # extract mins and maxes (the weighting preserves the order of the
+    # values of every criteria, or reverses it with negative weights)
+    if stats is None:
+        mins = nanops.nanmin(wmtx, axis=-2)
+        maxs = nanops.nanmax(wmtx, axis=-2)
+    else:
+        wmins = np.multiply(stats.mins, weights).astype(wmtx.dtype)
+        wmaxs = np.multiply(stats.maxs, weights).astype(wmtx.dtype)
+        mins = np.where(weights >= 0, wmins, wmaxs)
+        maxs = np.where(weights >= 0, wmaxs, wmins)
 
     # create the ideal and the anti ideal arrays
     ideal = np.where(objectives == Objective.MAX.value, maxs, mins)
     anti_ideal = np.where(objectives == Objective.MIN.value, maxs, mins)
 
     # calculate distances
-    d_better = distance.cdist(
-        wmtx, ideal[True], metric=metric, out=None, **kwargs
-    ).flatten()
-    d_worst = distance.cdist(
-        wmtx, anti_ideal[True], metric=metric, out=None, **kwargs
-    ).flatten()
-
-    # relative closeness
+    d_better = _nan_distances_to(wmtx, ideal, metric, **kwargs)
+    d_worst = _nan_distances_to(wmtx, anti_ideal, metric, **kwargs)
+
+    # relative closeness (scipy always computes the distances in float64)
     similarity = d_worst / (d_better + d_worst)
+    similarity = similarity.astype(float_dtype(wmtx.dtype), copy=False)
+
+    return ideal, anti_ideal, similarity
+
+
+def topsis(
+    matrix, objectives, weights, metric="euclidean", stats=None, **kwargs
+):
+    """Execute TOPSIS without any validation.
+
+    The matrix can be also a batch of problems with shape
+    ``(n_problems, n_alternatives, n_criteria)`` and the weights of every
+    problem with shape ``(n_problems, n_criteria)``. ``stats`` are the
+    optional cached statistics of the matrix. The missing values (NaN) are
+    ignored in the ideal and anti-ideal points and in the distances.
+
+    """
+    ideal, anti_ideal, similarity = _topsis_similarity(
+        matrix, objectives, weights, metric, stats, **kwargs
+    )
 
     # compute the rank and return the result
     return (
-        rank.rank_values(similarity, reverse=True),
+        rank.rank_values(similarity, reverse=True, axis=-1),
+        ideal,
+        anti_ideal,
+        similarity,
+    )
+
+
+def _nan_square_distances(matrix, point):
+    """Square distance of every value to the point (zero if is missing)."""
+    sqdistance = np.square(np.subtract(matrix, point))
+    if sqdistance.dtype.kind in "fc":
+        sqdistance[np.isnan(sqdistance)] = 0
+    return sqdistance
+
+
+def topsis_multiweight(matrix, objectives, weights, stats=None):
+    r"""Execute TOPSIS (euclidean distance) with many weights vectors.
+
+    ``weights`` has shape ``(n_weights, n_criteria)``. The square distance
+    of an alternative to a weighted point is
+    :math:`\sum_j w_j^2 (x_j - c_j)^2`, where every :math:`c_j` is the
+    minimum or the maximum of the criteria, so the distances with all the
+    weights vectors are computed with two matrix products. Returns the
+    rankings and similarities with shape ``(n_weights, n_alternatives)``
+    and the ideal and anti-ideal points with shape
+    ``(n_weights, n_criteria)``.
+
+    """
+    weights = np.asarray(weights)
+    if stats is None:
+        mins = nanops.nanmin(matrix, axis=-2)
+        maxs = nanops.nanmax(matrix, axis=-2)
+    else:
+        mins, maxs = stats.mins, stats.maxs
+
+    # the ideal point takes the maximum of the criteria to maximize with
+    # positive weights (the weighting reverses the order with negative
+    # weights) and the anti-ideal point the other extreme
+    ideal_max = np.equal(objectives == Objective.MAX.value, weights >= 0)
+    ideal = np.where(ideal_max, maxs, mins) * weights
+    anti_ideal = np.where(ideal_max, mins, maxs) * weights
+
+    sqweights = np.square(weights)
+    sqweights_max = np.where(ideal_max, sqweights, 0)
+    sqweights_min = sqweights - sqweights_max
+
+    to_max = _nan_square_distances(matrix, maxs)
+    to_min = _nan_square_distances(matrix, mins)
+    d_better = np.sqrt(to_max @ sqweights_max.T + to_min @ sqweights_min.T)
+    d_worst = np.sqrt(to_max @ sqweights_min.T + to_min @ sqweights_max.T)
+
+    similarity = (d_worst / (d_better + d_worst)).T
+    similarity = similarity.astype(
+        float_dtype(np.result_type(matrix, weights)), copy=False
+    )
+
+    return (
+        rank.rank_values(similarity, reverse=True, axis=-1),
         ideal,
         anti_ideal,
         similarity,
@@ -144,6 +263,9 @@ class TOPSIS(SKCDecisionMakerABC):
 
     """
 
+    _skcriteria_supports_batch = True
+    _skcriteria_alternatives_extra = ("similarity",)
+
     def __init__(self, *, metric="euclidean", **cdist_kwargs):
         self.metric = metric
         self.cdist_kwargs = cdist_kwargs
@@ -168,19 +290,25 @@ class TOPSIS(SKCDecisionMakerABC):
     def cdist_kwargs(self, cdist_kwargs):
         self._cdist_kwargs = dict(cdist_kwargs)
 
-    @doc_inherit(SKCDecisionMakerABC._evaluate_data)
-    def _evaluate_data(self, matrix, objectives, weights, **kwargs):
+    def _warn_minimize(self, objectives):
         if Objective.MIN.value in objectives:
             warnings.warn(
                 "Although TOPSIS can operate with minimization objectives, "
                 "this is not recommended. Consider reversing the weights "
                 "for these cases."
             )
+
+    @doc_inherit(SKCDecisionMakerABC._evaluate_data)
+    def _evaluate_data(
+        self, matrix, objectives, weights, stats=None, **kwargs
+    ):
+        self._warn_minimize(objectives)
         rank, ideal, anti_ideal, similarity = topsis(
             matrix,
             objectives,
             weights,
             metric=self.metric,
+            stats=stats,
             **self.cdist_kwargs,
         )
         return rank, {
@@ -189,6 +317,49 @@ class TOPSIS(SKCDecisionMakerABC):
             "similarity": similarity,
         }
 
+    @doc_inherit(SKCDecisionMakerABC._evaluate_weights_data)
+    def _evaluate_weights_data(
+        self, matrix, objectives, weights, stats=None, **kwargs
+    ):
+        # only the euclidean distance has a vectorized kernel
+        if self.metric != "euclidean" or self.cdist_kwargs:
+            return super()._evaluate_weights_data(
+                matrix=matrix,
+                objectives=objectives,
+                weights=weights,
+                stats=stats,
+                **kwargs,
+            )
+
+        self._warn_minimize(objectives)
+        rank, ideal, anti_ideal, similarity = topsis_multiweight(
+            matrix, objectives, weights, stats=stats
+        )
+        return rank, {
+            "ideal": ideal,
+            "anti_ideal": anti_ideal,
+            "similarity": similarity,
+        }
+
+    @doc_inherit(SKCDecisionMakerABC._evaluate_top_k_data)
+    def _evaluate_top_k_data(
+        self, matrix, objectives, weights, top_k, stats=None, **kwargs
+    ):
+        self._warn_minimize(objectives)
+        ideal, anti_ideal, similarity = _topsis_similarity(
+            matrix,
+            objectives,
+            weights,
+            self.metric,
+            stats,
+            **self.cdist_kwargs,
+        )
+        return rank.top_k_values(similarity, top_k, reverse=True), {
+            "ideal": ideal,
+            "anti_ideal": anti_ideal,
+            "similarity": similarity,
+        }
+
     @doc_inherit(SKCDecisionMakerABC._make_result)
     def _make_result(self, alternatives, values, extra):
         return RankResult(
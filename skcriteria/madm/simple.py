@@ -18,7 +18,7 @@
 import numpy as np
 
 from ..core import Objective, RankResult, SKCDecisionMakerABC
-from ..utils import doc_inherit, rank
+from ..utils import doc_inherit, nanops, rank
 
 # =============================================================================
 # SAM
@@ -26,13 +26,34 @@ from ..utils import doc_inherit, rank
 
 
 def wsm(matrix, weights):
-    """Execute weighted sum model without any validation."""
-    # calculate ranking by inner prodcut
+    """Execute weighted sum model without any validation.
 
-    rank_mtx = np.inner(matrix, weights)
-    score = np.squeeze(rank_mtx)
+    The matrix can be also a batch of problems with shape
+    ``(n_problems, n_alternatives, n_criteria)`` and the weights of every
+    problem with shape ``(n_problems, n_criteria)``, or a
+    :py:mod:`scipy.sparse` matrix. The missing values (NaN) don't add to the
+    score.
 
-    return rank.rank_values(score, reverse=True), score
+    """
+    # calculate ranking by inner prodcut of every alternative with the
+    # weights of their problem (a 1D array even with only one alternative,
+    # so a block of a single row can be evaluated)
+    score = nanops.nanmatvec(matrix, weights)
+
+    return rank.rank_values(score, reverse=True, axis=-1), score
+
+
+def wsm_multiweight(matrix, weights):
+    """Execute weighted sum model with many weights vectors.
+
+    ``weights`` has shape ``(n_weights, n_criteria)``, and the scores of
+    all the weights vectors are computed with a single matrix product.
+    Returns the rankings and scores with shape
+    ``(n_weights, n_alternatives)``.
+
+    """
+    score = nanops.nanmatmul(matrix, np.transpose(weights)).T
+    return rank.rank_values(score, reverse=True, axis=-1), score
 
 
 class WeightedSumModel(SKCDecisionMakerABC):
@@ -74,16 +95,36 @@ class WeightedSumModel(SKCDecisionMakerABC):
 
     """
 
-    @doc_inherit(SKCDecisionMakerABC._evaluate_data)
-    def _evaluate_data(self, matrix, weights, objectives, **kwargs):
+    _skcriteria_supports_batch = True
+    _skcriteria_supports_sparse = True
+    _skcriteria_alternatives_extra = ("score",)
+
+    def _validate(self, objectives):
         if Objective.MIN.value in objectives:
             raise ValueError(
                 "WeightedSumModel can't operate with minimize objective"
             )
 
+    @doc_inherit(SKCDecisionMakerABC._evaluate_data)
+    def _evaluate_data(self, matrix, weights, objectives, **kwargs):
+        self._validate(objectives)
         rank, score = wsm(matrix, weights)
         return rank, {"score": score}
 
+    @doc_inherit(SKCDecisionMakerABC._evaluate_weights_data)
+    def _evaluate_weights_data(self, matrix, weights, objectives, **kwargs):
+        self._validate(objectives)
+        rank, score = wsm_multiweight(matrix, weights)
+        return rank, {"score": score}
+
+    @doc_inherit(SKCDecisionMakerABC._evaluate_top_k_data)
+    def _evaluate_top_k_data(
+        self, matrix, weights, objectives, top_k, **kwargs
+    ):
+        self._validate(objectives)
+        score = nanops.nanmatvec(matrix, weights)
+        return rank.top_k_values(score, top_k, reverse=True), {"score": score}
+
     @doc_inherit(SKCDecisionMakerABC._make_result)
     def _make_result(self, alternatives, values, extra):
 
@@ -100,19 +141,36 @@ class WeightedSumModel(SKCDecisionMakerABC):
 # =============================================================================
 
 
-def wpm(matrix, weights):
-    """Execute weighted product model without any validation."""
+def _wpm_score(matrix, weights):
     # instead of multiply we sum the logarithms
     lmtx = np.log10(matrix)
 
     # add the weights to the mtx
     rank_mtx = np.multiply(lmtx, weights)
 
-    score = np.sum(rank_mtx, axis=1)
+    return np.sum(rank_mtx, axis=1)
+
 
+def wpm(matrix, weights):
+    """Execute weighted product model without any validation."""
+    score = _wpm_score(matrix, weights)
     return rank.rank_values(score, reverse=True), score
 
 
+def wpm_multiweight(matrix, weights):
+    """Execute weighted product model with many weights vectors.
+
+    ``weights`` has shape ``(n_weights, n_criteria)``. The logarithms of
+    the matrix are computed once, and the scores of all the weights vectors
+    with a single matrix product. Returns the rankings and scores with shape
+    ``(n_weights, n_alternatives)``.
+
+    """
+    lmtx = np.log10(matrix)
+    score = np.matmul(lmtx, np.transpose(weights)).T
+    return rank.rank_values(score, reverse=True, axis=-1), score
+
+
 class WeightedProductModel(SKCDecisionMakerABC):
     r"""The weighted product model.
 
@@ -161,8 +219,9 @@ class WeightedProductModel(SKCDecisionMakerABC):
 
     """
 
-    @doc_inherit(SKCDecisionMakerABC._evaluate_data)
-    def _evaluate_data(self, matrix, weights, objectives, **kwargs):
+    _skcriteria_alternatives_extra = ("score",)
+
+    def _validate(self, matrix, objectives):
         if Objective.MIN.value in objectives:
             raise ValueError(
                 "WeightedProductModel can't operate with minimize objective"
@@ -172,9 +231,26 @@ class WeightedProductModel(SKCDecisionMakerABC):
                 "WeightedProductModel can't operate with values <= 0"
             )
 
+    @doc_inherit(SKCDecisionMakerABC._evaluate_data)
+    def _evaluate_data(self, matrix, weights, objectives, **kwargs):
+        self._validate(matrix, objectives)
         rank, score = wpm(matrix, weights)
         return rank, {"score": score}
 
+    @doc_inherit(SKCDecisionMakerABC._evaluate_top_k_data)
+    def _evaluate_top_k_data(
+        self, matrix, weights, objectives, top_k, **kwargs
+    ):
+        self._validate(matrix, objectives)
+        score = _wpm_score(matrix, weights)
+        return rank.top_k_values(score, top_k, reverse=True), {"score": score}
+
+    @doc_inherit(SKCDecisionMakerABC._evaluate_weights_data)
+    def _evaluate_weights_data(self, matrix, weights, objectives, **kwargs):
+        self._validate(matrix, objectives)
+        rank, score = wpm_multiweight(matrix, weights)
+        return rank, {"score": score}
+
     @doc_inherit(SKCDecisionMakerABC._make_result)
     def _make_result(self, alternatives, values, extra):
         return RankResult(
@@ -153,15 +153,24 @@ def _second_method(*, stages_results):
 # SIMUS =======================================================================
 
 
-def simus(matrix, objectives, b=None, rank_by=1, solver="pulp"):
-    """Execute SIMUS without any validation."""
+def simus(
+    matrix, objectives, b=None, rank_by=1, solver="pulp", stats=None
+):
+    """Execute SIMUS without any validation.
+
+    ``stats`` are the optional cached statistics of the matrix.
+
+    """
     transposed_matrix = matrix.T
 
     # check the b array and complete the missing values
     b = np.asarray(b)
     if None in b:
-        mins = np.min(transposed_matrix, axis=1)
-        maxs = np.max(transposed_matrix, axis=1)
+        if stats is None:
+            mins = np.min(transposed_matrix, axis=1)
+            maxs = np.max(transposed_matrix, axis=1)
+        else:
+            mins, maxs = stats.mins, stats.maxs
 
         auto_b = np.where(objectives == Objective.MIN.value, mins, maxs)
         b = np.where(b != None, b, auto_b)  # noqa
@@ -246,6 +255,16 @@ class SIMUS(SKCDecisionMakerABC):
 
     """
 
+    _skcriteria_alternatives_extra = (
+        "method_1_score",
+        "method_2_score",
+        "tita_j_p",
+        "tita_j_d",
+        ("stages_results", 1),
+        ("dominance", (0, 1)),
+        ("dominance_by_criteria", (1, 2)),
+    )
+
     def __init__(self, *, rank_by=1, solver="pulp"):
         self.solver = solver
         self.rank_by = rank_by
@@ -276,7 +295,9 @@ class SIMUS(SKCDecisionMakerABC):
         self._rank_by = rank_by
 
     @doc_inherit(SKCDecisionMakerABC._evaluate_data)
-    def _evaluate_data(self, matrix, objectives, b, weights, **kwargs):
+    def _evaluate_data(
+        self, matrix, objectives, b, weights, stats=None, **kwargs
+    ):
         if len(np.unique(weights)) > 1:
             warnings.warn("SIMUS not take into account the weights")
         if b is not None and len(objectives) != len(b):
@@ -297,6 +318,7 @@ class SIMUS(SKCDecisionMakerABC):
             b=b,
             rank_by=self.rank_by,
             solver=self.solver,
+            stats=stats,
         )
         return ranking, {
             "rank_by": self._rank_by,
@@ -311,13 +333,18 @@ class SIMUS(SKCDecisionMakerABC):
             "dominance_by_criteria": dominance_by_criteria,
         }
 
+    @doc_inherit(SKCDecisionMakerABC._evaluate_weights_data)
+    def _evaluate_weights_data(self, b=None, **kwargs):
+        # the default right-side-values are chosen automatically
+        return super()._evaluate_weights_data(b=b, **kwargs)
+
     @doc_inherit(SKCDecisionMakerABC._make_result)
     def _make_result(self, alternatives, values, extra):
         return RankResult(
             "SIMUS", alternatives=alternatives, values=values, extra=extra
         )
 
-    def evaluate(self, dm, *, b=None):
+    def evaluate(self, dm, *, b=None, top_k=None):
         """Validate the decision matrix and calculate a ranking.
 
         Parameters
@@ -341,6 +368,34 @@ class SIMUS(SKCDecisionMakerABC):
             constraints of the dm with 4 criteria by the value 100,  b must be
             `[None, 100, 100, None]` where None will be chosen automatically
             by SIMUS.
+        top_k: int or None (default ``None``)
+            If is not ``None`` the result only holds the ``top_k`` first
+            ranked alternatives.
+
+        Returns
+        -------
+        :py:class:`skcriteria.data.RankResult`
+            Ranking.
+
+        """
+        data = dm.to_dict(copy=False)
+        data["stats"] = dm.stats
+        return self.evaluate_arrays(data, b=b, top_k=top_k)
+
+    def evaluate_arrays(self, data, *, b=None, top_k=None):
+        """Calculate a ranking given the arrays of a decision matrix.
+
+        Parameters
+        ----------
+        data: :py:class:`dict`
+            The data of a decision matrix as returned by
+            ``DecisionMatrix.to_dict()``, optionally with the statistics
+            cache of the matrix in the ``stats`` key.
+        b: :py:class:`numpy.ndarray`
+            Right-side-value of the LP problem (see ``evaluate()``).
+        top_k: int or None (default ``None``)
+            If is not ``None`` the result only holds the ``top_k`` first
+            ranked alternatives.
 
         Returns
         -------
@@ -348,8 +403,11 @@ class SIMUS(SKCDecisionMakerABC):
             Ranking.
 
         """
-        data = dm.to_dict()
+        data = dict(data)
+        data.setdefault("stats", None)
         b = b if b is None else np.asarray(b)
+        if top_k is not None:
+            return self._evaluate_top_k(dict(data, b=b), top_k)
 
         rank, extra = self._evaluate_data(b=b, **data)
 
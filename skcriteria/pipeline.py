@@ -16,7 +16,9 @@
 
 from collections import Counter
 
-from .core import SKCMethodABC
+import numpy as np
+
+from .core import SKCMethodABC, arrays_to_dm, dm_to_arrays
 from .utils import Bunch
 
 
@@ -30,7 +32,12 @@ class SKCPipeline(SKCMethodABC):
     Intermediate steps of the pipeline must be 'transforms', that is, they
     must implement `transform` method.
 
-    The final decision-maker only needs to implement `evaluate`.
+    The final decision-maker only needs to implement `evaluate`. The data
+    flows between the steps that implement `transform_arrays` (or
+    `evaluate_arrays`) as raw arrays, and only the final output is wrapped;
+    the other steps receive a decision matrix. The matrices created by the
+    intermediate steps are overwritten by the next steps that accept an
+    output array, so no extra memory is allocated for them.
 
     The purpose of the pipeline is to assemble several steps that can be
     applied together while setting different parameters. A step's
@@ -86,7 +93,7 @@ class SKCPipeline(SKCMethodABC):
         for name, step in steps[:-1]:
             if not isinstance(name, str):
                 raise TypeError("step names must be instance of str")
-            if not (hasattr(step, "transform") and callable(step.transform)):
+            if not callable(getattr(step, "transform", None)):
                 raise TypeError(
                     f"step '{name}' must implement 'transform()' method"
                 )
@@ -94,7 +101,7 @@ class SKCPipeline(SKCMethodABC):
         name, dmaker = steps[-1]
         if not isinstance(name, str):
             raise TypeError("step names must be instance of str")
-        if not (hasattr(dmaker, "evaluate") and callable(dmaker.evaluate)):
+        if not callable(getattr(dmaker, "evaluate", None)):
             raise TypeError(
                 f"step '{name}' must implement 'evaluate()' method"
             )
@@ -109,13 +116,16 @@ class SKCPipeline(SKCMethodABC):
         """
         return Bunch("steps", dict(self.steps))
 
-    def evaluate(self, dm):
+    def evaluate(self, dm, top_k=None):
         """Run the all the transformers and the decision maker.
 
         Parameters
         ----------
         dm: :py:class:`skcriteria.data.DecisionMatrix`
             Decision matrix on which the result will be calculated.
+        top_k: int or None (default ``None``)
+            If is not ``None`` only the ``top_k`` first ranked alternatives
+            are selected by the decision maker.
 
         Returns
         -------
@@ -124,10 +134,7 @@ class SKCPipeline(SKCMethodABC):
             method.
 
         """
-        dm = self.transform(dm)
-        _, dmaker = self.steps[-1]
-        result = dmaker.evaluate(dm)
-        return result
+        return self.evaluate_arrays(dm_to_arrays(dm), top_k=top_k)
 
     def transform(self, dm):
         """Run the all the transformers.
@@ -143,9 +150,91 @@ class SKCPipeline(SKCMethodABC):
             Transformed decision matrix.
 
         """
+        data = self.transform_arrays(dm_to_arrays(dm))
+        return arrays_to_dm(data, engine=dm.engine)
+
+    def fit(self, dm):
+        """Learn the parameters of all the transformers.
+
+        Every transformer is fitted with the decision matrix transformed by
+        the previous steps, so the pipeline can evaluate new alternatives
+        against the reference decision matrix.
+
+        Parameters
+        ----------
+        dm: :py:class:`skcriteria.data.DecisionMatrix`
+            The reference decision matrix.
+
+        Returns
+        -------
+        self
+            The fitted pipeline.
+
+        """
+        data = dm_to_arrays(dm)
         for _, step in self.steps[:-1]:
-            dm = step.transform(dm)
-        return dm
+            if hasattr(step, "fit_arrays"):
+                step.fit_arrays(data)
+            elif hasattr(step, "fit"):
+                step.fit(arrays_to_dm(data))
+            data = _transform_step(step, data)
+        return self
+
+    def evaluate_arrays(self, data, top_k=None):
+        """Run the all the transformers and the decision maker over arrays.
+
+        No intermediate decision matrix is created between the steps (see
+        ``SKCTransformerABC.transform_arrays()``).
+
+        Parameters
+        ----------
+        data: :py:class:`dict`
+            The data of a decision matrix as returned by
+            ``skcriteria.core.dm_to_arrays()``.
+        top_k: int or None (default ``None``)
+            If is not ``None`` only the ``top_k`` first ranked alternatives
+            are selected by the decision maker.
+
+        Returns
+        -------
+        r : Result
+            Whatever the last step (decision maker) returns from their
+            evaluate_arrays method.
+
+        """
+        data = self.transform_arrays(data)
+        _, dmaker = self.steps[-1]
+        kwargs = {} if top_k is None else {"top_k": top_k}
+        if not hasattr(dmaker, "evaluate_arrays"):
+            return dmaker.evaluate(arrays_to_dm(data), **kwargs)
+        return dmaker.evaluate_arrays(data, **kwargs)
+
+    def transform_arrays(self, data):
+        """Run the all the transformers over the arrays of a decision matrix.
+
+        Parameters
+        ----------
+        data: :py:class:`dict`
+            The data of a decision matrix as returned by
+            ``skcriteria.core.dm_to_arrays()``.
+
+        Returns
+        -------
+        :py:class:`dict`
+            The transformed data.
+
+        """
+        # the matrices created by the steps are only referenced by the
+        # pipeline, so the next steps can transform them in place
+        owned = False
+        for _, step in self.steps[:-1]:
+            matrix = data["matrix"]
+            if owned and getattr(step, "_skcriteria_matrix_out", False):
+                data = step.transform_arrays(data, out=matrix)
+            else:
+                data = _transform_step(step, data)
+            owned = _is_owned(data["matrix"], matrix, owned)
+        return data
 
 
 # =============================================================================
@@ -153,6 +242,25 @@ class SKCPipeline(SKCMethodABC):
 # =============================================================================
 
 
+def _transform_step(step, data):
+    """Run a transformer over arrays, through a decision matrix if needed."""
+    if hasattr(step, "transform_arrays"):
+        return step.transform_arrays(data)
+    return dm_to_arrays(step.transform(arrays_to_dm(data)))
+
+
+def _is_owned(matrix, previous, owned):
+    """Check if a step returned a matrix that can be overwritten."""
+    if matrix is previous:
+        return owned
+    return (
+        isinstance(matrix, np.ndarray)
+        and matrix.dtype.kind == "f"
+        and matrix.flags.writeable
+        and matrix.flags.owndata
+    )
+
+
 def _name_steps(steps):
     """Generate names for steps."""
     # Based on sklearn.pipeline._name_estimators
@@ -18,6 +18,7 @@
 import numpy as np
 
 from ..core import Objective, SKCTransformerABC
+from ..core.options import as_float_array
 from ..utils import doc_inherit
 
 # =============================================================================
@@ -25,7 +26,7 @@ from ..utils import doc_inherit
 # =============================================================================
 
 
-def cenit_distance(matrix, objectives):
+def cenit_distance(matrix, objectives, stats=None):
     r"""Calculate a scores with respect to an ideal and anti-ideal alternative.
 
     For every criterion :math:`f` of this multicriteria problem we define a
@@ -43,11 +44,18 @@ def cenit_distance(matrix, objectives):
 
         x_{aj} = \frac{f_j(a) - f_{j^*}}{f_{j}^* - f_{j^*}}
 
+    If the cached statistics of the matrix (``stats``) are provided, the
+    minimum and maximum of every criteria are not computed again.
+
     """
-    matrix = np.asarray(matrix, dtype=float)
+    matrix = as_float_array(matrix)
 
-    maxs = np.max(matrix, axis=0)
-    mins = np.min(matrix, axis=0)
+    if stats is None:
+        maxs = np.max(matrix, axis=0)
+        mins = np.min(matrix, axis=0)
+    else:
+        maxs = stats.maxs.astype(matrix.dtype, copy=False)
+        mins = stats.mins.astype(matrix.dtype, copy=False)
 
     where_max = np.equal(objectives, Objective.MAX.value)
 
@@ -82,12 +90,14 @@ class CenitDistance(SKCTransformerABC):
 
     """
 
+    _skcriteria_fit_stats = ("mins", "maxs")
+
     @doc_inherit(SKCTransformerABC._transform_data)
-    def _transform_data(self, matrix, objectives, **kwargs):
+    def _transform_data(self, matrix, objectives, stats=None, **kwargs):
 
-        distance_mtx = cenit_distance(matrix, objectives)
+        distance_mtx = cenit_distance(matrix, objectives, stats=stats)
 
-        dtypes = np.full(np.shape(objectives), float)
+        dtypes = np.full(np.shape(objectives), distance_mtx.dtype)
 
         kwargs.update(
             matrix=distance_mtx, objectives=objectives, dtypes=dtypes
@@ -24,6 +24,7 @@ to add value to zero on an array along an arbitrary axis.
 import numpy as np
 
 from ..core import SKCMatrixAndWeightTransformerABC
+from ..core.options import float_dtype
 from ..utils import doc_inherit
 
 # =============================================================================
@@ -31,7 +32,7 @@ from ..utils import doc_inherit
 # =============================================================================
 
 
-def add_value_to_zero(arr, value, axis=None):
+def add_value_to_zero(arr, value, axis=None, out=None):
     r"""Add value if the axis has a value 0.
 
     .. math::
@@ -46,6 +47,10 @@ def add_value_to_zero(arr, value, axis=None):
         Number to add if the axis has a 0.
     axis : :py:class:`int` optional
         Axis along which to operate.  By default, flattened input is used.
+    out: :py:class:`numpy.ndarray` or None (default ``None``)
+        An array with the shape of ``arr`` where the result is stored. It
+        can be ``arr`` itself to increment the values in place. If is
+        ``None`` a new array is allocated.
 
     Returns
     -------
@@ -74,7 +79,10 @@ def add_value_to_zero(arr, value, axis=None):
     arr = np.asarray(arr)
     zeros = np.any(arr == 0, axis=axis, keepdims=True)
     increment = zeros * value
-    return arr + increment
+    if increment.dtype.kind == "f":
+        # the float value doesn't promote the float32 arrays to float64
+        increment = increment.astype(float_dtype(arr.dtype), copy=False)
+    return np.add(arr, increment, out=out)
 
 
 class AddValueToZero(SKCMatrixAndWeightTransformerABC):
@@ -101,8 +109,10 @@ class AddValueToZero(SKCMatrixAndWeightTransformerABC):
 
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_weights)
     def _transform_weights(self, weights):
-        return add_value_to_zero(weights, value=self.value, axis=None)
+        return add_value_to_zero(weights, value=self.value, axis=-1)
 
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_matrix)
-    def _transform_matrix(self, matrix):
-        return add_value_to_zero(matrix, value=self.value, axis=0)
+    def _transform_matrix(self, matrix, stats=None, out=None):
+        return add_value_to_zero(
+            matrix, value=self.value, axis=-2, out=out
+        )
@@ -24,6 +24,7 @@ that inverts columns of a matrix based on a mask.
 import numpy as np
 
 from ..core import Objective, SKCTransformerABC
+from ..core.options import as_float_array
 from ..utils import doc_inherit
 
 # =============================================================================
@@ -72,7 +73,7 @@ def invert(matrix, mask):
                [4. , 0.2, 6. ]]
 
     """
-    inv_mtx = np.array(matrix, dtype=float)
+    inv_mtx = as_float_array(matrix, copy=True)
 
     inverted_values = 1.0 / inv_mtx[:, mask]
     inv_mtx[:, mask] = inverted_values
@@ -89,7 +90,8 @@ class MinimizeToMaximize(SKCTransformerABC):
     Notes
     -----
     All the dtypes of the decision matrix are preserved except the inverted
-    ones thar are converted to ``numpy.float64``.
+    ones thar are converted to ``numpy.float64`` (or ``numpy.float32``
+    if the matrix or the ``precision`` option are in single precision).
 
     """
 
@@ -29,7 +29,7 @@ from ..utils import doc_inherit
 # =============================================================================
 
 
-def push_negatives(arr, axis):
+def push_negatives(arr, axis, stats=None, out=None):
     r"""Increment the array until all the valuer are sean >= 0.
 
     If an array has negative values this function increment the values
@@ -49,6 +49,13 @@ def push_negatives(arr, axis):
         A array with values
     axis : :py:class:`int` optional
         Axis along which to operate.  By default, flattened input is used.
+    stats: :py:class:`skcriteria.core.stats.CriteriaStats` or None
+        Cached statistics of ``arr`` along the axis ``axis`` (the
+        alternatives). If is ``None`` the minimums are computed.
+    out: :py:class:`numpy.ndarray` or None (default ``None``)
+        An array with the shape of ``arr`` where the result is stored. It
+        can be ``arr`` itself to increment the values in place. If is
+        ``None`` a new array is allocated.
 
     Returns
     -------
@@ -83,9 +90,12 @@ def push_negatives(arr, axis):
 
     """
     arr = np.asarray(arr)
-    mins = np.min(arr, axis=axis, keepdims=True)
+    if stats is None:
+        mins = np.min(arr, axis=axis, keepdims=True)
+    else:
+        mins = stats.keepdims("mins")
     delta = (mins < 0) * mins
-    return arr - delta
+    return np.subtract(arr, delta, out=out)
 
 
 class PushNegatives(SKCMatrixAndWeightTransformerABC):
@@ -105,10 +115,12 @@ class PushNegatives(SKCMatrixAndWeightTransformerABC):
 
     """
 
+    _skcriteria_fit_stats = ("mins",)
+
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_weights)
     def _transform_weights(self, weights):
-        return push_negatives(weights, axis=None)
+        return push_negatives(weights, axis=-1)
 
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_matrix)
-    def _transform_matrix(self, matrix):
-        return push_negatives(matrix, axis=0)
+    def _transform_matrix(self, matrix, stats=None, out=None):
+        return push_negatives(matrix, axis=-2, stats=stats, out=out)
@@ -13,6 +13,15 @@
 In addition to the Transformers, a collection of an MCDA agnostic functions
 are offered to scale an array along an arbitrary axis.
 
+All the scale functions accept an ``out`` array to store the result, so a
+big matrix can be scaled in place (``out=arr``) or into a buffer owned by
+the caller without allocating a new matrix.
+
+The missing values (NaN) are ignored to compute the scale factors and stay
+missing in the scaled array. The scalers that only divide the values (by the
+sum, the maximum or the norm) also accept :py:mod:`scipy.sparse` matrices,
+and return a sparse matrix with the same zeros.
+
 """
 
 
@@ -22,17 +31,75 @@ are offered to scale an array along an arbitrary axis.
 
 
 import numpy as np
-from numpy import linalg
+
+from scipy import sparse
+from scipy.sparse import linalg as sparse_linalg
 
 from ..core import SKCMatrixAndWeightTransformerABC
-from ..utils import doc_inherit
+from ..core.options import as_float_array, float_dtype
+from ..utils import doc_inherit, nanops
+
+
+# =============================================================================
+# SPARSE
+# =============================================================================
+
+
+def _scale_sparse(arr, axis, reduce, factors=None, out=None):
+    """Divide the stored values of a sparse matrix by a reduction.
+
+    ``reduce(arr, axis)`` returns the factors along the ``axis`` (if the
+    ``factors`` are not given). Only the stored values are divided, so the
+    zeros (and the sparsity) are kept.
+
+    """
+    if out is not None:
+        raise ValueError("'out' is not supported with sparse matrices")
+
+    arr = arr.astype(float_dtype(arr.dtype))
+    if arr.format not in ("csr", "csc"):
+        arr = arr.tocsr()
+
+    if factors is None:
+        factors = reduce(arr, axis)
+    factors = np.asarray(factors, dtype=arr.dtype).ravel()
+    if axis is None:
+        divisors = factors
+    elif (axis % 2 == 0) == (arr.format == "csr"):
+        # the factor of every value is given by their index (the column in
+        # a CSR matrix or the row in a CSC matrix)
+        divisors = factors[arr.indices]
+    else:
+        divisors = np.repeat(factors, np.diff(arr.indptr))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        data = arr.data / divisors
+    return type(arr)((data, arr.indices, arr.indptr), shape=arr.shape)
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+
+def _float_input(arr, out):
+    """Return the array to scale and the dtype of the result.
+
+    With an output array the ufuncs convert the values to float while they
+    are written, so no float copy of ``arr`` is made.
+
+    """
+    if out is None:
+        arr = as_float_array(arr)
+        return arr, arr.dtype
+    return np.asarray(arr), out.dtype
 
 # =============================================================================
 # STANDAR SCALER
 # =============================================================================
 
 
-def scale_by_stdscore(arr, axis=None):
+def scale_by_stdscore(arr, axis=None, stats=None, out=None):
     r"""Standardize the values by removing the mean and divided by the std-dev.
 
     The standard score of a sample `x` is calculated as:
@@ -47,6 +114,13 @@ def scale_by_stdscore(arr, axis=None):
         A array with values
     axis : :py:class:`int` optional
         Axis along which to operate.  By default, flattened input is used.
+    stats: :py:class:`skcriteria.core.stats.CriteriaStats` or None
+        Cached statistics of ``arr`` along the axis ``axis`` (the
+        alternatives). If is ``None`` the statistics are computed.
+    out: :py:class:`numpy.ndarray` or None (default ``None``)
+        A float array with the shape of ``arr`` where the result is stored.
+        It can be ``arr`` itself to scale the values in place. If is
+        ``None`` a new array is allocated.
 
     Returns
     -------
@@ -76,10 +150,15 @@ def scale_by_stdscore(arr, axis=None):
                [-1.,  1.]])
 
     """
-    arr = np.asarray(arr, dtype=float)
-    mean = np.mean(arr, axis=axis, keepdims=True)
-    std = np.std(arr, axis=axis, keepdims=True)
-    return (arr - mean) / std
+    arr, dtype = _float_input(arr, out)
+    if stats is None:
+        mean = nanops.nanmean(arr, axis=axis, keepdims=True)
+        std = nanops.nanstd(arr, axis=axis, keepdims=True)
+    else:
+        mean = stats.keepdims("mean", dtype=dtype)
+        std = stats.keepdims("std", dtype=dtype)
+    result = np.subtract(arr, mean, out=out)
+    return np.divide(result, std, out=result)
 
 
 class StandarScaler(SKCMatrixAndWeightTransformerABC):
@@ -94,13 +173,15 @@ class StandarScaler(SKCMatrixAndWeightTransformerABC):
 
     """
 
+    _skcriteria_fit_stats = ("mean", "std")
+
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_weights)
     def _transform_weights(self, weights):
-        return scale_by_stdscore(weights, axis=None)
+        return scale_by_stdscore(weights, axis=-1)
 
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_matrix)
-    def _transform_matrix(self, matrix):
-        return scale_by_stdscore(matrix, axis=0)
+    def _transform_matrix(self, matrix, stats=None, out=None):
+        return scale_by_stdscore(matrix, axis=-2, stats=stats, out=out)
 
 
 # =============================================================================
@@ -108,7 +189,7 @@ class StandarScaler(SKCMatrixAndWeightTransformerABC):
 # =============================================================================
 
 
-def scale_by_vector(arr, axis=None):
+def scale_by_vector(arr, axis=None, stats=None, out=None):
     r"""Divide the array by norm of values defined vector along an axis.
 
     Calculates the set of ratios as the square roots of the sum of squared
@@ -126,6 +207,13 @@ def scale_by_vector(arr, axis=None):
         A array with values
     axis : :py:class:`int` optional
         Axis along which to operate.  By default, flattened input is used.
+    stats: :py:class:`skcriteria.core.stats.CriteriaStats` or None
+        Cached statistics of ``arr`` along the axis ``axis`` (the
+        alternatives). If is ``None`` the statistics are computed.
+    out: :py:class:`numpy.ndarray` or None (default ``None``)
+        A float array with the shape of ``arr`` where the result is stored.
+        It can be ``arr`` itself to scale the values in place. If is
+        ``None`` a new array is allocated.
 
     Returns
     -------
@@ -155,9 +243,21 @@ def scale_by_vector(arr, axis=None):
                [ 0.60000002,  0.80000001]])
 
     """
-    arr = np.asarray(arr, dtype=float)
-    frob = linalg.norm(arr, None, axis=axis)
-    return arr / frob
+    if sparse.issparse(arr):
+        return _scale_sparse(
+            arr,
+            axis,
+            lambda a, ax: sparse_linalg.norm(a, axis=ax),
+            factors=None if stats is None else stats.norm,
+            out=out,
+        )
+
+    arr, dtype = _float_input(arr, out)
+    if stats is None:
+        frob = nanops.nannorm(arr, axis=axis, keepdims=True)
+    else:
+        frob = stats.keepdims("norm", dtype=dtype)
+    return np.divide(arr, frob, out=out)
 
 
 class VectorScaler(SKCMatrixAndWeightTransformerABC):
@@ -177,13 +277,16 @@ class VectorScaler(SKCMatrixAndWeightTransformerABC):
 
     """
 
+    _skcriteria_supports_sparse = True
+    _skcriteria_fit_stats = ("norm",)
+
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_weights)
     def _transform_weights(self, weights):
-        return scale_by_vector(weights, axis=None)
+        return scale_by_vector(weights, axis=-1)
 
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_matrix)
-    def _transform_matrix(self, matrix):
-        return scale_by_vector(matrix, axis=0)
+    def _transform_matrix(self, matrix, stats=None, out=None):
+        return scale_by_vector(matrix, axis=-2, stats=stats, out=out)
 
 
 # =============================================================================
@@ -191,7 +294,7 @@ class VectorScaler(SKCMatrixAndWeightTransformerABC):
 # =============================================================================
 
 
-def scale_by_minmax(arr, axis=None):
+def scale_by_minmax(arr, axis=None, stats=None, out=None):
     r"""Fraction of the range normalizer.
 
     Subtracts to each value of the array the minimum and then divides
@@ -208,6 +311,13 @@ def scale_by_minmax(arr, axis=None):
         A array with values
     axis : :py:class:`int` optional
         Axis along which to operate.  By default, flattened input is used.
+    stats: :py:class:`skcriteria.core.stats.CriteriaStats` or None
+        Cached statistics of ``arr`` along the axis ``axis`` (the
+        alternatives). If is ``None`` the statistics are computed.
+    out: :py:class:`numpy.ndarray` or None (default ``None``)
+        A float array with the shape of ``arr`` where the result is stored.
+        It can be ``arr`` itself to scale the values in place. If is
+        ``None`` a new array is allocated.
 
     Returns
     -------
@@ -238,10 +348,15 @@ def scale_by_minmax(arr, axis=None):
               [0., 1.]])
 
     """
-    arr = np.asarray(arr, dtype=float)
-    minval = np.min(arr, axis=axis, keepdims=True)
-    maxval = np.max(arr, axis=axis, keepdims=True)
-    return (arr - minval) / (maxval - minval)
+    arr, dtype = _float_input(arr, out)
+    if stats is None:
+        minval = nanops.nanmin(arr, axis=axis, keepdims=True)
+        maxval = nanops.nanmax(arr, axis=axis, keepdims=True)
+    else:
+        minval = stats.keepdims("mins", dtype=dtype)
+        maxval = stats.keepdims("maxs", dtype=dtype)
+    result = np.subtract(arr, minval, out=out)
+    return np.divide(result, maxval - minval, out=result)
 
 
 class MinMaxScaler(SKCMatrixAndWeightTransformerABC):
@@ -259,13 +374,15 @@ class MinMaxScaler(SKCMatrixAndWeightTransformerABC):
 
     """
 
+    _skcriteria_fit_stats = ("mins", "maxs")
+
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_weights)
     def _transform_weights(self, weights):
-        return scale_by_minmax(weights, axis=None)
+        return scale_by_minmax(weights, axis=-1)
 
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_matrix)
-    def _transform_matrix(self, matrix):
-        return scale_by_minmax(matrix, axis=0)
+    def _transform_matrix(self, matrix, stats=None, out=None):
+        return scale_by_minmax(matrix, axis=-2, stats=stats, out=out)
 
 
 # =============================================================================
@@ -273,7 +390,7 @@ class MinMaxScaler(SKCMatrixAndWeightTransformerABC):
 # =============================================================================
 
 
-def scale_by_sum(arr, axis=None):
+def scale_by_sum(arr, axis=None, stats=None, out=None):
     r"""Divide of every value on the array by sum of values along an axis.
 
     .. math::
@@ -286,6 +403,13 @@ def scale_by_sum(arr, axis=None):
         A array with values
     axis : :py:class:`int` optional
         Axis along which to operate.  By default, flattened input is used.
+    stats: :py:class:`skcriteria.core.stats.CriteriaStats` or None
+        Cached statistics of ``arr`` along the axis ``axis`` (the
+        alternatives). If is ``None`` the statistics are computed.
+    out: :py:class:`numpy.ndarray` or None (default ``None``)
+        A float array with the shape of ``arr`` where the result is stored.
+        It can be ``arr`` itself to scale the values in place. If is
+        ``None`` a new array is allocated.
 
     Returns
     -------
@@ -314,9 +438,21 @@ def scale_by_sum(arr, axis=None):
                [ 0.42857143,  0.5714286 ]])
 
     """
-    arr = np.asarray(arr, dtype=float)
-    sumval = np.sum(arr, axis=axis, keepdims=True)
-    return arr / sumval
+    if sparse.issparse(arr):
+        return _scale_sparse(
+            arr,
+            axis,
+            lambda a, ax: a.sum(axis=ax),
+            factors=None if stats is None else stats.sums,
+            out=out,
+        )
+
+    arr, dtype = _float_input(arr, out)
+    if stats is None:
+        sumval = nanops.nansum(arr, axis=axis, keepdims=True)
+    else:
+        sumval = stats.keepdims("sums", dtype=dtype)
+    return np.divide(arr, sumval, out=out)
 
 
 class SumScaler(SKCMatrixAndWeightTransformerABC):
@@ -334,13 +470,16 @@ class SumScaler(SKCMatrixAndWeightTransformerABC):
 
     """
 
+    _skcriteria_supports_sparse = True
+    _skcriteria_fit_stats = ("sums",)
+
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_weights)
     def _transform_weights(self, weights):
-        return scale_by_sum(weights, axis=None)
+        return scale_by_sum(weights, axis=-1)
 
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_matrix)
-    def _transform_matrix(self, matrix):
-        return scale_by_sum(matrix, axis=0)
+    def _transform_matrix(self, matrix, stats=None, out=None):
+        return scale_by_sum(matrix, axis=-2, stats=stats, out=out)
 
 
 # =============================================================================
@@ -348,7 +487,7 @@ class SumScaler(SKCMatrixAndWeightTransformerABC):
 # =============================================================================
 
 
-def scale_by_max(arr, axis=None):
+def scale_by_max(arr, axis=None, stats=None, out=None):
     r"""Divide of every value on the array by max value along an axis.
 
     .. math::
@@ -361,6 +500,13 @@ def scale_by_max(arr, axis=None):
         A array with values
     axis : :py:class:`int` optional
         Axis along which to operate.  By default, flattened input is used.
+    stats: :py:class:`skcriteria.core.stats.CriteriaStats` or None
+        Cached statistics of ``arr`` along the axis ``axis`` (the
+        alternatives). If is ``None`` the statistics are computed.
+    out: :py:class:`numpy.ndarray` or None (default ``None``)
+        A float array with the shape of ``arr`` where the result is stored.
+        It can be ``arr`` itself to scale the values in place. If is
+        ``None`` a new array is allocated.
 
     Returns
     -------
@@ -390,9 +536,26 @@ def scale_by_max(arr, axis=None):
                [ 0.75,  1.]])
 
     """
-    arr = np.asarray(arr, dtype=float)
-    maxval = np.max(arr, axis=axis, keepdims=True)
-    return arr / maxval
+    if sparse.issparse(arr):
+        return _scale_sparse(
+            arr,
+            axis,
+            _sparse_max,
+            factors=None if stats is None else stats.maxs,
+            out=out,
+        )
+
+    arr, dtype = _float_input(arr, out)
+    if stats is None:
+        maxval = nanops.nanmax(arr, axis=axis, keepdims=True)
+    else:
+        maxval = stats.keepdims("maxs", dtype=dtype)
+    return np.divide(arr, maxval, out=out)
+
+
+def _sparse_max(arr, axis):
+    maxval = arr.max(axis=axis)
+    return maxval.toarray() if sparse.issparse(maxval) else maxval
 
 
 class MaxScaler(SKCMatrixAndWeightTransformerABC):
@@ -409,10 +572,13 @@ class MaxScaler(SKCMatrixAndWeightTransformerABC):
 
     """
 
+    _skcriteria_supports_sparse = True
+    _skcriteria_fit_stats = ("maxs",)
+
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_weights)
     def _transform_weights(self, weights):
-        return scale_by_max(weights, axis=None)
+        return scale_by_max(weights, axis=-1)
 
     @doc_inherit(SKCMatrixAndWeightTransformerABC._transform_matrix)
-    def _transform_matrix(self, matrix):
-        return scale_by_max(matrix, axis=0)
+    def _transform_matrix(self, matrix, stats=None, out=None):
+        return scale_by_max(matrix, axis=-2, stats=stats, out=out)
@@ -25,11 +25,13 @@ import warnings
 import numpy as np
 
 import scipy.stats
+from scipy import sparse
 
 
 from .distance import cenit_distance
 from ..core import Objective, SKCWeighterABC
-from ..utils import doc_inherit
+from ..core.options import as_float_array, float_dtype
+from ..utils import doc_inherit, nanops
 
 
 # =============================================================================
@@ -51,7 +53,7 @@ def equal_weights(matrix, base_value=1):
 
     Parameters
     ----------
-    matrix: :py:class:`numpy.ndarray` like.
+    matrix: :py:class:`numpy.ndarray` like or :py:mod:`scipy.sparse` matrix.
         The matrix of alternatives on which to calculate weights.
     base_value: int or float.
         Value to be normalized by the number of criteria to create the weights.
@@ -74,7 +76,10 @@ def equal_weights(matrix, base_value=1):
     """
     ncriteria = np.shape(matrix)[1]
     weights = base_value / ncriteria
-    return np.full(ncriteria, weights, dtype=float)
+    dtype = float_dtype(
+        matrix.dtype if sparse.issparse(matrix) else np.asarray(matrix).dtype
+    )
+    return np.full(ncriteria, weights, dtype=dtype)
 
 
 class EqualWeighter(SKCWeighterABC):
@@ -85,6 +90,8 @@ class EqualWeighter(SKCWeighterABC):
 
     """
 
+    _skcriteria_supports_sparse = True
+
     def __init__(self, base_value=1):
         self.base_value = base_value
 
@@ -107,7 +114,7 @@ class EqualWeighter(SKCWeighterABC):
 # =============================================================================
 
 
-def std_weights(matrix):
+def std_weights(matrix, stats=None):
     r"""Calculate weights as the standard deviation of each criterion.
 
     The result is normalized by the number of columns.
@@ -120,8 +127,11 @@ def std_weights(matrix):
 
     Parameters
     ----------
-    matrix: :py:class:`numpy.ndarray` like.
+    matrix: :py:class:`numpy.ndarray` like or :py:mod:`scipy.sparse` matrix.
         The matrix of alternatives on which to calculate weights.
+    stats: :py:class:`skcriteria.core.stats.CriteriaStats` or None
+        Cached statistics of the matrix. If is ``None`` the standard
+        deviations are computed.
 
     Returns
     -------
@@ -139,16 +149,23 @@ def std_weights(matrix):
          array([0.5, 0.5])
 
     """
-    std = np.std(matrix, axis=0)
+    if stats is not None:
+        std = stats.std
+    elif sparse.issparse(matrix):
+        std = nanops.nanstd(matrix, axis=0)
+    else:
+        std = np.std(matrix, axis=0)
     return std / np.sum(std)
 
 
 class StdWeighter(SKCWeighterABC):
     """Set as weight the normalized standard deviation of each criterion."""
 
+    _skcriteria_supports_sparse = True
+
     @doc_inherit(SKCWeighterABC._weight_matrix)
-    def _weight_matrix(self, matrix, **kwargs):
-        return std_weights(matrix)
+    def _weight_matrix(self, matrix, stats=None, **kwargs):
+        return std_weights(matrix, stats=stats)
 
 
 # =============================================================================
@@ -260,13 +277,21 @@ def spearman_correlation(arr):
 
 
 def critic_weights(
-    matrix, objectives, correlation=pearson_correlation, scale=True
+    matrix, objectives, correlation=pearson_correlation, scale=True, stats=None
 ):
-    """Execute the CRITIC method without any validation."""
-    matrix = np.asarray(matrix, dtype=float)
-    matrix = cenit_distance(matrix, objectives=objectives) if scale else matrix
+    """Execute the CRITIC method without any validation.
 
-    dindex = np.std(matrix, axis=0)
+    ``stats`` are the optional cached statistics of the matrix.
+
+    """
+    matrix = as_float_array(matrix)
+    if scale:
+        matrix = cenit_distance(matrix, objectives=objectives, stats=stats)
+        dindex = np.std(matrix, axis=0)
+    elif stats is None:
+        dindex = np.std(matrix, axis=0)
+    else:
+        dindex = stats.std
 
     corr_m1 = 1 - correlation(matrix.T)
     uweights = dindex * np.sum(corr_m1, axis=0)
@@ -343,7 +368,7 @@ class Critic(SKCWeighterABC):
         self._correlation = correlation_func
 
     @doc_inherit(SKCWeighterABC._weight_matrix)
-    def _weight_matrix(self, matrix, objectives, **kwargs):
+    def _weight_matrix(self, matrix, objectives, stats=None, **kwargs):
         if Objective.MIN.value in objectives:
             warnings.warn(
                 "Although CRITIC can operate with minimization objectives, "
@@ -352,5 +377,9 @@ class Critic(SKCWeighterABC):
             )
 
         return critic_weights(
-            matrix, objectives, correlation=self.correlation, scale=self.scale
+            matrix,
+            objectives,
+            correlation=self.correlation,
+            scale=self.scale,
+            stats=stats,
         )
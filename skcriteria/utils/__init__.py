@@ -14,7 +14,7 @@
 # IMPORTS
 # =============================================================================
 
-from . import lp, rank
+from . import archive, buffer, chunks, lp, nanops, rank
 from .bunch import Bunch
 from .decorators import doc_inherit
 
@@ -22,4 +22,14 @@ from .decorators import doc_inherit
 # ALL
 # =============================================================================
 
-__all__ = ["doc_inherit", "rank", "Bunch", "lp", "dominance"]
+__all__ = [
+    "doc_inherit",
+    "rank",
+    "Bunch",
+    "lp",
+    "dominance",
+    "chunks",
+    "archive",
+    "buffer",
+    "nanops",
+]
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Binary container of numpy arrays with a small JSON header.
+
+The container is an uncompressed zip file (like the ones created by
+:py:func:`numpy.savez`) with a ``header.json`` member and one ``.npy`` member
+for every array. Because the members are not compressed, the arrays can be
+memory mapped directly from the container.
+
+"""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import json
+import struct
+import zipfile
+
+import numpy as np
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+#: Name of the member with the header.
+HEADER_NAME = "header.json"
+
+_NPY_SUFFIX = ".npy"
+
+# size of the fixed part of the zip local file header
+_LOCAL_HEADER_SIZE = 30
+
+# the modes that create the file ("w+") would overwrite the container
+_MMAP_MODES = ("r", "r+", "c")
+
+
+# =============================================================================
+# WRITE
+# =============================================================================
+
+
+def save_arrays(path, header, arrays):
+    """Write a container with a header and a collection of arrays.
+
+    Parameters
+    ----------
+    path: str or path-like or file-like
+        Where to write the container.
+    header: dict
+        JSON serializable metadata.
+    arrays: dict
+        Mapping of names to :py:class:`numpy.ndarray`. The arrays can't have
+        python objects as dtype.
+
+    """
+    with zipfile.ZipFile(path, mode="w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr(HEADER_NAME, json.dumps(header))
+        for name, arr in arrays.items():
+            with zf.open(name + _NPY_SUFFIX, mode="w", force_zip64=True) as fp:
+                np.lib.format.write_array(
+                    fp, np.asanyarray(arr), allow_pickle=False
+                )
+
+
+# =============================================================================
+# READ
+# =============================================================================
+
+
+def _member_data_offset(fp, info):
+    """Offset of the first byte of the data of a zip member."""
+    fp.seek(info.header_offset)
+    local_header = fp.read(_LOCAL_HEADER_SIZE)
+    name_len, extra_len = struct.unpack("<HH", local_header[26:30])
+    return info.header_offset + _LOCAL_HEADER_SIZE + name_len + extra_len
+
+
+def _memmap_member(path, fp, info, mmap_mode):
+    """Memory map a ``.npy`` member stored without compression."""
+    fp.seek(_member_data_offset(fp, info))
+
+    version = np.lib.format.read_magic(fp)
+    read_header = (
+        np.lib.format.read_array_header_1_0
+        if version == (1, 0)
+        else np.lib.format.read_array_header_2_0
+    )
+    shape, fortran_order, dtype = read_header(fp)
+
+    # numpy can't create memmaps of 0 bytes
+    if not np.prod(shape, dtype=int):
+        return np.empty(shape, dtype=dtype)
+
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode=mmap_mode,
+        offset=fp.tell(),
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+def load_arrays(path, mmap_mode=None):
+    """Read a container created with ``save_arrays()``.
+
+    Parameters
+    ----------
+    path: str or path-like
+        Path of the container.
+    mmap_mode: None or str (default ``None``)
+        If is not ``None`` the arrays are memory mapped from the container
+        with the given mode (``"r"``, ``"r+"`` or ``"c"``, see
+        :py:class:`numpy.memmap`), otherwise the arrays are read in memory.
+
+    Returns
+    -------
+    header: dict
+        The metadata of the container.
+    arrays: dict
+        Mapping of names to the arrays.
+
+    """
+    if mmap_mode is not None and mmap_mode not in _MMAP_MODES:
+        raise ValueError(
+            f"'mmap_mode' must be None, 'r', 'r+' or 'c', found {mmap_mode!r}"
+        )
+
+    arrays = {}
+    with zipfile.ZipFile(path, mode="r") as zf:
+        header = json.loads(zf.read(HEADER_NAME))
+
+        for info in zf.infolist():
+            if not info.filename.endswith(_NPY_SUFFIX):
+                continue
+            name = info.filename[: -len(_NPY_SUFFIX)]
+
+            if mmap_mode is not None and info.compress_type == 0:
+                with open(path, "rb") as fp:
+                    arr = _memmap_member(path, fp, info, mmap_mode)
+            else:
+                with zf.open(info) as fp:
+                    arr = np.lib.format.read_array(fp, allow_pickle=False)
+
+            arrays[name] = arr
+
+    return header, arrays
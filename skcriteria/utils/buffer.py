@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Growable buffer of rows shared by many read-only views."""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+#: Factor by which the capacity of a full buffer is increased.
+GROWTH_FACTOR = 1.5
+
+
+# =============================================================================
+# BUFFER
+# =============================================================================
+
+
+class RowBuffer:
+    """Array with spare capacity to append rows in amortized O(k) time.
+
+    Many read-only views of different lengths can share the same buffer (like
+    the slices in Go). New rows are written in place only when they are
+    appended after the longest view created so far (the "high-water mark"),
+    so the rows seen by the existing views never change. Otherwise, or when
+    the capacity is exhausted, the rows are copied to a new buffer.
+
+    Parameters
+    ----------
+    arr: array like
+        The initial rows of the buffer.
+    capacity: int or None (default ``None``)
+        Number of rows to allocate. If is ``None`` or is less than the number
+        of rows of ``arr``, the buffer has no spare capacity.
+
+    """
+
+    def __init__(self, arr, capacity=None):
+        arr = np.asarray(arr)
+        size = len(arr)
+        capacity = size if capacity is None else max(int(capacity), size)
+
+        self._data = np.empty((capacity,) + arr.shape[1:], dtype=arr.dtype)
+        self._data[:size] = arr
+        self._size = size
+
+    @property
+    def capacity(self):
+        """Number of rows allocated."""
+        return len(self._data)
+
+    @property
+    def size(self):
+        """Number of rows in use by the longest view (high-water mark)."""
+        return self._size
+
+    @property
+    def dtype(self):
+        """Dtype of the buffer."""
+        return self._data.dtype
+
+    def view(self, length=None):
+        """Return a read-only view of the first ``length`` rows.
+
+        If ``length`` is ``None`` all the rows in use are returned.
+
+        """
+        length = self._size if length is None else length
+        view = self._data[:length]
+        view.flags.writeable = False
+        return view
+
+    def extend(self, length, rows):
+        """Write ``rows`` after the first ``length`` rows.
+
+        Parameters
+        ----------
+        length: int
+            Number of rows of the view to extend.
+        rows: array like
+            The new rows.
+
+        Returns
+        -------
+        :py:class:`RowBuffer`
+            This buffer if the rows were written in place, otherwise a new
+            buffer with the first ``length`` rows followed by ``rows``.
+
+        """
+        rows = np.asarray(rows)
+        new_length = length + len(rows)
+        dtype = np.result_type(self._data.dtype, rows.dtype)
+
+        if (
+            length == self._size
+            and new_length <= self.capacity
+            and dtype == self._data.dtype
+        ):
+            buffer = self
+        else:
+            capacity = max(new_length, int(self.capacity * GROWTH_FACTOR))
+            buffer = RowBuffer(
+                self._data[:length].astype(dtype, copy=False), capacity
+            )
+
+        buffer._data[length:new_length] = rows
+        buffer._size = new_length
+        return buffer
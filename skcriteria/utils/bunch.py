@@ -64,6 +64,15 @@ class Bunch(Mapping):
         except KeyError:
             raise AttributeError(a)
 
+    def __setstate__(self, state):
+        """Restore the state of an unpickled bunch.
+
+        Defined explicitly so pickle doesn't look for ``__setstate__``
+        through ``__getattr__`` before ``_data`` exists.
+
+        """
+        self.__dict__.update(state)
+
     def __iter__(self):
         """x.__iter__() <==> iter(x)."""
         return iter(self._data)
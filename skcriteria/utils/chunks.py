@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Helpers to process big arrays by blocks of rows."""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+#: Default maximum number of elements processed in every block.
+CHUNK_SIZE = 2**20
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def row_chunks(arr, chunk_size=None):
+    """Iterate over slices of consecutive rows of an array.
+
+    Every slice selects as many rows as possible without exceeding
+    ``chunk_size`` elements (but at least one row). This is useful to
+    bound the size of the temporary arrays, or to read a memory mapped array
+    page by page.
+
+    Parameters
+    ----------
+    arr: :py:class:`numpy.ndarray` like.
+        The array to split. Only the shape is used.
+    chunk_size: int or None (default ``None``)
+        Maximum number of elements of every block. If is ``None``
+        ``CHUNK_SIZE`` is used.
+
+    Yields
+    ------
+    slice
+        The slice of rows of every block.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from skcriteria.utils.chunks import row_chunks
+        >>> list(row_chunks(np.ones((5, 2)), chunk_size=4))
+        [slice(0, 2, None), slice(2, 4, None), slice(4, 5, None)]
+
+    """
+    chunk_size = CHUNK_SIZE if chunk_size is None else int(chunk_size)
+    shape = np.shape(arr)
+    rows = shape[0] if shape else 0
+    row_size = int(np.prod(shape[1:], dtype=int))
+    step = max(1, chunk_size // max(1, row_size))
+    for start in range(0, rows, step):
+        yield slice(start, min(start + step, rows))
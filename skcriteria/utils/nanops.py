@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Reductions that ignore the missing values (NaN) of a matrix.
+
+The missing values of a decision matrix are stored as NaN. Every function
+of this module first computes the plain numpy reduction, and only the
+elements of the result that are NaN are computed again with the slower
+``numpy.nan*`` functions. So the arrays without missing values pay no extra
+cost and get exactly the same result as with the plain numpy function.
+
+The reductions along the rows (``axis=0`` or ``axis=-2``) also accept a
+:py:mod:`scipy.sparse` matrix, and only reduce their stored values (the
+implicit zeros are never densified).
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+from numpy import linalg
+
+from scipy import sparse
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _fix_nan(result, nanfunc):
+    # recompute with nanfunc only if the fast reduction found a missing value
+    if np.result_type(result).kind not in "fc":
+        return result
+    missing = np.isnan(result)
+    if not missing.any():
+        return result
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(missing, nanfunc(), result)
+
+
+def _nan_to_zero(data):
+    if data.dtype.kind not in "fc":
+        return data
+    return np.where(np.isnan(data), 0, data)
+
+
+def _sparse_reduce(matrix, ufunc, axis, keepdims, values=None):
+    # reduce the stored values of every column of a sparse matrix with the
+    # ufunc, and then with the implicit zeros (if the column has any)
+    if axis not in (0, -2):
+        raise ValueError("A sparse matrix can only be reduced along the rows")
+    columns = matrix.tocsc()
+    data = columns.data if values is None else values(columns.data)
+
+    lengths = np.diff(columns.indptr)
+    stored = lengths > 0
+
+    result = np.zeros(columns.shape[1], dtype=data.dtype)
+    if stored.any():
+        result[stored] = ufunc.reduceat(data, columns.indptr[:-1][stored])
+    result = np.where(lengths < columns.shape[0], ufunc(result, 0), result)
+
+    return result[np.newaxis] if keepdims else result
+
+
+# =============================================================================
+# REDUCTIONS
+# =============================================================================
+
+
+def nanmin(arr, axis=None, keepdims=False):
+    """Minimum of an array ignoring the NaN.
+
+    The result is NaN only if all the reduced values are NaN.
+
+    """
+    if sparse.issparse(arr):
+        return _sparse_reduce(arr, np.fmin, axis, keepdims)
+    return np.fmin.reduce(np.asarray(arr), axis=axis, keepdims=keepdims)
+
+
+def nanmax(arr, axis=None, keepdims=False):
+    """Maximum of an array ignoring the NaN.
+
+    The result is NaN only if all the reduced values are NaN.
+
+    """
+    if sparse.issparse(arr):
+        return _sparse_reduce(arr, np.fmax, axis, keepdims)
+    return np.fmax.reduce(np.asarray(arr), axis=axis, keepdims=keepdims)
+
+
+def nansum(arr, axis=None, keepdims=False):
+    """Sum of an array treating the NaN as zero."""
+    if sparse.issparse(arr):
+        return _sparse_reduce(arr, np.add, axis, keepdims, _nan_to_zero)
+    return _fix_nan(
+        np.sum(arr, axis=axis, keepdims=keepdims),
+        lambda: np.nansum(arr, axis=axis, keepdims=keepdims),
+    )
+
+
+def nancount(arr, axis=None, keepdims=False):
+    """Count the values of an array that are not NaN."""
+    if sparse.issparse(arr):
+        missing = _sparse_reduce(
+            arr,
+            np.add,
+            axis,
+            keepdims,
+            lambda data: np.isnan(data).astype(np.intp)
+            if data.dtype.kind in "fc"
+            else np.zeros(len(data), dtype=np.intp),
+        )
+        return arr.shape[0] - missing
+
+    arr = np.asarray(arr)
+    size = arr.size if axis is None else arr.shape[axis]
+    missing = np.count_nonzero(np.isnan(arr), axis=axis, keepdims=keepdims)
+    return size - missing
+
+
+def nanmean(arr, axis=None, keepdims=False):
+    """Arithmetic mean of an array ignoring the NaN."""
+    if sparse.issparse(arr):
+        counts = nancount(arr, axis=axis, keepdims=keepdims)
+        sums = nansum(arr, axis=axis, keepdims=keepdims)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sums / counts
+
+    return _fix_nan(
+        np.mean(arr, axis=axis, keepdims=keepdims),
+        lambda: np.nanmean(arr, axis=axis, keepdims=keepdims),
+    )
+
+
+def nanstd(arr, axis=None, keepdims=False):
+    """Compute the standard deviation of an array ignoring the NaN.
+
+    The standard deviation of a sparse matrix is computed from the sums of
+    the values and of their squares.
+
+    """
+    if sparse.issparse(arr):
+        counts = nancount(arr, axis=axis, keepdims=keepdims)
+        sums = nansum(arr, axis=axis, keepdims=keepdims)
+        sumsq = nansum(arr.multiply(arr), axis=axis, keepdims=keepdims)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = sums / counts
+            variance = np.maximum(sumsq / counts - mean * mean, 0)
+        return np.sqrt(variance)
+
+    return _fix_nan(
+        np.std(arr, axis=axis, keepdims=keepdims),
+        lambda: np.nanstd(arr, axis=axis, keepdims=keepdims),
+    )
+
+
+def nannorm(arr, axis=None, keepdims=False):
+    """Euclidean (or Frobenius if ``axis`` is ``None``) norm ignoring NaN."""
+    arr = np.asarray(arr)
+    return _fix_nan(
+        linalg.norm(arr, None, axis=axis, keepdims=keepdims),
+        lambda: np.sqrt(np.nansum(arr * arr, axis=axis, keepdims=keepdims)),
+    )
+
+
+def nanmatvec(matrix, vector):
+    """Product of every row of a matrix with a vector treating NaN as zero.
+
+    The matrix can be also a stack of matrices with shape ``(..., n, m)``
+    and the vectors of every matrix with shape ``(..., m)``. Only the rows
+    with missing values are computed again, so a matrix with a few gaps
+    doesn't need a dense copy without NaN.
+
+    The matrix can be also a :py:mod:`scipy.sparse` matrix; the product
+    never densifies it.
+
+    """
+    vector = np.asarray(vector)
+    if sparse.issparse(matrix):
+        result = np.asarray(matrix @ vector).ravel()
+        if result.dtype.kind in "fc" and np.isnan(result).any():
+            matrix = matrix.copy()
+            matrix.data[np.isnan(matrix.data)] = 0
+            result = np.asarray(matrix @ vector).ravel()
+        return result
+
+    result = np.matmul(matrix, vector[..., np.newaxis])[..., 0]
+    if result.dtype.kind not in "fc":
+        return result
+
+    missing = np.nonzero(np.isnan(result))
+    if len(missing[0]):
+        rows = np.asarray(matrix)[missing]
+        vectors = np.broadcast_to(
+            vector[..., np.newaxis, :], np.shape(matrix)
+        )[missing]
+        result[missing] = np.nansum(rows * vectors, axis=-1)
+    return result
+
+
+def nanmatmul(matrix, other):
+    """Matrix product of a matrix with an array treating NaN as zero.
+
+    ``matrix`` has shape ``(n, m)`` (or is a :py:mod:`scipy.sparse` matrix)
+    and ``other`` shape ``(m, k)``. As in :py:func:`nanmatvec` only the
+    rows of the matrix with missing values are computed again.
+
+    """
+    other = np.asarray(other)
+    if sparse.issparse(matrix):
+        result = np.asarray(matrix @ other)
+        if result.dtype.kind in "fc" and np.isnan(result).any():
+            matrix = matrix.copy()
+            matrix.data[np.isnan(matrix.data)] = 0
+            result = np.asarray(matrix @ other)
+        return result
+
+    result = np.matmul(matrix, other)
+    if result.dtype.kind not in "fc":
+        return result
+
+    missing = np.isnan(result).any(axis=-1)
+    if missing.any():
+        rows = np.asarray(matrix)[missing]
+        result[missing] = np.matmul(np.where(np.isnan(rows), 0, rows), other)
+    return result
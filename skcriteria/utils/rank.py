@@ -26,7 +26,7 @@ from scipy import stats
 # =============================================================================
 
 
-def rank_values(arr, reverse=False):
+def rank_values(arr, reverse=False, axis=None):
     """Evaluate an array and return a 1 based ranking.
 
     Parameters
@@ -39,11 +39,16 @@ def rank_values(arr, reverse=False):
         lapse in a race or Golf scoring) if is *True* the data is highest
         values are the first.
 
+    axis : :py:class:`int` or None default *None*
+        Axis along which the ranking is computed. If is *None* the array is
+        flattened. With ``axis=-1`` every row of a 2D array (for example the
+        scores of a batch of problems) is ranked independently.
+
     Returns
     -------
     :py:class:`numpy.ndarray`
-        Array of rankings the i-nth element has the ranking of the i-nth
-        element of the row array.
+        Array of rankings (of ``int32``) the i-nth element has the ranking of
+        the i-nth element of the row array.
 
     Examples
     --------
@@ -53,16 +58,122 @@ def rank_values(arr, reverse=False):
         >>> # the fastest (the lowest value) goes first
         >>> time_laps = [0.59, 1.2, 0.3]
         >>> rank_values(time_laps)
-        array([2, 3, 1])
+        array([2, 3, 1], dtype=int32)
         >>> # highest is better
         >>> scores = [140, 200, 98]
         >>> rank_values(scores, reverse=True)
-        array([2, 1, 3])
+        array([2, 1, 3], dtype=int32)
+
+    """
+    if reverse:
+        arr = np.multiply(arr, -1)
+    return stats.rankdata(arr, "ordinal", axis=axis).astype(np.int32)
+
+
+def top_k_values(arr, k, reverse=False):
+    """Return the indexes of the ``k`` first ranked values of an array.
+
+    Only the ``k`` selected values are sorted (the rest of the array is
+    partitioned with :py:func:`numpy.argpartition`), so selecting a few values
+    of a large array is linear in their size. The order and the ties are the
+    same as in ``rank_values()``.
+
+    Parameters
+    ----------
+    arr : :py:class:`numpy.ndarray`
+        A 1D array with values.
+
+    k : :py:class:`int`
+        How many values are selected. If is greater than the size of the
+        array all the values are selected.
+
+    reverse : :py:class:`bool` default *False*
+        By default (*False*) the lesser values are ranked first, if is
+        *True* the highest values are the first.
+
+    Returns
+    -------
+    :py:class:`numpy.ndarray`
+        The indexes of the selected values, where the i-nth element is the
+        index of the value with the ranking i + 1.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from skcriteria.utils.rank import top_k_values
+        >>> scores = [140, 200, 98, 170]
+        >>> top_k_values(scores, 2, reverse=True)
+        array([1, 3])
 
     """
+    arr = np.asarray(arr)
     if reverse:
         arr = np.multiply(arr, -1)
-    return stats.rankdata(arr, "ordinal").astype(int)
+
+    k = min(k, len(arr))
+    if k <= 0:
+        return np.empty(0, dtype=int)
+
+    selected = np.argpartition(arr, k - 1)[:k]
+
+    # the partition breaks the ties of the k-th value in any order, but the
+    # ranking keeps the first ones
+    kth = arr[selected].max()
+    better = arr < kth
+    if np.count_nonzero(better) + np.count_nonzero(arr == kth) > k:
+        ties = np.flatnonzero(arr == kth)[: k - np.count_nonzero(better)]
+        selected = np.concatenate([np.flatnonzero(better), ties])
+
+    return selected[np.lexsort((selected, arr[selected]))]
+
+
+def take_alternatives(extra, selected, alternatives_extra):
+    """Select the elements of some alternatives from the extra information.
+
+    Parameters
+    ----------
+    extra : :py:class:`dict`
+        The extra information of a result.
+
+    selected : :py:class:`numpy.ndarray`
+        The indexes of the selected alternatives.
+
+    alternatives_extra : iterable
+        The names of the extra values with an element by alternative along
+        the first axis, or ``(name, axes)`` pairs if the alternatives are
+        along other axes (an int or a tuple of ints, like ``(0, 1)`` for an
+        alternatives by alternatives matrix).
+
+    Returns
+    -------
+    :py:class:`dict`
+        A copy of ``extra`` with only the elements of the selected
+        alternatives.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from skcriteria.utils.rank import take_alternatives
+        >>> extra = {"score": [140, 200, 98], "dominance": np.eye(3)}
+        >>> take_alternatives(
+        ...     extra, [1, 0], ["score", ("dominance", (0, 1))]
+        ... )
+        {'score': array([200, 140]), 'dominance': array([[1., 0.],
+               [0., 1.]])}
+
+    """
+    extra = dict(extra)
+    for name in alternatives_extra:
+        name, axes = (name, 0) if isinstance(name, str) else name
+        value = extra[name]
+        taken = np.asarray(value)
+        for axis in np.atleast_1d(axes):
+            taken = np.take(taken, selected, axis=axis)
+        # the tuples (like one array by criteria) keep their type
+        extra[name] = tuple(taken) if isinstance(value, tuple) else taken
+    return extra
 
 
 # =============================================================================
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""test for skcriteria.core.batch
+
+"""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+import pytest
+
+from skcriteria.core import batch, data
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def make_batch(seed=42, problems=4, alternatives=6, criteria=3):
+    random = np.random.default_rng(seed=seed)
+    matrix = random.random((problems, alternatives, criteria))
+    weights = random.random((problems, criteria))
+    objectives = random.choice([max, min], size=criteria)
+    return batch.DecisionMatrixBatch(matrix, objectives, weights)
+
+
+# =============================================================================
+# DECISION MATRIX BATCH
+# =============================================================================
+
+
+def test_DecisionMatrixBatch_simple():
+    matrix = np.arange(12).reshape(2, 3, 2)
+    dmb = batch.DecisionMatrixBatch(matrix, [max, min], [[1, 2], [3, 4]])
+
+    assert len(dmb) == 2
+    assert dmb.shape == (2, 3, 2)
+    np.testing.assert_array_equal(dmb.matrix, matrix)
+    np.testing.assert_array_equal(dmb.weights, [[1, 2], [3, 4]])
+    np.testing.assert_array_equal(dmb.criteria, ["C0", "C1"])
+    np.testing.assert_array_equal(
+        dmb.alternatives, [["A0", "A1", "A2"], ["A0", "A1", "A2"]]
+    )
+    np.testing.assert_array_equal(
+        dmb.objectives, [data.Objective.MAX, data.Objective.MIN]
+    )
+    np.testing.assert_array_equal(dmb.iobjectives, [1, -1])
+    assert repr(dmb) == (
+        "<DecisionMatrixBatch 2 Problems x 3 Alternatives x 2 Criteria>"
+    )
+
+
+def test_DecisionMatrixBatch_shared_weights():
+    matrix = np.ones((3, 2, 2))
+    dmb = batch.DecisionMatrixBatch(matrix, [max, min], [1, 2])
+    np.testing.assert_array_equal(dmb.weights, [[1, 2]] * 3)
+
+    dmb = batch.DecisionMatrixBatch(matrix, [max, min])
+    np.testing.assert_array_equal(dmb.weights, np.ones((3, 2)))
+
+
+def test_DecisionMatrixBatch_no_copy():
+    matrix = np.ones((3, 2, 2))
+    dmb = batch.DecisionMatrixBatch(matrix, [max, min], copy=False)
+
+    assert np.shares_memory(dmb.matrix, matrix)
+    assert not dmb.matrix.flags.writeable
+    assert matrix.flags.writeable
+
+
+def test_DecisionMatrixBatch_getitem():
+    dmb = make_batch()
+
+    dm = dmb[1]
+
+    assert isinstance(dm, data.DecisionMatrix)
+    assert dm.engine == "numpy"
+    assert np.shares_memory(dm.matrix_view, dmb.matrix)
+    np.testing.assert_array_equal(dm.matrix_view, dmb.matrix[1])
+    np.testing.assert_array_equal(dm.weights, dmb.weights[1])
+    np.testing.assert_array_equal(dm.iobjectives, dmb.iobjectives)
+    assert len(list(dmb)) == len(dmb)
+
+
+def test_DecisionMatrixBatch_from_decision_matrices():
+    dmb = make_batch()
+
+    result = batch.DecisionMatrixBatch.from_decision_matrices(dmb)
+
+    np.testing.assert_array_equal(result.matrix, dmb.matrix)
+    np.testing.assert_array_equal(result.weights, dmb.weights)
+    np.testing.assert_array_equal(result.alternatives, dmb.alternatives)
+    np.testing.assert_array_equal(result.iobjectives, dmb.iobjectives)
+
+
+def test_DecisionMatrixBatch_from_decision_matrices_invalid():
+    dm0 = data.mkdm([[1, 2], [3, 4]], [max, min])
+    dm1 = data.mkdm([[1, 2], [3, 4]], [max, max])
+
+    with pytest.raises(ValueError):
+        batch.DecisionMatrixBatch.from_decision_matrices([dm0, dm1])
+
+    with pytest.raises(ValueError):
+        batch.DecisionMatrixBatch.from_decision_matrices([])
+
+
+def test_DecisionMatrixBatch_to_dict():
+    dmb = make_batch()
+
+    result = dmb.to_dict()
+    assert result["matrix"].flags.writeable
+    assert not np.shares_memory(result["matrix"], dmb.matrix)
+
+    result = dmb.to_dict(copy=False)
+    assert result["matrix"] is dmb.matrix
+    assert set(result) == {
+        "matrix",
+        "objectives",
+        "weights",
+        "alternatives",
+        "criteria",
+    }
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"matrix": np.ones((2, 2))},
+        {"criteria": ["a", "b", "c"]},
+        {"alternatives": ["a", "b"]},
+        {"objectives": [max]},
+        {"weights": [1, 2, 3]},
+    ],
+)
+def test_DecisionMatrixBatch_invalid(kwargs):
+    params = {"matrix": np.ones((2, 3, 2)), "objectives": [max, min]}
+    params.update(kwargs)
+    with pytest.raises(ValueError):
+        batch.DecisionMatrixBatch(**params)
+
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+
+def test_RankResultBatch():
+    result = batch.RankResultBatch(
+        "foo",
+        alternatives=[["a", "b"], ["a", "b"]],
+        values=[[1, 2], [2, 1]],
+        extra={"score": np.array([[0.5, 0.1], [0.1, 0.5]]), "alfa": 1},
+    )
+
+    assert result.method == "foo"
+    assert len(result) == 2
+    assert result.shape == (2, 2)
+    assert result.rank_.dtype == np.int32
+    assert result.e_ is result.extra_
+    np.testing.assert_array_equal(result.alternatives[0], ["a", "b"])
+    assert repr(result) == (
+        "<RankResultBatch 2 Problems x 2 Alternatives [Method: foo]>"
+    )
+
+    first = result[1]
+    assert isinstance(first, data.RankResult)
+    np.testing.assert_array_equal(first.rank_, [2, 1])
+    np.testing.assert_array_equal(first.e_.score, [0.1, 0.5])
+    assert first.e_.alfa == 1
@@ -17,6 +17,8 @@
 # IMPORTS
 # =============================================================================
 
+import pickle
+
 import numpy as np
 
 import pandas as pd
@@ -25,7 +27,10 @@ from pyquery import PyQuery
 
 import pytest
 
-from skcriteria.core import data, plot
+from scipy import sparse
+
+from skcriteria.core import data, options, plot
+from skcriteria.utils import archive, chunks
 
 
 # =============================================================================
@@ -194,6 +199,538 @@ def test_DecisionMatrix_no_provide_cnames_and_anames(data_values):
     np.testing.assert_array_equal(dm.criteria, criteria)
 
 
+def test_DecisionMatrix_no_copy(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+        copy=False,
+    )
+
+    assert np.shares_memory(dm._data_df.to_numpy(), mtx)
+    assert not dm._data_df.to_numpy().flags.writeable
+    assert mtx.flags.writeable
+    np.testing.assert_array_equal(dm.matrix, mtx)
+
+
+def test_DecisionMatrix_objectives_resolved_on_creation(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+    )
+
+    assert dm._objectives.dtype == np.int8
+    assert not dm._objectives.flags.writeable
+    np.testing.assert_array_equal(
+        dm._objectives, construct_iobjectives(objectives)
+    )
+
+
+def test_DecisionMatrix_invalid_objective_alias(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+    objectives = ["foo"] * len(objectives)
+    with pytest.raises(ValueError):
+        data.mkdm(
+            matrix=mtx,
+            objectives=objectives,
+            weights=weights,
+            alternatives=alternatives,
+            criteria=criteria,
+        )
+
+
+def test_DecisionMatrix_copy_by_default(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+    )
+
+    assert not np.shares_memory(dm._data_df.to_numpy(), mtx)
+
+
+# =============================================================================
+# ENGINES
+# =============================================================================
+
+
+def test_DecisionMatrix_numpy_engine(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+        engine="numpy",
+    )
+
+    assert dm.engine == "numpy"
+    assert dm._df is None
+    assert dm.matrix_view.flags.c_contiguous
+
+    np.testing.assert_array_equal(dm.matrix_view, mtx)
+    np.testing.assert_array_equal(
+        dm.iobjectives, construct_iobjectives(objectives)
+    )
+    np.testing.assert_array_equal(dm.weights, weights)
+    np.testing.assert_array_equal(dm.alternatives, alternatives)
+    np.testing.assert_array_equal(dm.criteria, criteria)
+    np.testing.assert_array_equal(dm.dtypes, [np.float64] * len(criteria))
+    assert dm.shape == mtx.shape and len(dm) == len(mtx)
+
+    # the dataframe is only created when is needed
+    np.testing.assert_array_equal(dm.matrix, mtx)
+    assert dm._df is not None
+    assert np.shares_memory(dm._df.to_numpy(), dm.matrix_view)
+
+
+def test_DecisionMatrix_numpy_engine_no_copy(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+        engine="numpy",
+        copy=False,
+    )
+
+    assert np.shares_memory(dm.matrix_view, mtx)
+    assert not dm.matrix_view.flags.writeable
+    assert mtx.flags.writeable
+
+
+def test_DecisionMatrix_numpy_engine_dtypes():
+    dm = data.mkdm(
+        matrix=[[1, 2, 3], [4, 5, 6]],
+        objectives=[min, max, min],
+        dtypes=[int, float, int],
+        engine="numpy",
+    )
+    assert dm.matrix_view.dtype == np.float64
+    np.testing.assert_array_equal(dm.dtypes, [np.float64] * 3)
+
+
+def test_DecisionMatrix_engines_equals(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    pd_dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+        engine="pandas",
+    )
+    np_dm = pd_dm.copy(engine="numpy")
+
+    assert pd_dm.engine == "pandas"
+    assert np_dm.engine == "numpy"
+    assert pd_dm.equals(np_dm)
+    assert repr(pd_dm) == repr(np_dm)
+    assert pd_dm.describe().equals(np_dm.describe())
+    assert np_dm.copy().engine == "numpy"
+
+
+def test_DecisionMatrix_init_numpy_engine(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+    df = pd.DataFrame(mtx, index=alternatives, columns=criteria)
+
+    dm = data.DecisionMatrix(df, objectives, weights, engine="numpy")
+
+    assert dm.engine == "numpy"
+    np.testing.assert_array_equal(dm.matrix_view, mtx)
+    np.testing.assert_array_equal(dm.alternatives, alternatives)
+    np.testing.assert_array_equal(dm.criteria, criteria)
+
+
+def test_DecisionMatrix_default_engine_option(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    with options.option_context(engine="numpy"):
+        dm = data.mkdm(matrix=mtx, objectives=objectives, weights=weights)
+
+    assert dm.engine == "numpy"
+
+
+def test_DecisionMatrix_invalid_engine(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+    with pytest.raises(ValueError):
+        data.mkdm(
+            matrix=mtx, objectives=objectives, weights=weights, engine="foo"
+        )
+
+
+# =============================================================================
+# PRECISION
+# =============================================================================
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_DecisionMatrix_precision_float32(data_values, engine):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    with options.option_context(precision="float32"):
+        dm = data.mkdm(
+            matrix=mtx,
+            objectives=objectives,
+            weights=weights,
+            alternatives=alternatives,
+            criteria=criteria,
+            engine=engine,
+        )
+
+    assert dm.matrix_view.dtype == np.float32
+    assert dm.weights.dtype == np.float32
+    np.testing.assert_allclose(dm.matrix_view, mtx, rtol=1e-6)
+
+
+def test_DecisionMatrix_precision_float32_keep_integers():
+    with options.option_context(precision="float32"):
+        dm = data.mkdm(
+            matrix=[[1, 2.0], [3, 4.0]],
+            objectives=[max, min],
+            dtypes=[int, float],
+        )
+    assert list(dm.dtypes) == [np.dtype(int), np.float32]
+
+
+def test_DecisionMatrix_weights_follow_matrix_precision():
+    dm = data.mkdm(
+        matrix=np.ones((2, 3), dtype=np.float32),
+        objectives=[max, min, max],
+        weights=[1, 2, 3],
+    )
+    assert dm.weights.dtype == np.float32
+
+    dm = data.mkdm(
+        matrix=np.ones((2, 3), dtype=int),
+        objectives=[max, min, max],
+        weights=[1, 2, 3],
+    )
+    assert dm.weights.dtype == np.float64
+
+
+def test_RankResult_int32():
+    result = data.RankResult("foo", ["a", "b"], [2, 1], {})
+    assert result.rank_.dtype == np.int32
+
+
+# =============================================================================
+# MEMMAP
+# =============================================================================
+
+
+def _is_memmap_backed(arr):
+    while arr is not None:
+        if isinstance(arr, np.memmap):
+            return True
+        arr = arr.base
+    return False
+
+
+def test_DecisionMatrix_to_memmap_from_memmap(data_values, tmp_path):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+    )
+
+    path = tmp_path / "dm.npy"
+    mdm = dm.to_memmap(path, chunk_size=5)
+
+    assert mdm.engine == "numpy"
+    assert _is_memmap_backed(mdm.matrix_view)
+    assert not mdm.matrix_view.flags.writeable
+    assert mdm.equals(dm)
+    np.testing.assert_array_equal(np.load(path), mtx)
+
+    result = data.DecisionMatrix.from_memmap(
+        path,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+    )
+    assert _is_memmap_backed(result.matrix_view)
+    assert result.equals(dm)
+
+
+def test_DecisionMatrix_from_memmap_invalid_shape(data_values, tmp_path):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    path = tmp_path / "dm.npy"
+    np.save(path, mtx)
+
+    with pytest.raises(ValueError):
+        data.DecisionMatrix.from_memmap(
+            path, objectives=objectives[1:], weights=weights
+        )
+
+
+# =============================================================================
+# APPEND AND DROP ALTERNATIVES
+# =============================================================================
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_DecisionMatrix_append_alternatives(engine):
+    dm = data.mkdm(
+        matrix=[[1, 2], [3, 4]], objectives=[max, min], engine=engine
+    )
+
+    result = dm.append_alternatives([[5, 6], [7, 8]], alternatives=["x", "y"])
+    result = result.append_alternatives([9, 10])
+
+    expected = data.mkdm(
+        matrix=[[1, 2], [3, 4], [5, 6], [7, 8], [9, 10]],
+        objectives=[max, min],
+        alternatives=["A0", "A1", "x", "y", "A4"],
+        engine=engine,
+    )
+
+    assert result.equals(expected)
+    assert result.engine == engine
+    assert result._weights is dm._weights
+    assert result._objectives is dm._objectives
+    assert dm.shape == (2, 2)
+
+
+def test_DecisionMatrix_append_alternatives_share_buffer():
+    dm = data.mkdm(
+        matrix=np.ones((10, 2)), objectives=[max, min], engine="numpy"
+    )
+
+    first = dm.append_alternatives([[2, 2]])
+    second = first.append_alternatives([[3, 3]])
+    third = first.append_alternatives([[4, 4]])
+
+    # second was appended in place in the buffer of first
+    assert np.shares_memory(first.matrix_view, second.matrix_view)
+
+    # third can't overwrite the last row of second
+    assert not np.shares_memory(second.matrix_view, third.matrix_view)
+    np.testing.assert_array_equal(second.matrix_view[-1], [3, 3])
+    np.testing.assert_array_equal(third.matrix_view[-1], [4, 4])
+    np.testing.assert_array_equal(third.alternatives[-1], "A11")
+
+
+@pytest.mark.parametrize(
+    "matrix, alternatives",
+    [([[1, 2, 3]], None), ([[1, 2]], ["x", "y"])],
+)
+def test_DecisionMatrix_append_alternatives_invalid(matrix, alternatives):
+    dm = data.mkdm(matrix=[[1, 2], [3, 4]], objectives=[max, min])
+    with pytest.raises(ValueError):
+        dm.append_alternatives(matrix, alternatives=alternatives)
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_DecisionMatrix_drop_alternatives(engine):
+    dm = data.mkdm(
+        matrix=[[1, 2], [3, 4], [5, 6]], objectives=[max, min], engine=engine
+    )
+
+    result = dm.drop_alternatives(["A1"])
+
+    expected = data.mkdm(
+        matrix=[[1, 2], [5, 6]],
+        objectives=[max, min],
+        alternatives=["A0", "A2"],
+        engine=engine,
+    )
+    assert result.equals(expected)
+    assert result._weights is dm._weights
+
+
+def test_DecisionMatrix_drop_last_alternatives_no_copy():
+    dm = data.mkdm(
+        matrix=[[1, 2], [3, 4], [5, 6]], objectives=[max, min], engine="numpy"
+    )
+    dm = dm.append_alternatives([[7, 8]])
+
+    result = dm.drop_alternatives(["A3", "A2"])
+
+    np.testing.assert_array_equal(result.matrix_view, [[1, 2], [3, 4]])
+    assert np.shares_memory(result.matrix_view, dm.matrix_view)
+    assert result._row_buffers is dm._row_buffers
+
+
+def test_DecisionMatrix_drop_alternatives_unknown():
+    dm = data.mkdm(matrix=[[1, 2], [3, 4]], objectives=[max, min])
+    with pytest.raises(KeyError):
+        dm.drop_alternatives(["A0", "foo"])
+
+
+def test_DecisionMatrix_alternatives_hooks():
+    events = []
+
+    @data.register_alternatives_hook
+    def hook(parent, child, event, value):
+        events.append((parent, child, event, value))
+
+    try:
+        dm = data.mkdm(matrix=[[1, 2], [3, 4]], objectives=[max, min])
+        appended = dm.append_alternatives([[5, 6]])
+        dropped = appended.drop_alternatives(["A0"])
+    finally:
+        data.unregister_alternatives_hook(hook)
+
+    dm.append_alternatives([[5, 6]])
+
+    assert len(events) == 2
+
+    parent, child, event, value = events[0]
+    assert (parent, child, event) == (dm, appended, "append")
+    np.testing.assert_array_equal(value, [[5, 6]])
+
+    parent, child, event, value = events[1]
+    assert (parent, child, event) == (appended, dropped, "drop")
+    np.testing.assert_array_equal(value, [True, False, False])
+
+
+# =============================================================================
+# SAVE AND LOAD
+# =============================================================================
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+@pytest.mark.parametrize("mmap_mode", [None, "r"])
+def test_DecisionMatrix_save_load(data_values, tmp_path, engine, mmap_mode):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+        engine=engine,
+    )
+
+    path = tmp_path / "dm.skcdm"
+    dm.save(path)
+    result = data.DecisionMatrix.load(path, mmap_mode=mmap_mode)
+
+    assert result.engine == engine
+    assert result.equals(dm)
+    assert _is_memmap_backed(result.matrix_view) == (mmap_mode is not None)
+
+
+def test_DecisionMatrix_save_load_preserve_dtypes(tmp_path):
+    dm = data.mkdm(
+        matrix=[[1, 2, 3], [4, 5, 6]],
+        objectives=[min, max, min],
+        weights=[1, 2, 3],
+        dtypes=[int, float, np.int32],
+    )
+
+    path = tmp_path / "dm.skcdm"
+    dm.save(path)
+    result = data.DecisionMatrix.load(path)
+
+    assert result.equals(dm)
+    assert result.dtypes.equals(dm.dtypes)
+
+
+def test_DecisionMatrix_load_other_engine(decision_matrix, tmp_path):
+    dm = decision_matrix(seed=42)
+
+    path = tmp_path / "dm.skcdm"
+    dm.save(path)
+    result = data.DecisionMatrix.load(path, engine="numpy")
+
+    assert result.engine == "numpy"
+    assert result.equals(dm)
+
+
+def test_DecisionMatrix_load_invalid_format(tmp_path):
+    result = data.RankResult("foo", ["a", "b"], [1, 2], {})
+    path = tmp_path / "rank.skcdm"
+    result.save(path)
+
+    with pytest.raises(ValueError):
+        data.DecisionMatrix.load(path)
+
+
+@pytest.mark.parametrize(
+    "version", [data.FORMAT_VERSION + 1, None, "1"], ids=["new", "none", "str"]
+)
+def test_DecisionMatrix_load_invalid_version(
+    decision_matrix, tmp_path, version
+):
+    dm = decision_matrix(seed=42)
+    path = tmp_path / "dm.skcdm"
+    dm.save(path)
+
+    header, arrays = archive.load_arrays(path)
+    header["version"] = version
+    archive.save_arrays(path, header, arrays)
+
+    with pytest.raises(ValueError):
+        data.DecisionMatrix.load(path)
+
+
+# =============================================================================
+# PICKLE
+# =============================================================================
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_DecisionMatrix_pickle_out_of_band(engine):
+    dm = data.mkdm(
+        matrix=np.random.default_rng(42).random((1000, 4)),
+        objectives=[max, min, max, min],
+        weights=[1, 2, 3, 4],
+        engine=engine,
+    )
+    repr(dm)  # creates the lazy dataframe of the numpy engine
+
+    buffers = []
+    dumped = pickle.dumps(dm, protocol=5, buffer_callback=buffers.append)
+    result = pickle.loads(dumped, buffers=buffers)
+
+    assert len(dumped) < dm.matrix_view.nbytes
+    assert dm.matrix_view.nbytes in [memoryview(b).nbytes for b in buffers]
+    assert result.engine == engine
+    assert result.equals(dm)
+    assert pickle.loads(pickle.dumps(dm)).equals(dm)
+
+
+def test_DecisionMatrix_pickle_without_spare_capacity():
+    dm = data.mkdm([[1, 2], [3, 4]], [max, min], engine="numpy")
+    for row in ([5, 6], [7, 8], [9, 10]):
+        dm = dm.append_alternatives([row])
+    assert dm._row_buffers[0].capacity > len(dm)
+
+    result = pickle.loads(pickle.dumps(dm, protocol=5))
+
+    assert result.equals(dm)
+    assert result._row_buffers is None
+    assert result.matrix_view.shape == (5, 2)
+
+
 # =============================================================================
 # PROPERTIES
 # =============================================================================
@@ -235,6 +772,80 @@ def test_DecisionMatrix_copy(data_values):
     assert dm.equals(copy)
 
 
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_DecisionMatrix_copy_shares_buffers(engine, data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+        engine=engine,
+    )
+    dm.stats.maxs
+
+    new_weights = np.arange(len(criteria)) + 1.0
+    copy = dm.copy(weights=new_weights)
+
+    assert copy.engine == engine
+    assert np.shares_memory(copy.matrix_view, dm.matrix_view)
+    assert copy._objectives is dm._objectives
+    assert copy.stats is dm.stats
+    np.testing.assert_array_equal(copy.weights, new_weights)
+    np.testing.assert_array_equal(dm.weights, weights)
+
+    expected = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=new_weights,
+        alternatives=alternatives,
+        criteria=criteria,
+    )
+    assert copy.equals(expected)
+
+    renamed = dm.copy(
+        alternatives=[f"X{i}" for i in range(len(alternatives))],
+        criteria=[f"Y{i}" for i in range(len(criteria))],
+        weights=None,
+    )
+    assert np.shares_memory(renamed.matrix_view, dm.matrix_view)
+    assert renamed.alternatives[0] == "X0"
+    assert renamed.criteria[0] == "Y0"
+    np.testing.assert_array_equal(renamed.weights, 1)
+    assert list(dm.alternatives) == list(alternatives)
+
+
+def test_DecisionMatrix_copy_rebuild(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(matrix=mtx, objectives=objectives, engine="numpy")
+
+    copy = dm.copy(matrix=mtx * 2)
+    assert not np.shares_memory(copy.matrix_view, dm.matrix_view)
+    np.testing.assert_array_equal(copy.matrix_view, mtx * 2)
+
+    copy = dm.copy(engine="pandas")
+    assert copy.engine == "pandas"
+    assert copy.equals(dm)
+
+
+def test_DecisionMatrix_copy_invalid_labels(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(matrix=mtx, objectives=objectives)
+
+    with pytest.raises(ValueError):
+        dm.copy(alternatives=["A"])
+
+    with pytest.raises(ValueError):
+        dm.copy(criteria=["C"])
+
+    with pytest.raises(ValueError):
+        dm.copy(weights=[1])
+
+
 def test_DecisionMatrix_to_dataframe(data_values):
 
     mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
@@ -284,6 +895,53 @@ def test_DecisionMatrix_to_dict(data_values):
     assert np.all(cmp.values())
 
 
+def test_DecisionMatrix_to_dict_no_copy(data_values):
+
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+    )
+
+    result = dm.to_dict(copy=False)
+
+    np.testing.assert_array_equal(result["matrix"], mtx)
+    np.testing.assert_array_equal(
+        result["objectives"], construct_iobjectives(objectives)
+    )
+    np.testing.assert_array_equal(result["weights"], weights)
+
+    for k in ("matrix", "objectives", "weights"):
+        assert not result[k].flags.writeable
+
+    assert np.shares_memory(result["matrix"], dm.matrix_view)
+
+
+def test_DecisionMatrix_matrix_view(data_values):
+
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+    )
+
+    view = dm.matrix_view
+
+    np.testing.assert_array_equal(view, mtx)
+    assert not view.flags.writeable
+    assert np.shares_memory(view, dm._data_df.to_numpy())
+    with pytest.raises(ValueError):
+        view[0, 0] = 1
+
+
 def test_DecisionMatrix_describe(data_values):
 
     mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
@@ -423,6 +1081,206 @@ def test_DecisionMatrix_self_ne(data_values):
     assert not dm.equals(other)
 
 
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_DecisionMatrix_missing_values(engine):
+    matrix = np.ma.masked_array(
+        [[1, 2, 3], [4, 5, 6]], mask=[[0, 1, 0], [0, 0, 0]]
+    )
+    dm = data.mkdm(matrix=matrix, objectives=[max, max, min], engine=engine)
+
+    assert dm.has_missing
+    np.testing.assert_array_equal(
+        dm.valid_mask, [[True, False, True], [True, True, True]]
+    )
+    assert not dm.valid_mask.flags.writeable
+    assert dm._valid_bits.shape == (2, 1)
+    assert np.isnan(dm.matrix_view[0, 1])
+    assert dm.matrix_view[1, 1] == 5
+
+
+def test_DecisionMatrix_missing_values_nan():
+    matrix = np.ones((3, 10))
+    matrix[2, 9] = np.nan
+    dm = data.mkdm(matrix=matrix, objectives=[max] * 10)
+
+    assert dm.has_missing
+    assert dm.valid_mask.sum() == 29
+    assert not dm.valid_mask[2, 9]
+
+    # the mask is shared by the copies with the same matrix
+    assert dm.copy(weights=np.arange(10))._valid_bits is dm._valid_bits
+
+
+def test_DecisionMatrix_without_missing_values():
+    dm = data.mkdm(
+        matrix=np.ma.masked_array([[1, 2], [3, 4]]), objectives=[max, max]
+    )
+    assert not dm.has_missing
+    assert dm.valid_mask.all()
+    assert dm.matrix_view.dtype.kind == "i"
+
+
+@pytest.mark.parametrize("fmt", ["csr", "csc"])
+def test_DecisionMatrix_sparse_engine(fmt):
+    dense = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 3.0], [2.0, 0.0, 0.0]])
+    matrix = sparse.csr_matrix(dense).asformat(fmt)
+    dm = data.mkdm(matrix=matrix, objectives=[max, max, min])
+
+    assert dm.engine == "sparse"
+    assert dm.sparse_view.format == fmt
+    assert not dm.sparse_view.data.flags.writeable
+    np.testing.assert_array_equal(dm.matrix_view, dense)
+    np.testing.assert_array_equal(dm.matrix, dense)
+
+    expected = data.mkdm(matrix=dense, objectives=[max, max, min])
+    assert dm.equals(expected)
+    assert dm.fingerprint() == expected.fingerprint()
+
+    # the sparse matrix is returned only if is requested
+    assert sparse.issparse(dm.to_dict(sparse=True)["matrix"])
+    assert isinstance(dm.to_dict()["matrix"], np.ndarray)
+
+
+def test_DecisionMatrix_sparse_engine_operations():
+    dense = np.array([[1.0, 0.0], [0.0, 0.0], [2.0, 5.0]])
+    dm = data.mkdm(matrix=dense, objectives=[max, min], engine="sparse")
+    expected = data.mkdm(matrix=dense, objectives=[max, min])
+
+    assert dm.engine == "sparse"
+    assert dm.iloc[[0, 2]].engine == "sparse"
+    assert dm.iloc[[0, 2]].equals(expected.iloc[[0, 2]])
+
+    appended = dm.append_alternatives([[0.0, 7.0]], alternatives=["A3"])
+    assert appended.engine == "sparse"
+    assert appended.equals(
+        expected.append_alternatives([[0.0, 7.0]], alternatives=["A3"])
+    )
+
+    dropped = dm.drop_alternatives(["A1"])
+    assert dropped.engine == "sparse"
+    assert dropped.equals(expected.drop_alternatives(["A1"]))
+
+    copy = dm.copy()
+    assert copy.engine == "sparse" and copy.equals(dm)
+    assert dm.copy(engine="numpy").engine == "numpy"
+
+    unpickled = pickle.loads(pickle.dumps(dm))
+    assert unpickled.engine == "sparse" and unpickled.equals(dm)
+
+
+def test_DecisionMatrix_sparse_engine_not_densified():
+    dense = np.array([[1.0, 0.0], [0.0, 0.0], [2.0, 5.0]])
+    dm = data.mkdm(matrix=dense, objectives=[max, min], engine="sparse")
+    expected = data.mkdm(matrix=dense, objectives=[max, min])
+
+    assert repr(dm) == repr(expected)
+    assert dm._repr_html_() == expected._repr_html_()
+    np.testing.assert_array_equal(dm.matrix_view, dense)
+    np.testing.assert_allclose(dm.stats.norm, expected.stats.norm)
+    np.testing.assert_allclose(dm.stats.std, expected.stats.std)
+
+    # the dense dataframe is never kept and the statistics are computed
+    # over the sparse matrix
+    assert dm._df is None
+    assert dm.matrix_view is not dm.matrix_view
+    assert sparse.issparse(dm.stats._matrix)
+
+
+def test_DecisionMatrix_fingerprint(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+        engine="pandas",
+    )
+
+    fingerprint = dm.fingerprint()
+
+    assert isinstance(fingerprint, str) and len(fingerprint) == 32
+    assert dm.fingerprint() is fingerprint
+    assert dm.copy().fingerprint() == fingerprint
+    assert dm.copy(engine="numpy").fingerprint() == fingerprint
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda kw: kw.update(matrix=kw["matrix"] + 1),
+        lambda kw: kw.update(matrix=kw["matrix"].astype(np.float32)),
+        lambda kw: kw.update(
+            objectives=[
+                -data.Objective.construct_from_alias(o).value
+                for o in kw["objectives"]
+            ]
+        ),
+        lambda kw: kw.update(weights=kw["weights"] * 2),
+        lambda kw: kw.update(alternatives=kw["alternatives"][::-1]),
+        lambda kw: kw.update(criteria=kw["criteria"][::-1]),
+    ],
+)
+def test_DecisionMatrix_fingerprint_changes(data_values, change):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+    kwargs = {
+        "matrix": mtx,
+        "objectives": objectives,
+        "weights": weights,
+        "alternatives": alternatives,
+        "criteria": criteria,
+    }
+    dm = data.mkdm(**kwargs)
+
+    change(kwargs)
+    other = data.mkdm(**kwargs)
+
+    assert dm.fingerprint() != other.fingerprint()
+
+
+def test_DecisionMatrix_equals_fingerprint_nan():
+    dm = data.mkdm([[1, np.nan], [3, 4]], [max, min])
+    other = dm.copy()
+    assert dm.fingerprint() == other.fingerprint()
+
+    assert not dm.equals(other)
+    assert dm.aequals(other, equal_nan=True)
+
+
+def test_DecisionMatrix_equals_signed_zero():
+    dm = data.mkdm([[1.0, 0.0], [3.0, 4.0]], [max, min])
+    other = data.mkdm([[1.0, -0.0], [3.0, 4.0]], [max, min])
+    assert dm.fingerprint() != other.fingerprint()
+
+    assert dm.equals(other)
+
+
+@pytest.mark.parametrize("engines", [("pandas", "numpy"), ("numpy", "numpy")])
+def test_DecisionMatrix_equals_by_chunks(monkeypatch, engines):
+    matrix = np.arange(40, dtype=float).reshape(20, 2)
+    dm = data.mkdm(matrix, [max, min], engine=engines[0])
+
+    omatrix = matrix.copy()
+    omatrix[-1, -1] += 1
+    other = data.mkdm(omatrix, [max, min], engine=engines[1])
+
+    monkeypatch.setattr(chunks, "CHUNK_SIZE", 4)
+    assert dm.equals(dm.copy(engine=engines[1]))
+    assert not dm.equals(other)
+    assert dm.aequals(other, atol=1)
+
+
+def test_DecisionMatrix_equals_mixed_dtypes():
+    dm = data.mkdm(
+        [[1, 2.5], [3, 4.5]], [max, min], dtypes=[int, float], engine="pandas"
+    )
+    other = dm.copy()
+
+    assert dm.equals(other)
+    assert not dm.equals(None)
+
+
 # =============================================================================
 # REPR
 # =============================================================================
@@ -514,6 +1372,46 @@ def test_simple_html():
     assert result.text() == expected.text()
 
 
+@pytest.mark.parametrize("engine", ["pandas", "numpy", "sparse"])
+def test_repr_truncated(engine):
+    dm = data.mkdm(
+        matrix=np.arange(300).reshape(100, 3),
+        objectives=[min, max, min],
+        weights=[0.1, 0.2, 0.3],
+        engine=engine,
+    )
+
+    with pd.option_context("display.max_rows", 6, "display.min_rows", 4):
+        assert len(dm._get_repr_df()) == 8
+        result = repr(dm)
+        html = PyQuery(dm._repr_html_())
+
+    lines = result.splitlines()
+    assert len(lines) == 7
+    assert lines[0].split("]")[0].strip() == "C0[\u25bc 0.1"
+    assert lines[1].split() == ["A0", "0", "1", "2"]
+    assert lines[3].split()[1:] == ["...", "...", "..."]
+    assert lines[5].split() == ["A99", "297", "298", "299"]
+    assert lines[-1] == "[100 Alternatives x 3 Criteria]"
+
+    headers = [th.text for th in html("thead th")]
+    assert headers[1:] == [
+        "C0[\u25bc 0.1]",
+        "C1[\u25b2 0.2]",
+        "C2[\u25bc 0.3]",
+    ]
+    assert len(html("tbody tr")) == 5
+    assert html("em.decisionmatrix-dim").text() == (
+        "100 Alternatives x 3 Criteria"
+    )
+
+
+def test_repr_without_max_rows():
+    dm = data.mkdm(matrix=np.ones((100, 2)), objectives=[min, max])
+    with pd.option_context("display.max_rows", None):
+        assert len(repr(dm).splitlines()) == 102
+
+
 # =============================================================================
 # MUST FAIL
 # =============================================================================
@@ -748,6 +1646,47 @@ def test_RankResult_len():
     assert len(result) == length
 
 
+def test_RankResult_top_k():
+    result = data.RankResult(
+        method="foo",
+        alternatives=["a", "b", "c", "d"],
+        values=[3, 1, 4, 2],
+        extra={"alfa": 1},
+        top_k=2,
+    )
+
+    assert result.top_k == 2
+    np.testing.assert_array_equal(result.alternatives, ["b", "d"])
+    np.testing.assert_array_equal(result.rank_, [1, 2])
+    assert result.e_.alfa == 1
+
+    full = data.RankResult("foo", ["a", "b"], [2, 1], {})
+    assert full.top_k is None
+
+
+def test_RankResult_top_k_alternatives_extra():
+    result = data.RankResult(
+        method="foo",
+        alternatives=["a", "b", "c", "d"],
+        values=[3, 1, 4, 2],
+        extra={"score": [0.5, 0.9, 0.1, 0.7], "alfa": [1, 2, 3, 4]},
+        top_k=2,
+        alternatives_extra=("score",),
+    )
+
+    assert len(result.e_.score) == 2
+    np.testing.assert_array_equal(result.e_.score, [0.9, 0.7])
+
+    # the values not listed are not modified
+    assert len(result.e_.alfa) == 4
+
+
+@pytest.mark.parametrize("rank, top_k", [([1, 1, 2], 2), ([1, 2, 3], 0)])
+def test_RankResult_top_k_invalid(rank, top_k):
+    with pytest.raises(ValueError):
+        data.RankResult("foo", ["a", "b", "c"], rank, {}, top_k=top_k)
+
+
 def test_RankResult_repr():
     method = "foo"
     alternatives = ["a", "b", "c"]
@@ -866,3 +1805,98 @@ def test_KernelResult_repr_html():
     )
 
     assert result.remove("style").text() == expected.remove("style").text()
+
+
+# =============================================================================
+# RESULTS SAVE AND LOAD
+# =============================================================================
+
+
+@pytest.mark.parametrize("mmap_mode", [None, "r"])
+def test_RankResult_save_load(tmp_path, mmap_mode):
+    result = data.RankResult(
+        method="foo",
+        alternatives=["a", "b", "c"],
+        values=[2, 1, 3],
+        extra={"alfa": 1, "beta": None, "score": np.array([0.5, 0.7, 0.1])},
+    )
+
+    path = tmp_path / "rank.skcdm"
+    result.save(path)
+    loaded = data.RankResult.load(path, mmap_mode=mmap_mode)
+
+    assert loaded.method == "foo"
+    np.testing.assert_array_equal(loaded.alternatives, ["a", "b", "c"])
+    np.testing.assert_array_equal(loaded.rank_, [2, 1, 3])
+    assert loaded.e_.alfa == 1
+    assert loaded.e_.beta is None
+    np.testing.assert_array_equal(loaded.e_.score, [0.5, 0.7, 0.1])
+
+
+def test_KernelResult_save_load(tmp_path):
+    result = data.KernelResult(
+        method="foo",
+        alternatives=["a", "b", "c"],
+        values=[True, False, True],
+        extra={},
+    )
+
+    path = tmp_path / "kernel.skcdm"
+    result.save(path)
+    loaded = data.KernelResult.load(path)
+
+    np.testing.assert_array_equal(loaded.kernel_, [True, False, True])
+
+    with pytest.raises(ValueError):
+        data.RankResult.load(path)
+
+
+def test_RankResult_pickle():
+    result = data.RankResult(
+        method="foo",
+        alternatives=["a", "b", "c"],
+        values=[2, 1, 3],
+        extra={"alfa": 1, "score": np.array([0.5, 0.7, 0.1])},
+    )
+
+    buffers = []
+    dumped = pickle.dumps(result, protocol=5, buffer_callback=buffers.append)
+    loaded = pickle.loads(dumped, buffers=buffers)
+
+    assert len(buffers) == 2
+    assert loaded.equals(result)
+    assert pickle.loads(pickle.dumps(result, protocol=4)).equals(result)
+    assert loaded.method == "foo"
+    assert loaded.e_.alfa == 1
+    np.testing.assert_array_equal(loaded.e_.score, [0.5, 0.7, 0.1])
+
+
+def test_RankResult_top_k_save_load_pickle(tmp_path):
+    result = data.RankResult("foo", ["a", "b", "c"], [2, 3, 1], {}, top_k=2)
+
+    path = tmp_path / "rank.skcdm"
+    result.save(path)
+    loaded = data.RankResult.load(path)
+    unpickled = pickle.loads(pickle.dumps(result))
+
+    for other in (loaded, unpickled):
+        assert other.top_k == 2
+        assert other.equals(result)
+
+
+def test_KernelResult_pickle():
+    result = data.KernelResult("foo", ["a", "b"], [True, False], {})
+    loaded = pickle.loads(pickle.dumps(result, protocol=5))
+    np.testing.assert_array_equal(loaded.kernel_, [True, False])
+
+
+def test_RankResult_save_invalid_extra(tmp_path):
+    result = data.RankResult(
+        method="foo",
+        alternatives=["a", "b"],
+        values=[1, 2],
+        extra={"alfa": {"not": "supported"}},
+    )
+
+    with pytest.raises(ValueError):
+        result.save(tmp_path / "rank.skcdm")
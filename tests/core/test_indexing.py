@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""test for skcriteria.core.indexing
+
+"""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+import pytest
+
+from skcriteria.core import data
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def make_dm(engine):
+    return data.mkdm(
+        matrix=np.arange(20.0).reshape(5, 4),
+        objectives=[max, min, max, min],
+        weights=[1, 2, 3, 4],
+        alternatives=["a", "b", "c", "d", "e"],
+        criteria=["w", "x", "y", "z"],
+        engine=engine,
+    )
+
+
+# =============================================================================
+# ILOC
+# =============================================================================
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_iloc_slices_are_views(engine):
+    dm = make_dm(engine)
+
+    result = dm.iloc[1:4, ::2]
+
+    assert isinstance(result, data.DecisionMatrix)
+    assert result.engine == engine
+    assert np.shares_memory(result.matrix_view, dm.matrix_view)
+    np.testing.assert_array_equal(
+        result.matrix_view, dm.matrix_view[1:4, ::2]
+    )
+    np.testing.assert_array_equal(result.alternatives, ["b", "c", "d"])
+    np.testing.assert_array_equal(result.criteria, ["w", "y"])
+    np.testing.assert_array_equal(result.iobjectives, [1, 1])
+    np.testing.assert_array_equal(result.weights, [1, 3])
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_iloc_integers_keep_dimensions(engine):
+    dm = make_dm(engine)
+
+    result = dm.iloc[-1, 1]
+
+    assert result.shape == (1, 1)
+    np.testing.assert_array_equal(result.alternatives, ["e"])
+    np.testing.assert_array_equal(result.criteria, ["x"])
+    np.testing.assert_array_equal(result.iobjectives, [-1])
+
+
+def test_iloc_strided_positions_are_views():
+    dm = make_dm("numpy")
+
+    result = dm.iloc[[0, 2, 4]]
+
+    assert np.shares_memory(result.matrix_view, dm.matrix_view)
+    np.testing.assert_array_equal(result.alternatives, ["a", "c", "e"])
+
+
+def test_iloc_arrays():
+    dm = make_dm("numpy")
+
+    result = dm.iloc[[3, 0], [True, False, False, True]]
+
+    assert not np.shares_memory(result.matrix_view, dm.matrix_view)
+    np.testing.assert_array_equal(result.matrix_view, [[12, 15], [0, 3]])
+    np.testing.assert_array_equal(result.alternatives, ["d", "a"])
+    np.testing.assert_array_equal(result.criteria, ["w", "z"])
+    np.testing.assert_array_equal(result.weights, [1, 4])
+    assert dm.iloc[[]].shape == (0, 4)
+
+
+@pytest.mark.parametrize(
+    "key",
+    [5, -6, [0, 5], [True, False], ["a"], (0, 1, 2)],
+)
+def test_iloc_invalid(key):
+    dm = make_dm("numpy")
+    with pytest.raises(IndexError):
+        dm.iloc[key]
+
+
+# =============================================================================
+# LOC
+# =============================================================================
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_loc(engine):
+    dm = make_dm(engine)
+
+    result = dm.loc["b":"d", ["x", "z"]]
+
+    assert result.equals(dm.iloc[1:4, [1, 3]])
+    assert np.shares_memory(result.matrix_view, dm.matrix_view)
+    assert dm.loc["c"].equals(dm.iloc[2])
+    assert dm.loc[[True, False, True, False, False]].equals(dm.iloc[[0, 2]])
+
+
+def test_loc_invalid():
+    dm = make_dm("numpy")
+    with pytest.raises(KeyError):
+        dm.loc["foo"]
+    with pytest.raises(KeyError):
+        dm.loc[["a", "foo"]]
@@ -171,6 +171,22 @@ def test_SKCMatrixAndWeightTransformerMixin_target():
     assert foo.target == Foo._TARGET_BOTH
 
 
+def test_SKCMatrixAndWeightTransformerMixin_preserve_engine(decision_matrix):
+    class Foo(methods.SKCMatrixAndWeightTransformerABC, methods.SKCMethodABC):
+        def _transform_matrix(self, matrix):
+            return matrix * 2
+
+        def _transform_weights(self, weights):
+            return weights
+
+    dm = decision_matrix(seed=42).copy(engine="numpy")
+
+    result = Foo("both").transform(dm)
+
+    assert result.engine == "numpy"
+    np.testing.assert_array_equal(result.matrix_view, dm.matrix_view * 2)
+
+
 # =============================================================================
 # MATRIX AND WEIGHT TRANSFORMER
 # =============================================================================
@@ -219,6 +235,7 @@ def test_flow_SKCWeighterMixin(decision_matrix):
     result = transformer.transform(dm)
 
     assert result.equals(expected)
+    assert np.shares_memory(result.matrix_view, dm.matrix_view)
 
 
 # =============================================================================
@@ -299,3 +316,193 @@ def test_make_result_not_implemented_SKCDecisionMakerMixin(decision_matrix):
 
     with pytest.raises(NotImplementedError):
         ranker.evaluate(dm)
+
+
+# =============================================================================
+# ARRAYS PROTOCOL
+# =============================================================================
+
+
+def test_transform_arrays(decision_matrix):
+    class Foo(methods.SKCMatrixAndWeightTransformerABC):
+        def _transform_matrix(self, matrix):
+            return matrix * 2
+
+        def _transform_weights(self, weights):
+            return weights / 2
+
+    dm = decision_matrix(seed=42)
+    data = methods.dm_to_arrays(dm)
+    assert data["stats"] is dm.stats
+
+    result = Foo("both").transform_arrays(data)
+
+    assert isinstance(result, dict)
+    assert result["stats"] is None
+    np.testing.assert_array_equal(result["matrix"], dm.matrix_view * 2)
+    np.testing.assert_array_equal(result["weights"], dm.weights / 2)
+
+    # the input is not modified
+    assert data["stats"] is dm.stats
+    assert data["matrix"] is not result["matrix"]
+
+    # the statistics are kept when the matrix is not transformed
+    result = Foo("weights").transform_arrays(data)
+    assert result["stats"] is dm.stats
+
+    new_dm = methods.arrays_to_dm(result)
+    assert new_dm.stats is dm.stats
+    assert new_dm.aequals(Foo("weights").transform(dm))
+
+
+def test_transform_arrays_without_stats(decision_matrix):
+    class Foo(methods.SKCWeighterABC):
+        def _weight_matrix(self, matrix, **kwargs):
+            return np.ones(matrix.shape[1])
+
+    dm = decision_matrix(seed=42)
+
+    result = Foo().transform_arrays(dm.to_dict())
+
+    assert result["stats"] is None
+    np.testing.assert_array_equal(result["weights"], np.ones(dm.shape[1]))
+
+
+def test_evaluate_arrays(decision_matrix):
+    class Foo(methods.SKCDecisionMakerABC):
+        def _evaluate_data(self, alternatives, **kwargs):
+            return np.arange(len(alternatives)) + 1, {}
+
+        def _make_result(self, alternatives, values, extra):
+            return data.RankResult(
+                "Foo", alternatives=alternatives, values=values, extra=extra
+            )
+
+    dm = decision_matrix(seed=42)
+
+    result = Foo().evaluate_arrays(dm.to_dict(copy=False))
+
+    assert result.equals(Foo().evaluate(dm))
+
+
+def test_arrays_to_dm_engine():
+    dm = data.mkdm(matrix=[[1, 0], [0, 2]], objectives=[max, min])
+    arrays = methods.dm_to_arrays(dm)
+
+    assert methods.arrays_to_dm(arrays, engine="numpy").engine == "numpy"
+    assert methods.arrays_to_dm(arrays, engine="sparse").engine == "numpy"
+
+    sparse_dm = methods.arrays_to_dm(
+        dict(arrays, matrix=dm.sparse_view, stats=None)
+    )
+    assert sparse_dm.engine == "sparse"
+    assert sparse_dm.equals(dm)
+
+
+def test_transform_out(decision_matrix):
+    class WithOut(methods.SKCMatrixAndWeightTransformerABC):
+        def _transform_matrix(self, matrix, out=None):
+            return np.multiply(matrix, 2, out=out)
+
+        def _transform_weights(self, weights):
+            return weights
+
+    class WithoutOut(methods.SKCMatrixAndWeightTransformerABC):
+        def _transform_matrix(self, matrix):
+            return matrix * 2
+
+        def _transform_weights(self, weights):
+            return weights
+
+    dm = decision_matrix(seed=42)
+    data = methods.dm_to_arrays(dm)
+
+    for transformer in (WithOut("matrix"), WithoutOut("matrix")):
+        out = np.empty(dm.shape)
+        result = transformer.transform_arrays(data, out=out)
+        assert result["matrix"] is out
+        assert result["stats"] is None
+        np.testing.assert_array_equal(out, dm.matrix_view * 2)
+
+    # the output is ignored if the matrix is not transformed
+    out = np.zeros(dm.shape)
+    result = WithOut("weights").transform_arrays(data, out=out)
+    assert result["matrix"] is data["matrix"]
+    assert result["stats"] is dm.stats
+    assert not out.any()
+
+    # in place
+    matrix = dm.matrix_view.copy()
+    result = WithOut("matrix").transform_arrays(
+        dict(data, matrix=matrix, stats=None), out=matrix
+    )
+    assert result["matrix"] is matrix
+    np.testing.assert_array_equal(matrix, dm.matrix_view * 2)
+
+
+# =============================================================================
+# MANY WEIGHTS
+# =============================================================================
+
+
+def test_evaluate_weights_default(decision_matrix):
+    class Foo(methods.SKCDecisionMakerABC):
+        def _evaluate_data(self, matrix, weights, **kwargs):
+            score = matrix @ weights
+            rank = np.argsort(np.argsort(-score)) + 1
+            return rank, {"score": score, "name": "foo", "w": weights[:1]}
+
+        def _make_result(self, alternatives, values, extra):
+            return data.RankResult(
+                "Foo", alternatives=alternatives, values=values, extra=extra
+            )
+
+    dm = decision_matrix(seed=42)
+    weights = np.random.default_rng(42).random((4, dm.shape[1]))
+
+    result = Foo().evaluate_weights(dm, weights)
+
+    assert result.shape == (4, len(dm))
+    assert result.method == "Foo"
+    assert result.e_.score.shape == (4, len(dm))
+    assert result.e_.name.dtype == object
+    for idx, wvector in enumerate(weights):
+        expected = Foo().evaluate(dm.copy(weights=wvector))
+        assert result[idx].equals(expected)
+        assert result[idx].e_.name == "foo"
+        np.testing.assert_array_equal(
+            result[idx].alternatives, dm.alternatives
+        )
+
+
+def test_evaluate_top_k_default(decision_matrix):
+    class Foo(methods.SKCDecisionMakerABC):
+        _skcriteria_alternatives_extra = ("score",)
+
+        def _evaluate_data(self, matrix, weights, **kwargs):
+            score = matrix @ weights
+            rank = np.argsort(np.argsort(-score)) + 1
+            return rank, {"score": score, "name": "foo"}
+
+        def _make_result(self, alternatives, values, extra):
+            return data.RankResult(
+                "Foo", alternatives=alternatives, values=values, extra=extra
+            )
+
+    dm = decision_matrix(seed=42)
+    expected = Foo().evaluate(dm)
+    order = np.argsort(expected.rank_)[:2]
+
+    result = Foo().evaluate(dm, top_k=2)
+
+    assert result.method == "Foo"
+    assert result.top_k == 2
+    np.testing.assert_array_equal(result.rank_, [1, 2])
+    np.testing.assert_array_equal(
+        result.alternatives, expected.alternatives[order]
+    )
+    np.testing.assert_array_equal(result.e_.score, expected.e_.score[order])
+    assert result.e_.name == "foo"
+
+    with pytest.raises(ValueError):
+        Foo().evaluate(dm, top_k=0)
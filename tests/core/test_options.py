@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""test for skcriteria.core.options
+
+"""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+import pytest
+
+from skcriteria.core import options
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+def test_get_option_default():
+    assert options.get_option("engine") == "pandas"
+
+
+def test_set_and_reset_option():
+    options.set_option("engine", "numpy")
+    try:
+        assert options.get_option("engine") == "numpy"
+    finally:
+        options.reset_option("engine")
+    assert options.get_option("engine") == "pandas"
+
+
+def test_option_context():
+    with options.option_context(engine="numpy"):
+        assert options.get_option("engine") == "numpy"
+    assert options.get_option("engine") == "pandas"
+
+
+def test_option_context_restore_on_error():
+    with pytest.raises(ZeroDivisionError):
+        with options.option_context(engine="numpy"):
+            1 / 0
+    assert options.get_option("engine") == "pandas"
+
+
+def test_set_option_invalid_value():
+    with pytest.raises(ValueError):
+        options.set_option("engine", "foo")
+    assert options.get_option("engine") == "pandas"
+
+
+@pytest.mark.parametrize("func", [options.get_option, options.reset_option])
+def test_unknown_option(func):
+    with pytest.raises(KeyError):
+        func("foo")
+
+
+def test_set_unknown_option():
+    with pytest.raises(KeyError):
+        options.set_option("foo", 1)
+
+
+# =============================================================================
+# PRECISION
+# =============================================================================
+
+
+@pytest.mark.parametrize("value", ["float32", np.float32, "f4"])
+def test_set_option_precision(value):
+    with options.option_context(precision=value):
+        assert options.get_option("precision") == "float32"
+    assert options.get_option("precision") == "float64"
+
+
+@pytest.mark.parametrize("value", ["float16", int])
+def test_set_option_invalid_precision(value):
+    with pytest.raises(ValueError):
+        options.set_option("precision", value)
+
+
+@pytest.mark.parametrize(
+    "dtypes, expected",
+    [
+        ([], np.float64),
+        ([int], np.float64),
+        ([np.float64, np.float32], np.float64),
+        ([np.float32, int, object], np.float32),
+        ([np.float16], np.float32),
+        (["category"], np.float64),
+    ],
+)
+def test_float_dtype(dtypes, expected):
+    assert options.float_dtype(*dtypes) == expected
+
+
+def test_float_dtype_precision_float32():
+    with options.option_context(precision="float32"):
+        assert options.float_dtype(np.float64) == np.float32
+        assert options.float_dtype() == np.float32
+
+
+def test_storage_dtype():
+    assert options.storage_dtype(np.float64) == np.float64
+    with options.option_context(precision="float32"):
+        assert options.storage_dtype(np.float64) == np.float32
+        assert options.storage_dtype(np.int64) == np.int64
+
+
+def test_as_float_array():
+    arr = np.ones(3, dtype=np.float32)
+    assert options.as_float_array(arr) is arr
+    assert options.as_float_array(arr, copy=True) is not arr
+    assert options.as_float_array([1, 2]).dtype == np.float64
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""test for skcriteria.core.shared
+
+"""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import pytest
+
+from skcriteria.core import data, shared
+from skcriteria.madm.simple import WeightedSumModel
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def evaluate_shared(handle):
+    dm = handle.attach()
+    result = WeightedSumModel().evaluate(dm)
+    return dm.matrix_view.flags.writeable, result.rank_, result.e_.score
+
+
+def evaluate_detached(handle):
+    with handle:
+        WeightedSumModel().evaluate(handle.attach())
+    return len(shared._SEGMENTS)
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_SharedDecisionMatrix_attach(decision_matrix, engine):
+    dm = decision_matrix(seed=42).copy(engine=engine)
+
+    with dm.share() as handle:
+        assert isinstance(handle, shared.SharedDecisionMatrix)
+        assert handle.owner
+        assert handle.shape == dm.shape
+
+        result = handle.attach()
+        assert result.engine == "numpy"
+        assert not result.matrix_view.flags.writeable
+        assert result.equals(dm)
+        del result
+
+
+def test_SharedDecisionMatrix_pickle():
+    dm = data.mkdm([[1, 2], [3, 4]], [max, min], [1, 2])
+
+    with dm.share() as handle:
+        other = pickle.loads(pickle.dumps(handle))
+
+        assert not other.owner
+        assert other.name == handle.name
+        assert len(pickle.dumps(handle)) < dm.matrix_view.nbytes + 1024
+        assert other.attach().equals(dm)
+
+        # only the owner releases the memory
+        other.close()
+        assert other.attach().equals(dm)
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=handle.name)
+
+
+def test_SharedDecisionMatrix_detach():
+    dm = data.mkdm([[1, 2], [3, 4]], [max, min])
+
+    with dm.share() as handle:
+        other = pickle.loads(pickle.dumps(handle))
+        result = other.attach()
+
+        # in use
+        other.detach()
+        assert handle.name in shared._SEGMENTS
+
+        del result
+        other.detach()
+        assert handle.name not in shared._SEGMENTS
+        assert other.attach().equals(dm)
+
+    assert handle.name not in shared._SEGMENTS
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=handle.name)
+
+
+def test_SharedDecisionMatrix_process_pool_release():
+    dm = data.mkdm([[1, 2], [3, 4]], [max, max])
+
+    with ProcessPoolExecutor(1) as executor:
+        segments = []
+        for _ in range(5):
+            with dm.share() as handle:
+                segments.append(
+                    executor.submit(evaluate_detached, handle).result()
+                )
+
+    assert segments == [0] * 5
+
+
+def test_SharedDecisionMatrix_object_labels():
+    dm = data.DecisionMatrix._from_parts(
+        matrix=np.array([[1, 2], [3, 4]]),
+        objectives=[1, -1],
+        weights=[1, 1],
+        alternatives=np.array([1, "b"], dtype=object),
+        criteria=np.array(["x", "y"], dtype=object),
+    )
+
+    with dm.share() as handle:
+        result = handle.attach()
+        assert result.alternatives.tolist() == [1, "b"]
+        assert result.criteria.tolist() == ["x", "y"]
+        assert result.criteria.dtype != object
+        del result
+
+
+def test_SharedDecisionMatrix_process_pool():
+    dm = data.mkdm(
+        np.random.default_rng(42).random((10, 3)), [max, max, max], [1, 2, 3]
+    )
+    expected = WeightedSumModel().evaluate(dm)
+
+    with dm.share() as handle, ProcessPoolExecutor(1) as executor:
+        future = executor.submit(evaluate_shared, handle)
+        writeable, rank, score = future.result()
+
+    assert not writeable
+    np.testing.assert_array_equal(rank, expected.rank_)
+    np.testing.assert_allclose(score, expected.e_.score)
+
+
+def test_SharedDecisionMatrix_repr():
+    dm = data.mkdm([[1, 2], [3, 4]], [max, min])
+    with dm.share() as handle:
+        assert repr(handle) == (
+            f"<SharedDecisionMatrix {handle.name!r} "
+            "2 Alternatives x 2 Criteria>"
+        )
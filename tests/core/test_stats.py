@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""test for skcriteria.core.stats
+
+"""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+import pytest
+
+from scipy import sparse
+
+from skcriteria.core import data, stats
+from skcriteria.madm import similarity
+from skcriteria.madm.moora import ReferencePointMOORA
+from skcriteria.madm.similarity import TOPSIS
+from skcriteria.preprocessing.scalers import MinMaxScaler, SumScaler
+from skcriteria.preprocessing.weighters import StdWeighter
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+def test_CriteriaStats():
+    matrix = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 12]])
+    cstats = stats.CriteriaStats(matrix)
+
+    assert cstats.computed == frozenset()
+    assert repr(cstats) == "<CriteriaStats computed=[]>"
+
+    np.testing.assert_array_equal(cstats.mins, [1, 2, 3])
+    np.testing.assert_array_equal(cstats.maxs, [7, 8, 12])
+    np.testing.assert_allclose(cstats.sums, [12, 15, 21])
+    np.testing.assert_allclose(cstats.sumsq, [66, 93, 189])
+    np.testing.assert_allclose(cstats.mean, [4, 5, 7])
+    np.testing.assert_allclose(cstats.std, np.std(matrix, axis=0))
+    np.testing.assert_allclose(cstats.norm, np.linalg.norm(matrix, axis=0))
+
+    assert cstats.computed == {
+        "counts",
+        "mins",
+        "maxs",
+        "sums",
+        "sumsq",
+        "mean",
+        "std",
+        "norm",
+    }
+    assert repr(cstats) == (
+        "<CriteriaStats computed=[counts, maxs, mean, mins, norm, std, sums, "
+        "sumsq]>"
+    )
+
+
+def test_CriteriaStats_missing_values():
+    matrix = np.array([[1.0, np.nan], [3.0, 4.0], [np.nan, 8.0]])
+    cstats = stats.CriteriaStats(matrix)
+
+    np.testing.assert_array_equal(cstats.counts, [2, 2])
+    np.testing.assert_array_equal(cstats.mins, [1, 4])
+    np.testing.assert_array_equal(cstats.maxs, [3, 8])
+    np.testing.assert_allclose(cstats.sums, [4, 12])
+    np.testing.assert_allclose(cstats.mean, [2, 6])
+    np.testing.assert_allclose(cstats.std, [1, 2])
+    np.testing.assert_allclose(cstats.norm, [np.sqrt(10), np.sqrt(80)])
+
+
+@pytest.mark.parametrize("fmt", ["csr", "csc"])
+def test_CriteriaStats_sparse(fmt):
+    matrix = np.array([[1.0, 0.0, -2.0], [0.0, 0.0, 3.0], [4.0, np.nan, 0.0]])
+    cstats = stats.CriteriaStats(sparse.csr_matrix(matrix).asformat(fmt))
+    expected = stats.CriteriaStats(matrix)
+
+    for stat in ("counts", "mins", "maxs", "sums", "sumsq", "mean", "std"):
+        np.testing.assert_allclose(
+            getattr(cstats, stat), getattr(expected, stat), err_msg=stat
+        )
+    np.testing.assert_allclose(cstats.norm, expected.norm)
+
+
+def test_CriteriaStats_memoized():
+    cstats = stats.CriteriaStats(np.array([[1.0, 2.0], [3.0, 4.0]]))
+    assert cstats.std is cstats.std
+    assert cstats.mins is cstats.mins
+
+
+def test_CriteriaStats_keepdims():
+    cstats = stats.CriteriaStats(np.array([[1, 2], [3, 4]]))
+
+    mins = cstats.keepdims("mins")
+    assert mins.shape == (1, 2)
+    assert mins.dtype.kind == "i"
+
+    maxs = cstats.keepdims("maxs", dtype=np.float32)
+    assert maxs.dtype == np.float32
+    np.testing.assert_array_equal(maxs, [[3, 4]])
+
+
+def test_CriteriaStats_batch():
+    matrix = np.random.default_rng(42).random((3, 5, 4))
+    cstats = stats.CriteriaStats(matrix)
+    np.testing.assert_array_equal(cstats.mins, np.min(matrix, axis=1))
+    np.testing.assert_allclose(cstats.norm, np.linalg.norm(matrix, axis=1))
+
+
+def test_CriteriaStats_append():
+    matrix = np.array([[1.0, 2.0], [3.0, 4.0]])
+    rows = np.array([[-1.0, 10.0]])
+    full = np.vstack([matrix, rows])
+
+    cstats = stats.CriteriaStats(matrix)
+    cstats.mins, cstats.sums, cstats.sumsq
+
+    new_stats = cstats.append(full, rows)
+    assert new_stats.computed == {"mins", "sums", "sumsq"}
+    np.testing.assert_array_equal(new_stats.mins, [-1, 2])
+    np.testing.assert_allclose(new_stats.sums, [3, 16])
+    np.testing.assert_allclose(new_stats.norm, np.linalg.norm(full, axis=0))
+    np.testing.assert_array_equal(new_stats.maxs, [3, 10])
+
+    # nothing appended
+    same = cstats.append(matrix, rows[:0])
+    assert same.computed == cstats.computed
+
+
+def test_CriteriaStats_append_missing_values():
+    matrix = np.array([[1.0, 2.0, np.nan], [3.0, 4.0, 5.0]])
+    rows = np.array([[np.nan, 10.0, 0.0], [np.nan, np.nan, 7.0]])
+    full = np.vstack([matrix, rows])
+
+    cstats = stats.CriteriaStats(matrix)
+    cstats.mins, cstats.maxs, cstats.sums, cstats.sumsq, cstats.counts
+
+    new_stats = cstats.append(full, rows)
+    expected = stats.CriteriaStats(full)
+
+    for name in ("mins", "maxs", "sums", "sumsq", "counts", "mean", "norm"):
+        np.testing.assert_allclose(
+            getattr(new_stats, name), getattr(expected, name)
+        )
+
+
+def test_CriteriaStats_subset():
+    matrix = np.array([[1.0, 2.0], [3.0, 6.0]])
+    cstats = stats.CriteriaStats(matrix)
+
+    subset = cstats.subset(["mins", "sums", "counts"])
+
+    assert subset.computed == {"mins", "sums", "counts"}
+    np.testing.assert_array_equal(subset.mins, [1, 2])
+    np.testing.assert_allclose(subset.mean, [2, 4])
+    with pytest.raises(ValueError):
+        subset.maxs
+
+
+# =============================================================================
+# DECISION MATRIX
+# =============================================================================
+
+
+def test_DecisionMatrix_stats(decision_matrix):
+    dm = decision_matrix(seed=42)
+    assert dm.stats is dm.stats
+    np.testing.assert_array_equal(dm.stats.mins, np.min(dm.matrix, axis=0))
+
+
+def test_DecisionMatrix_stats_append():
+    dm = data.mkdm(matrix=[[1, 2], [3, 4]], objectives=[max, min])
+    dm.stats.maxs
+
+    new_dm = dm.append_alternatives([[10, -1]], alternatives=["A2"])
+    assert new_dm.stats.computed == {"maxs"}
+    np.testing.assert_array_equal(new_dm.stats.maxs, [10, 4])
+    np.testing.assert_array_equal(new_dm.stats.mins, [1, -1])
+
+
+def test_DecisionMatrix_stats_append_missing_values():
+    dm = data.mkdm(matrix=[[1.0, 2.0], [3.0, 4.0]], objectives=[max, max])
+    dm.stats.mins, dm.stats.maxs
+
+    new_dm = dm.append_alternatives(
+        [[np.nan, 6.0], [5.0, np.nan]], alternatives=["A2", "A3"]
+    )
+    expected = data.mkdm(**new_dm.to_dict())
+
+    np.testing.assert_array_equal(new_dm.stats.mins, [1, 2])
+    np.testing.assert_array_equal(new_dm.stats.maxs, [5, 6])
+    assert TOPSIS().evaluate(new_dm).equals(TOPSIS().evaluate(expected))
+
+
+# =============================================================================
+# CONSUMERS
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "transformer", [MinMaxScaler("matrix"), SumScaler("both"), StdWeighter()]
+)
+def test_transform_with_stats(transformer, decision_matrix):
+    dm = decision_matrix(seed=42, min_objectives_proportion=0.5)
+    expected = transformer.transform(data.mkdm(**dm.to_dict()))
+
+    dm.stats.mins, dm.stats.maxs, dm.stats.sums, dm.stats.std
+    result = transformer.transform(dm)
+
+    assert result.aequals(expected)
+
+
+def test_transform_weights_keep_stats(decision_matrix):
+    dm = decision_matrix(seed=42)
+    result = SumScaler(target="weights").transform(dm)
+    assert result.stats is dm.stats
+
+    result = SumScaler(target="matrix").transform(dm)
+    assert result.stats is not dm.stats
+
+
+@pytest.mark.parametrize("dmaker", [TOPSIS(), ReferencePointMOORA()])
+def test_evaluate_with_stats(dmaker, decision_matrix):
+    dm = decision_matrix(seed=42, min_objectives_proportion=0.5)
+    expected = dmaker.evaluate(data.mkdm(**dm.to_dict()))
+
+    result = dmaker.evaluate(dm)
+
+    assert dm.stats.computed >= {"mins", "maxs"}
+    assert result.equals(expected)
+    for key, value in expected.e_.items():
+        np.testing.assert_array_equal(result.e_[key], value)
+
+
+def test_topsis_with_stats_negative_weights():
+    matrix = np.array([[1.0, 5.0], [3.0, 2.0], [2.0, 9.0]])
+    objectives = np.array([1, -1])
+    weights = np.array([-0.5, 2.0])
+    cstats = stats.CriteriaStats(matrix)
+
+    expected = similarity.topsis(matrix, objectives, weights)
+    result = similarity.topsis(matrix, objectives, weights, stats=cstats)
+
+    for res, exp in zip(result, expected):
+        np.testing.assert_array_equal(res, exp)
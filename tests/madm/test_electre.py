@@ -179,3 +179,15 @@ def test_kernel_sensibility_barba1997decisiones():
                 f"alternatives in kernel. {kernels_len}"
             )
         kernels_len.append(klen)
+
+
+def test_ELECTRE1_evaluate_weights_fail():
+    dm = skcriteria.mkdm([[1, 2], [3, 4]], objectives=[max, max])
+    with pytest.raises(TypeError):
+        ELECTRE1().evaluate_weights(dm, [[1, 1]])
+
+
+def test_ELECTRE1_evaluate_top_k_fail():
+    dm = skcriteria.mkdm([[1, 2], [3, 4]], objectives=[max, max])
+    with pytest.raises(TypeError):
+        ELECTRE1().evaluate(dm, top_k=1)
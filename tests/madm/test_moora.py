@@ -20,7 +20,7 @@ import numpy as np
 import pytest
 
 import skcriteria
-from skcriteria.core import RankResult
+from skcriteria.core import DecisionMatrixBatch, RankResult
 from skcriteria.madm.moora import (
     FullMultiplicativeForm,
     MultiMOORA,
@@ -28,6 +28,7 @@ from skcriteria.madm.moora import (
     ReferencePointMOORA,
 )
 from skcriteria.preprocessing.scalers import VectorScaler
+from skcriteria.utils import chunks
 
 
 # =============================================================================
@@ -88,6 +89,18 @@ def test_RatioMOORA_kracka2010ranking():
 # =============================================================================
 
 
+def test_RatioMOORA_missing_values():
+    dm = skcriteria.mkdm(
+        matrix=[[1, np.nan, 3], [2, 5, 6]],
+        objectives=[max, min, max],
+    )
+
+    result = RatioMOORA().evaluate(dm)
+
+    np.testing.assert_array_equal(result.rank_, [1, 2])
+    np.testing.assert_array_equal(result.e_.score, [4.0, 3.0])
+
+
 def test_ReferencePointMOORA_kracka2010ranking():
     """
     Data From:
@@ -146,6 +159,105 @@ def test_ReferencePointMOORA_kracka2010ranking():
     assert np.allclose(result.e_.reference_point, expected.e_.reference_point)
 
 
+def test_ReferencePointMOORA_by_chunks(decision_matrix, monkeypatch):
+    dm = decision_matrix(seed=42, min_alternatives=20, max_alternatives=30)
+    ranker = ReferencePointMOORA()
+
+    expected = ranker.evaluate(dm)
+
+    monkeypatch.setattr(chunks, "CHUNK_SIZE", 7)
+    result = ranker.evaluate(dm)
+
+    assert result.equals(expected)
+    assert np.all(result.e_.score == expected.e_.score)
+
+
+@pytest.mark.parametrize("ranker", [RatioMOORA(), ReferencePointMOORA()])
+def test_MOORA_evaluate_batch(ranker):
+    random = np.random.default_rng(seed=42)
+    batch = DecisionMatrixBatch(
+        random.random((5, 7, 4)),
+        objectives=[max, min, max, min],
+        weights=random.random((5, 4)),
+    )
+
+    result = ranker.evaluate_batch(batch)
+
+    assert result.shape == (5, 7)
+    for idx, dm in enumerate(batch):
+        expected = ranker.evaluate(dm)
+        assert result[idx].equals(expected)
+        assert np.allclose(result[idx].e_.score, expected.e_.score)
+
+
+def test_ReferencePointMOORA_evaluate_batch_by_chunks(monkeypatch):
+    random = np.random.default_rng(seed=42)
+    batch = DecisionMatrixBatch(
+        random.random((3, 20, 4)), objectives=[max, min, max, min]
+    )
+    ranker = ReferencePointMOORA()
+
+    expected = ranker.evaluate_batch(batch)
+
+    monkeypatch.setattr(chunks, "CHUNK_SIZE", 7)
+    result = ranker.evaluate_batch(batch)
+
+    assert np.all(result.rank_ == expected.rank_)
+    assert np.all(result.e_.score == expected.e_.score)
+
+
+@pytest.mark.parametrize("ranker", [RatioMOORA(), ReferencePointMOORA()])
+def test_MOORA_evaluate_weights(ranker, monkeypatch):
+    random = np.random.default_rng(seed=42)
+    dm = skcriteria.mkdm(
+        random.random((20, 4)), objectives=[max, min, max, min]
+    )
+    weights = random.random((6, 4))
+    weights[2, 1] = -0.5
+
+    result = ranker.evaluate_weights(dm, weights)
+
+    assert result.shape == (6, 20)
+    for idx, wvector in enumerate(weights):
+        expected = ranker.evaluate(dm.copy(weights=wvector))
+        assert result[idx].equals(expected)
+        assert np.allclose(result[idx].e_.score, expected.e_.score)
+
+    # the same result by blocks of weights
+    monkeypatch.setattr(chunks, "CHUNK_SIZE", 50)
+    by_chunks = ranker.evaluate_weights(dm, weights)
+    assert np.all(by_chunks.rank_ == result.rank_)
+    assert np.all(by_chunks.e_.score == result.e_.score)
+
+
+@pytest.mark.parametrize(
+    "ranker",
+    [RatioMOORA(), ReferencePointMOORA(), FullMultiplicativeForm()],
+)
+def test_MOORA_evaluate_top_k(ranker):
+    random = np.random.default_rng(seed=42)
+    dm = skcriteria.mkdm(
+        random.integers(1, 5, (30, 4)), objectives=[max, min, max, min]
+    )
+    expected = ranker.evaluate(dm)
+    order = np.argsort(expected.rank_)[:4]
+
+    result = ranker.evaluate(dm, top_k=4)
+
+    assert result.top_k == 4
+    np.testing.assert_array_equal(result.rank_, [1, 2, 3, 4])
+    np.testing.assert_array_equal(
+        result.alternatives, expected.alternatives[order]
+    )
+    np.testing.assert_array_equal(result.e_.score, expected.e_.score[order])
+
+
+def test_FullMultiplicativeForm_evaluate_batch_not_supported():
+    batch = DecisionMatrixBatch(np.ones((2, 3, 2)), objectives=[max, min])
+    with pytest.raises(TypeError):
+        FullMultiplicativeForm().evaluate_batch(batch)
+
+
 # =============================================================================
 # FMF
 # =============================================================================
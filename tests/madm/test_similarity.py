@@ -20,7 +20,7 @@ import numpy as np
 import pytest
 
 import skcriteria
-from skcriteria.core import RankResult
+from skcriteria.core import DecisionMatrixBatch, RankResult
 from skcriteria.madm.similarity import TOPSIS
 from skcriteria.preprocessing.scalers import VectorScaler
 
@@ -57,11 +57,115 @@ def test_TOPSIS():
     assert np.allclose(result.e_.similarity, expected.e_.similarity)
 
 
+def test_TOPSIS_float32():
+    dm = skcriteria.mkdm(
+        matrix=np.array([[1, 0, 3], [0, 5, 6]], dtype=np.float32),
+        objectives=[max, max, max],
+    )
+
+    result = TOPSIS().evaluate(dm)
+
+    assert result.rank_.dtype == np.int32
+    assert result.e_.similarity.dtype == np.float32
+    assert np.allclose(result.e_.similarity, [0.14639248, 0.85360752])
+
+
+@pytest.mark.parametrize("metric", ["euclidean", "cityblock"])
+def test_TOPSIS_missing_values(metric):
+    dm = skcriteria.mkdm(
+        matrix=[[1, np.nan, 3], [0, 5, 6], [1, 4, np.nan]],
+        objectives=[max, max, max],
+    )
+
+    result = TOPSIS(metric=metric).evaluate(dm)
+
+    np.testing.assert_array_equal(result.e_.ideal, [1, 5, 6])
+    np.testing.assert_array_equal(result.e_.anti_ideal, [0, 4, 3])
+    assert not np.any(np.isnan(result.e_.similarity))
+
+    # the missing values are ignored in the distances
+    expected = TOPSIS(metric=metric).evaluate(
+        skcriteria.mkdm(matrix=[[1, 3], [0, 6]], objectives=[max, max])
+    )
+    assert result.e_.similarity[0] < result.e_.similarity[1]
+    assert expected.e_.similarity[0] < expected.e_.similarity[1]
+
+
+@pytest.mark.parametrize("metric", ["euclidean", "cityblock"])
+def test_TOPSIS_evaluate_batch(metric):
+    random = np.random.default_rng(seed=42)
+    batch = DecisionMatrixBatch(
+        random.random((5, 7, 4)),
+        objectives=[max, max, max, max],
+        weights=random.random((5, 4)),
+    )
+    ranker = TOPSIS(metric=metric)
+
+    result = ranker.evaluate_batch(batch)
+
+    for idx, dm in enumerate(batch):
+        expected = ranker.evaluate(dm)
+        assert result[idx].equals(expected)
+        assert np.allclose(result[idx].e_.ideal, expected.e_.ideal)
+        assert np.allclose(result[idx].e_.similarity, expected.e_.similarity)
+
+
 def test_TOPSIS_invalid_metric():
     with pytest.raises(ValueError):
         TOPSIS(metric="foo")
 
 
+@pytest.mark.parametrize("metric", ["euclidean", "cityblock"])
+def test_TOPSIS_evaluate_weights(metric):
+    random = np.random.default_rng(seed=42)
+    matrix = random.random((15, 4))
+    matrix[3, 2] = np.nan
+    dm = skcriteria.mkdm(matrix, objectives=[max, max, max, max])
+    weights = random.random((8, 4))
+    weights[5, 0] = -0.3
+    ranker = TOPSIS(metric=metric)
+
+    result = ranker.evaluate_weights(dm, weights)
+
+    assert result.shape == (8, 15)
+    for idx, wvector in enumerate(weights):
+        expected = ranker.evaluate(dm.copy(weights=wvector))
+        assert result[idx].equals(expected)
+        assert np.allclose(result[idx].e_.ideal, expected.e_.ideal)
+        assert np.allclose(
+            result[idx].e_.anti_ideal, expected.e_.anti_ideal
+        )
+        assert np.allclose(result[idx].e_.similarity, expected.e_.similarity)
+
+
+def test_TOPSIS_evaluate_weights_invalid_shape():
+    dm = skcriteria.mkdm([[1, 2], [3, 4]], objectives=[max, max])
+    with pytest.raises(ValueError):
+        TOPSIS().evaluate_weights(dm, [1, 2])
+    with pytest.raises(ValueError):
+        TOPSIS().evaluate_weights(dm, [[1, 2, 3]])
+
+
+@pytest.mark.parametrize("metric", ["euclidean", "cityblock"])
+def test_TOPSIS_evaluate_top_k(metric):
+    random = np.random.default_rng(seed=42)
+    dm = skcriteria.mkdm(random.random((25, 4)), objectives=[max] * 4)
+    ranker = TOPSIS(metric=metric)
+    expected = ranker.evaluate(dm)
+    order = np.argsort(expected.rank_)[:3]
+
+    result = ranker.evaluate(dm, top_k=3)
+
+    assert result.top_k == 3
+    np.testing.assert_array_equal(
+        result.alternatives, expected.alternatives[order]
+    )
+    np.testing.assert_array_equal(
+        result.e_.similarity, expected.e_.similarity[order]
+    )
+    np.testing.assert_array_equal(result.e_.ideal, expected.e_.ideal)
+
+
 def test_TOPSIS_minimize_warning():
 
     dm = skcriteria.mkdm(
@@ -21,8 +21,10 @@ import numpy as np
 
 import pytest
 
+from scipy import sparse
+
 import skcriteria
-from skcriteria.core import RankResult
+from skcriteria.core import DecisionMatrixBatch, RankResult
 from skcriteria.madm.simple import WeightedProductModel, WeightedSumModel
 from skcriteria.preprocessing.invert_objectives import MinimizeToMaximize
 from skcriteria.preprocessing.scalers import SumScaler
@@ -52,6 +54,110 @@ def test_WeightedSumModel():
     assert np.all(result.e_.score == expected.e_.score)
 
 
+def test_WeightedSumModel_missing_values():
+    dm = skcriteria.mkdm(
+        matrix=np.ma.masked_array(
+            [[1, 0, 3], [0, 5, 6]], mask=[[0, 0, 1], [0, 0, 0]]
+        ),
+        objectives=[max, max, max],
+    )
+
+    result = WeightedSumModel().evaluate(dm)
+
+    np.testing.assert_array_equal(result.rank_, [2, 1])
+    np.testing.assert_array_equal(result.e_.score, [1.0, 11.0])
+
+
+def test_WeightedSumModel_sparse():
+    matrix = np.array([[1.0, 0.0, 3.0], [0.0, 5.0, 0.0], [0.0, 0.0, 0.0]])
+    dm = skcriteria.mkdm(
+        matrix=sparse.csr_matrix(matrix),
+        objectives=[max, max, max],
+        weights=[1, 2, 3],
+    )
+    expected = WeightedSumModel().evaluate(
+        skcriteria.mkdm(matrix, [max, max, max], weights=[1, 2, 3])
+    )
+
+    result = WeightedSumModel().evaluate(dm)
+
+    assert result.equals(expected)
+    np.testing.assert_array_equal(result.e_.score, [10.0, 10.0, 0.0])
+
+
+@pytest.mark.parametrize(
+    "ranker", [WeightedSumModel(), WeightedProductModel()]
+)
+def test_simple_evaluate_weights(ranker):
+    random = np.random.default_rng(seed=42)
+    dm = skcriteria.mkdm(random.random((10, 4)) + 0.1, objectives=[max] * 4)
+    weights = random.random((5, 4))
+
+    result = ranker.evaluate_weights(dm, weights)
+
+    assert result.shape == (5, 10)
+    for idx, wvector in enumerate(weights):
+        expected = ranker.evaluate(dm.copy(weights=wvector))
+        assert result[idx].equals(expected)
+        assert np.allclose(result[idx].e_.score, expected.e_.score)
+
+
+def test_WeightedSumModel_evaluate_weights_sparse_missing_values():
+    matrix = np.array([[1.0, 0.0, np.nan], [0.0, 5.0, 6.0], [0.0, 0.0, 0.0]])
+    weights = np.array([[1.0, 1.0, 1.0], [2.0, 0.0, 1.0]])
+    expected = [[1.0, 11.0, 0.0], [2.0, 6.0, 0.0]]
+
+    for mtx in (matrix, sparse.csr_matrix(matrix)):
+        dm = skcriteria.mkdm(mtx, objectives=[max, max, max])
+        result = WeightedSumModel().evaluate_weights(dm, weights)
+        np.testing.assert_array_equal(result.e_.score, expected)
+        np.testing.assert_array_equal(result.rank_, [[2, 1, 3], [2, 1, 3]])
+
+
+def test_WeightedSumModel_evaluate_weights_minimize_fail():
+    dm = skcriteria.mkdm([[1, 2], [3, 4]], objectives=[max, min])
+    with pytest.raises(ValueError):
+        WeightedSumModel().evaluate_weights(dm, [[1, 1]])
+
+
+@pytest.mark.parametrize(
+    "ranker", [WeightedSumModel(), WeightedProductModel()]
+)
+def test_simple_evaluate_top_k(ranker):
+    random = np.random.default_rng(seed=42)
+    dm = skcriteria.mkdm(random.random((30, 4)) + 0.1, objectives=[max] * 4)
+    expected = ranker.evaluate(dm)
+    order = np.argsort(expected.rank_)[:5]
+
+    result = ranker.evaluate(dm, top_k=5)
+
+    assert result.method == expected.method
+    assert result.top_k == 5
+    np.testing.assert_array_equal(result.rank_, np.arange(1, 6))
+    np.testing.assert_array_equal(
+        result.alternatives, expected.alternatives[order]
+    )
+    np.testing.assert_array_equal(result.e_.score, expected.e_.score[order])
+
+
+def test_WeightedSumModel_evaluate_batch():
+    random = np.random.default_rng(seed=42)
+    batch = DecisionMatrixBatch(
+        random.random((5, 7, 4)),
+        objectives=[max, max, max, max],
+        weights=random.random((5, 4)),
+    )
+    ranker = WeightedSumModel()
+
+    result = ranker.evaluate_batch(batch)
+
+    assert result.method == "WeightedSumModel"
+    for idx, dm in enumerate(batch):
+        expected = ranker.evaluate(dm)
+        assert result[idx].equals(expected)
+        assert np.allclose(result[idx].e_.score, expected.e_.score)
+
+
 def test_WeightedSumModel_minimize_fail():
 
     dm = skcriteria.mkdm(
@@ -70,6 +70,10 @@ def test_SIMUS_munier24metodo():
     assert np.allclose(result.e_.method_1_score, expected.e_.method_1_score)
     assert np.allclose(result.e_.method_2_score, expected.e_.method_2_score)
 
+    # the array-level protocol returns the same ranking
+    result = ranker.evaluate_arrays(dm.to_dict(copy=False), b=b)
+    assert result.equals(expected)
+
 
 def test_SIMUS_solver_not_available():
     with pytest.raises(ValueError):
@@ -111,3 +115,48 @@ def test_SIMUS_incorrect_b():
     ranker = SIMUS()
     with pytest.raises(ValueError):
         ranker.evaluate(dm, b=b)
+
+
+def test_SIMUS_evaluate_weights():
+    dm = skcriteria.mkdm(
+        matrix=[
+            [250, 120, 20, 800],
+            [130, 200, 40, 1000],
+            [350, 340, 15, 600],
+        ],
+        objectives=[max, max, min, max],
+    )
+
+    ranker = SIMUS()
+    result = ranker.evaluate_weights(dm, [[1, 1, 1, 1], [2, 2, 2, 2]])
+    expected = ranker.evaluate(dm)
+
+    assert len(result) == 2
+    for rank in result.rank_:
+        np.testing.assert_array_equal(rank, expected.rank_)
+
+
+def test_SIMUS_evaluate_top_k():
+    dm = skcriteria.mkdm(
+        matrix=[
+            [250, 120, 20, 800],
+            [130, 200, 40, 1000],
+            [350, 340, 15, 600],
+        ],
+        objectives=[max, max, min, max],
+    )
+
+    ranker = SIMUS()
+    result = ranker.evaluate(dm, top_k=2)
+    expected = ranker.evaluate(dm)
+    selected = np.argsort(expected.rank_)[:2]
+
+    assert len(result.alternatives) == 2
+    assert len(result.e_.method_1_score) == 2
+    assert result.e_.stages_results.shape == (4, 2)
+    assert result.e_.dominance.shape == (2, 2)
+    assert all(d.shape == (2, 2) for d in result.e_.dominance_by_criteria)
+    np.testing.assert_array_equal(
+        result.e_.dominance,
+        expected.e_.dominance[np.ix_(selected, selected)],
+    )
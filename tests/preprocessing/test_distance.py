@@ -17,6 +17,8 @@
 # IMPORTS
 # =============================================================================
 
+import numpy as np
+
 import skcriteria
 from skcriteria.preprocessing.distance import CenitDistance
 
@@ -107,3 +109,20 @@ def test_CenitDistance_no_change_original_dm():
     assert (
         dm.equals(expected) and not dmt.equals(expected) and dm is not expected
     )
+
+
+def test_CenitDistance_fit():
+    reference = skcriteria.mkdm(
+        matrix=[[1, 0, 3], [0, 5, 6]], objectives=[min, max, min]
+    )
+    new = skcriteria.mkdm(
+        matrix=[[0.5, 10, 3]], objectives=[min, max, min], alternatives=["N0"]
+    )
+
+    tfm = CenitDistance().fit(reference)
+
+    np.testing.assert_array_equal(tfm.mins_, [0, 0, 3])
+    np.testing.assert_array_equal(tfm.maxs_, [1, 5, 6])
+    np.testing.assert_allclose(
+        tfm.transform(new).matrix_view, [[0.5, 2.0, 1.0]]
+    )
@@ -17,8 +17,13 @@
 # IMPORTS
 # =============================================================================
 
+import numpy as np
+
 import skcriteria
-from skcriteria.preprocessing.increment import AddValueToZero
+from skcriteria.preprocessing.increment import (
+    AddValueToZero,
+    add_value_to_zero,
+)
 
 
 # =============================================================================
@@ -168,3 +173,38 @@ def test_AddValueToZero_no_change_original_dm():
     assert (
         dm.equals(expected) and not dmt.equals(expected) and dm is not expected
     )
+
+
+def test_AddValueToZero_transform_out():
+    dm = skcriteria.mkdm(
+        matrix=[[1, 0, 3], [0, 5, 6]],
+        objectives=[min, max, min],
+    )
+    expected = AddValueToZero(value=0.5, target="matrix").transform(dm)
+
+    out = np.empty(dm.shape)
+    result = AddValueToZero(value=0.5, target="matrix").transform(dm, out=out)
+
+    assert result.equals(expected)
+    np.testing.assert_array_equal(out, expected.matrix_view)
+
+
+def test_add_value_to_zero_inplace():
+    arr = np.array([[1.0, 0.0], [2.0, 3.0]])
+    result = add_value_to_zero(arr, value=1, axis=0, out=arr)
+    assert result is arr
+    np.testing.assert_array_equal(arr, [[1, 1], [2, 4]])
+
+
+def test_AddValueToZero_preserve_float32():
+    dm = skcriteria.mkdm(
+        matrix=np.array([[1, 0, 3], [0, 5, 6]], dtype=np.float32),
+        objectives=[min, max, min],
+        weights=np.array([0, 1, 2], dtype=np.float32),
+    )
+
+    result = AddValueToZero(value=1, target="both").transform(dm)
+
+    assert result.matrix_view.dtype == np.float32
+    assert result.weights.dtype == np.float32
+    np.testing.assert_array_equal(result.weights, [1, 2, 3])
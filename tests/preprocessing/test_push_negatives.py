@@ -17,8 +17,13 @@
 # IMPORTS
 # =============================================================================
 
+import numpy as np
+
 import skcriteria
-from skcriteria.preprocessing.push_negatives import PushNegatives
+from skcriteria.preprocessing.push_negatives import (
+    PushNegatives,
+    push_negatives,
+)
 
 
 # =============================================================================
@@ -168,3 +173,13 @@ def test_PushNegatives_no_change_original_dm():
     assert (
         dm.equals(expected) and not dmt.equals(expected) and dm is not expected
     )
+
+
+def test_push_negatives_inplace():
+    arr = np.array([[-1.0, 0.0, 3.0], [0.0, -5.0, 6.0]])
+    expected = push_negatives(arr, axis=0)
+
+    result = push_negatives(arr, axis=0, out=arr)
+
+    assert result is arr
+    np.testing.assert_array_equal(arr, expected)
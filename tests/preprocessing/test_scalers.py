@@ -19,13 +19,23 @@
 
 import numpy as np
 
+import pytest
+
+from scipy import sparse
+
 import skcriteria
+from skcriteria.core import DecisionMatrixBatch
 from skcriteria.preprocessing.scalers import (
     MaxScaler,
     MinMaxScaler,
     StandarScaler,
     SumScaler,
     VectorScaler,
+    scale_by_max,
+    scale_by_minmax,
+    scale_by_stdscore,
+    scale_by_sum,
+    scale_by_vector,
 )
 
 # =============================================================================
@@ -920,3 +930,259 @@ def test_MaxScaler_no_change_original_dm(decision_matrix):
     assert (
         dm.equals(expected) and not dmt.equals(expected) and dm is not expected
     )
+
+
+# =============================================================================
+# PRECISION
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "scaler",
+    [MaxScaler, MinMaxScaler, StandarScaler, SumScaler, VectorScaler],
+)
+def test_scalers_preserve_float32(decision_matrix, scaler):
+    dm = decision_matrix(seed=42)
+    dm = dm.copy(dtypes=np.full(len(dm.criteria), np.float32))
+
+    result = scaler(target="both").transform(dm)
+
+    assert result.matrix_view.dtype == np.float32
+    assert result.weights.dtype == np.float32
+
+
+# =============================================================================
+# BATCH
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "scaler",
+    [MaxScaler, MinMaxScaler, StandarScaler, SumScaler, VectorScaler],
+)
+def test_scalers_transform_batch(scaler):
+    random = np.random.default_rng(seed=42)
+    batch = DecisionMatrixBatch(
+        random.random((5, 7, 4)),
+        objectives=[max, min, max, min],
+        weights=random.random((5, 4)),
+    )
+    transformer = scaler(target="both")
+
+    result = transformer.transform_batch(batch)
+
+    for dm, rdm in zip(batch, result):
+        assert rdm.aequals(transformer.transform(dm))
+
+
+# =============================================================================
+# MISSING VALUES
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "scaler",
+    [MaxScaler, MinMaxScaler, StandarScaler, SumScaler, VectorScaler],
+)
+def test_scalers_missing_values(scaler):
+    matrix = np.array([[1.0, 2.0], [np.nan, 4.0], [3.0, 8.0]])
+    dm = skcriteria.mkdm(matrix=matrix, objectives=[max, max])
+
+    result = scaler(target="matrix").transform(dm)
+
+    # the missing values stay missing and the other values are scaled
+    # ignoring them
+    expected = scaler(target="matrix").transform(
+        skcriteria.mkdm(matrix=[[1.0], [3.0]], objectives=[max])
+    )
+    np.testing.assert_array_equal(
+        result.valid_mask, [[True, True], [False, True], [True, True]]
+    )
+    np.testing.assert_allclose(
+        result.matrix_view[[0, 2], 0], expected.matrix_view[:, 0]
+    )
+    assert not np.any(np.isnan(result.matrix_view[:, 1]))
+
+
+@pytest.mark.parametrize("scaler", [SumScaler, MaxScaler, VectorScaler])
+@pytest.mark.parametrize("fmt", ["csr", "csc"])
+def test_scalers_sparse(scaler, fmt):
+    matrix = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 3.0], [2.0, 0.0, 6.0]])
+    dm = skcriteria.mkdm(
+        matrix=sparse.csr_matrix(matrix).asformat(fmt),
+        objectives=[max, max, min],
+    )
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        expected = scaler(target="both").transform(
+            skcriteria.mkdm(matrix=matrix, objectives=[max, max, min])
+        )
+    result = scaler(target="both").transform(dm)
+
+    # the zeros are kept (the all zeros criteria isn't a NaN)
+    assert result.engine == "sparse"
+    assert result.sparse_view.format == fmt
+    assert result.sparse_view.nnz == dm.sparse_view.nnz
+    np.testing.assert_allclose(
+        result.matrix_view, np.nan_to_num(expected.matrix_view)
+    )
+    np.testing.assert_allclose(result.weights, expected.weights)
+
+
+def test_scalers_sparse_not_supported():
+    dm = skcriteria.mkdm(
+        matrix=sparse.csr_matrix([[1.0, 0.0], [0.0, 2.0]]),
+        objectives=[max, min],
+    )
+    result = MinMaxScaler(target="matrix").transform(dm)
+    assert result.engine == "numpy"
+    np.testing.assert_array_equal(result.matrix_view, [[1, 0], [0, 1]])
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        scale_by_max,
+        scale_by_minmax,
+        scale_by_stdscore,
+        scale_by_sum,
+        scale_by_vector,
+    ],
+)
+@pytest.mark.parametrize("axis", [None, 0, 1])
+def test_scale_by_out(func, axis):
+    arr = np.random.default_rng(42).random((5, 3))
+    expected = func(arr, axis=axis)
+
+    out = np.empty_like(arr)
+    result = func(arr, axis=axis, out=out)
+    assert result is out
+    np.testing.assert_allclose(result, expected)
+
+    # in place
+    result = func(arr, axis=axis, out=arr)
+    assert result is arr
+    np.testing.assert_allclose(arr, expected)
+
+
+def test_scale_by_out_int_array():
+    arr = np.array([[1, 2], [3, 4]])
+    out = np.empty((2, 2), dtype=np.float32)
+    result = scale_by_max(arr, axis=0, out=out)
+    assert result is out
+    np.testing.assert_allclose(result, [[1 / 3, 0.5], [1, 1]], rtol=1e-6)
+
+
+def test_scale_by_out_sparse():
+    with pytest.raises(ValueError):
+        scale_by_sum(
+            sparse.csr_matrix([[1.0, 0.0]]), axis=0, out=np.empty((1, 2))
+        )
+
+
+@pytest.mark.parametrize(
+    "scaler", [StandarScaler, VectorScaler, MinMaxScaler, SumScaler, MaxScaler]
+)
+def test_scalers_transform_out(scaler, decision_matrix):
+    dm = decision_matrix(seed=42)
+    expected = scaler(target="both").transform(dm)
+
+    out = np.empty(dm.shape)
+    result = scaler(target="both").transform(dm, out=out)
+
+    assert result.aequals(expected)
+    assert np.shares_memory(result.matrix_view, out)
+    np.testing.assert_allclose(out, expected.matrix_view)
+
+
+# =============================================================================
+# FIT
+# =============================================================================
+
+
+def test_MinMaxScaler_fit():
+    reference = skcriteria.mkdm(
+        matrix=[[1, 10], [3, 20], [5, 30]], objectives=[max, min]
+    )
+    new = skcriteria.mkdm(
+        matrix=[[2, 40]], objectives=[max, min], alternatives=["N0"]
+    )
+
+    scaler = MinMaxScaler(target="matrix").fit(reference)
+
+    np.testing.assert_array_equal(scaler.mins_, [1, 10])
+    np.testing.assert_array_equal(scaler.maxs_, [5, 30])
+    assert scaler.stats_.computed == {"mins", "maxs"}
+
+    # the new alternative is scaled with the reference parameters
+    result = scaler.transform(new)
+    np.testing.assert_allclose(result.matrix_view, [[0.25, 1.5]])
+
+    # the statistics of the transformed matrix are not replaced
+    assert new.stats.computed == frozenset()
+
+
+def test_scalers_without_fit_are_stateless():
+    scaler = MinMaxScaler(target="matrix")
+    dm = skcriteria.mkdm(matrix=[[2, 40], [4, 50]], objectives=[max, min])
+    result = scaler.transform(dm)
+    assert not hasattr(scaler, "stats_")
+    np.testing.assert_array_equal(result.matrix_view, [[0, 0], [1, 1]])
+
+
+@pytest.mark.parametrize(
+    "scaler", [StandarScaler, VectorScaler, MinMaxScaler, SumScaler, MaxScaler]
+)
+def test_scalers_fit_transform(scaler, decision_matrix):
+    dm = decision_matrix(seed=42)
+
+    expected = scaler(target="both").transform(dm)
+    result = scaler(target="both").fit_transform(dm)
+
+    assert result.aequals(expected)
+
+    # a fitted scaler transforms every alternative independently
+    fitted = scaler(target="both").fit(dm)
+    single = fitted.transform(dm.iloc[[1]])
+    np.testing.assert_allclose(single.matrix_view, expected.matrix_view[[1]])
+
+
+def test_SumScaler_fit_sparse():
+    reference = skcriteria.mkdm(
+        matrix=[[1.0, 0.0], [3.0, 4.0]], objectives=[max, max]
+    )
+    new = skcriteria.mkdm(
+        matrix=sparse.csr_matrix([[2.0, 0.0]]),
+        objectives=[max, max],
+        alternatives=["N0"],
+    )
+
+    result = SumScaler(target="matrix").fit(reference).transform(new)
+
+    assert result.engine == "sparse"
+    np.testing.assert_allclose(result.matrix_view, [[0.5, 0.0]])
+
+
+@pytest.mark.parametrize(
+    "scaler", [StandarScaler, VectorScaler, MinMaxScaler, SumScaler, MaxScaler]
+)
+def test_scalers_fit_sparse_reference(scaler):
+    dense = np.array([[1.0, 0.0, 2.0], [0.0, 0.0, 3.0], [4.0, 5.0, 0.0]])
+    reference = skcriteria.mkdm(
+        matrix=sparse.csr_matrix(dense), objectives=[max, min, max]
+    )
+    new = skcriteria.mkdm(matrix=[[2.0, 1.0, 1.0]], objectives=[max, min, max])
+
+    fitted = scaler(target="matrix").fit(reference)
+    expected = scaler(target="matrix").fit(
+        skcriteria.mkdm(matrix=dense, objectives=[max, min, max])
+    )
+
+    # the statistics are computed over the sparse matrix
+    assert reference._df is None
+    assert sparse.issparse(reference.stats._matrix)
+    for name in fitted._skcriteria_fit_stats:
+        np.testing.assert_allclose(
+            getattr(fitted, f"{name}_"), getattr(expected, f"{name}_")
+        )
+    assert fitted.transform(new).aequals(expected.transform(new))
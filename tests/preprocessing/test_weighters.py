@@ -309,3 +309,34 @@ def test_critic_weight_weights_diakoulaki1995determining(
         mtx, objectives=[1, 1, 1], scale=scale, correlation=correlation
     )
     assert np.allclose(weights, result)
+
+
+def test_Critic_fit(decision_matrix):
+    reference = decision_matrix(seed=42, min_objectives_proportion=0)
+    data = reference.to_dict()
+    data["matrix"] = data["matrix"] ** 2
+    new = skcriteria.mkdm(**data)
+
+    weighter = Critic().fit(reference)
+
+    expected = Critic().transform(reference)
+    np.testing.assert_allclose(weighter.weights_, expected.weights)
+
+    # the new decision matrix receives the weights of the reference
+    result = weighter.transform(new)
+    np.testing.assert_allclose(result.weights, expected.weights)
+    np.testing.assert_array_equal(result.matrix_view, new.matrix_view)
+
+    assert weighter.fit_transform(new).aequals(Critic().transform(new))
+
+
+def test_Critic_fit_sparse(decision_matrix):
+    reference = decision_matrix(seed=42, min_objectives_proportion=0)
+    sparse_reference = reference.copy(engine="sparse")
+
+    # the weighters that don't support sparse matrices fit a dense one
+    weighter = Critic().fit(sparse_reference)
+
+    expected = Critic().fit(reference)
+    np.testing.assert_allclose(weighter.weights_, expected.weights_)
+    assert sparse_reference._df is None
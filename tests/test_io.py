@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""test for skcriteria.io
+
+"""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+import pytest
+
+from skcriteria import io
+from skcriteria.core import options
+from skcriteria.madm.simple import WeightedSumModel
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_read_csv_chunks(decision_matrix, tmp_path, engine):
+    dm = decision_matrix(
+        seed=42, min_alternatives=10, max_alternatives=10, min_criteria=3
+    )
+
+    path = tmp_path / "dm.csv"
+    dm.matrix.to_csv(path, index=False)
+
+    blocks = list(
+        io.read_csv_chunks(
+            path, dm.objectives, dm.weights, chunksize=4, engine=engine
+        )
+    )
+
+    assert [len(b) for b in blocks] == [4, 4, 2]
+    for block in blocks:
+        assert block.engine == engine
+        assert block._objectives is blocks[0]._objectives
+        assert block._weights is blocks[0]._weights
+
+    alternatives = np.concatenate([b.alternatives for b in blocks])
+    np.testing.assert_array_equal(alternatives, [f"A{i}" for i in range(10)])
+    np.testing.assert_array_equal(blocks[-1].criteria, dm.criteria)
+
+    matrix = np.concatenate([b.matrix_view for b in blocks])
+    np.testing.assert_allclose(matrix, dm.matrix_view)
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy", "sparse"])
+def test_read_csv_chunks_float32(tmp_path, engine):
+    path = tmp_path / "dm.csv"
+    path.write_text("a,b\n1.5,2\n3,4\n5,6\n7,8\n9.5,10\n")
+
+    with options.option_context(precision="float32"):
+        blocks = list(
+            io.read_csv_chunks(path, [max, max], chunksize=2, engine=engine)
+        )
+
+    assert len(blocks) == 3
+    for block in blocks:
+        assert block.dtypes.tolist() == blocks[0].dtypes.tolist()
+        assert block.dtypes.iloc[0] == np.float32
+
+    matrix = np.concatenate([b.matrix_view for b in blocks])
+    np.testing.assert_array_equal(matrix[:, 0], [1.5, 3, 5, 7, 9.5])
+
+
+def test_read_csv_chunks_index_col(tmp_path):
+    path = tmp_path / "dm.csv"
+    path.write_text("name,a,b\nx,1,2\ny,3,4\nz,5,6\n")
+
+    blocks = list(
+        io.read_csv_chunks(path, [max, min], chunksize=2, index_col="name")
+    )
+
+    np.testing.assert_array_equal(blocks[0].alternatives, ["x", "y"])
+    np.testing.assert_array_equal(blocks[1].alternatives, ["z"])
+    np.testing.assert_array_equal(blocks[1].criteria, ["a", "b"])
+    np.testing.assert_array_equal(blocks[1].weights, [1, 1])
+
+
+def test_read_csv_chunks_evaluate(decision_matrix, tmp_path):
+    dm = decision_matrix(
+        seed=42,
+        min_alternatives=10,
+        max_alternatives=10,
+        min_criteria=3,
+        min_objectives_proportion=0,
+    )
+
+    path = tmp_path / "dm.csv"
+    dm.matrix.to_csv(path, index=False)
+
+    wsm = WeightedSumModel()
+    expected = wsm.evaluate(dm).e_.score
+
+    score = np.concatenate(
+        [
+            wsm.evaluate(block).e_.score
+            for block in io.read_csv_chunks(
+                path, dm.objectives, dm.weights, chunksize=3
+            )
+        ]
+    )
+
+    np.testing.assert_allclose(score, expected)
+
+
+def test_read_csv_chunks_invalid_objectives(tmp_path):
+    path = tmp_path / "dm.csv"
+    path.write_text("a,b\n1,2\n3,4\n")
+
+    with pytest.raises(ValueError):
+        next(io.read_csv_chunks(path, [max, min, max]))
@@ -17,13 +17,29 @@
 # IMPORTS
 # =============================================================================
 
+import numpy as np
+
 import pytest
 
-from skcriteria import pipeline
+from scipy import sparse
+
+from skcriteria import mkdm, pipeline
+from skcriteria.core import arrays_to_dm, methods
+from skcriteria.madm.moora import RatioMOORA
 from skcriteria.madm.similarity import TOPSIS
+from skcriteria.madm.simple import WeightedSumModel
 from skcriteria.preprocessing.invert_objectives import MinimizeToMaximize
-from skcriteria.preprocessing.scalers import StandarScaler
-from skcriteria.preprocessing.weighters import Critic
+from skcriteria.preprocessing.scalers import (
+    MinMaxScaler,
+    StandarScaler,
+    SumScaler,
+    VectorScaler,
+)
+from skcriteria.preprocessing.weighters import (
+    Critic,
+    EqualWeighter,
+    StdWeighter,
+)
 
 # =============================================================================
 # TESTS
@@ -56,6 +72,20 @@ def test_pipeline_mkpipe(decision_matrix):
         assert s in steps
 
 
+def test_pipeline_evaluate_top_k(decision_matrix):
+    dm = decision_matrix(seed=42, min_objectives_proportion=0)
+    pipe = pipeline.mkpipe(VectorScaler(target="matrix"), RatioMOORA())
+
+    expected = pipe.evaluate(dm)
+    result = pipe.evaluate(dm, top_k=2)
+
+    assert result.top_k == 2
+    order = np.argsort(expected.rank_)[:2]
+    np.testing.assert_array_equal(
+        result.alternatives, expected.alternatives[order]
+    )
+
+
 def test_pipeline_slicing():
 
     steps = [
@@ -100,3 +130,153 @@ def test_pipeline_name_not_str():
         pipeline.SKCPipeline(steps=[(..., Critic()), ("final", TOPSIS())])
     with pytest.raises(TypeError):
         pipeline.SKCPipeline(steps=[("first", Critic()), (..., TOPSIS())])
+
+
+def test_pipeline_sparse():
+    random = np.random.default_rng(seed=42)
+    matrix = random.random((20, 5))
+    matrix[matrix < 0.7] = 0
+    dm = mkdm(
+        matrix=sparse.csr_matrix(matrix),
+        objectives=[max, min, max, max, min],
+        weights=random.random(5),
+    )
+    pipe = pipeline.mkpipe(
+        VectorScaler(target="matrix"),
+        SumScaler(target="weights"),
+        RatioMOORA(),
+    )
+
+    # the matrix is never densified by the transformers
+    transformed = dm
+    for _, step in pipe.steps[:-1]:
+        transformed = step.transform(transformed)
+        assert transformed.engine == "sparse"
+
+    expected = pipe.evaluate(mkdm(**dm.to_dict()))
+    result = pipe.evaluate(dm)
+
+    assert result.equals(expected)
+    np.testing.assert_allclose(result.e_.score, expected.e_.score)
+
+
+def test_pipeline_sparse_weights_steps():
+    random = np.random.default_rng(seed=42)
+    matrix = random.random((20, 5))
+    matrix[matrix < 0.7] = 0
+    dm = mkdm(
+        matrix=sparse.csr_matrix(matrix),
+        objectives=[max] * 5,
+        weights=random.random(5),
+    )
+    pipe = pipeline.mkpipe(
+        EqualWeighter(),
+        StdWeighter(),
+        MinMaxScaler(target="weights"),
+        SumScaler(target="matrix"),
+        WeightedSumModel(),
+    )
+
+    # the steps that only change the weights keep the sparse matrix
+    assert StandarScaler(target="weights").transform(dm).engine == "sparse"
+    assert pipe.transform(dm).engine == "sparse"
+    transformed = dm
+    for _, step in pipe.steps[:-1]:
+        transformed = step.transform(transformed)
+        assert transformed.engine == "sparse"
+
+    expected = pipe.evaluate(mkdm(**dm.to_dict()))
+    result = pipe.evaluate(dm)
+
+    assert result.equals(expected)
+    np.testing.assert_allclose(result.e_.score, expected.e_.score)
+
+
+def test_pipeline_arrays(decision_matrix):
+    dm = decision_matrix(seed=42, min_objectives_proportion=0.5)
+    pipe = pipeline.mkpipe(
+        MinimizeToMaximize(),
+        StandarScaler(target="both"),
+        Critic(),
+        TOPSIS(),
+    )
+
+    expected = dm
+    for _, step in pipe.steps[:-1]:
+        expected = step.transform(expected)
+
+    result = pipe.transform(dm)
+    assert result.aequals(expected)
+
+    rank = pipe.evaluate_arrays(dm.to_dict(copy=False))
+    assert rank.equals(pipe.steps[-1][1].evaluate(expected))
+    assert rank.equals(pipe.evaluate(dm))
+
+
+def test_pipeline_step_without_arrays(decision_matrix):
+    class Transformer:
+        def transform(self, dm):
+            return dm.copy(weights=dm.weights * 2)
+
+    class DecisionMaker:
+        def evaluate(self, dm, top_k=None):
+            return TOPSIS().evaluate(dm, top_k=top_k)
+
+    dm = decision_matrix(seed=42, min_objectives_proportion=0)
+    steps = [Transformer(), VectorScaler(target="matrix"), DecisionMaker()]
+    pipe = pipeline.mkpipe(*steps)
+
+    expected = steps[1].transform(steps[0].transform(dm))
+    assert pipe.transform(dm).aequals(expected)
+    assert pipe.evaluate(dm).equals(TOPSIS().evaluate(expected))
+    assert pipe.evaluate(dm, top_k=1).equals(
+        TOPSIS().evaluate(expected, top_k=1)
+    )
+    assert pipe.fit(dm) is pipe
+
+
+def test_pipeline_step_without_transform_fail():
+    class Transformer:
+        def transform_arrays(self, data):
+            return data
+
+    with pytest.raises(TypeError):
+        pipeline.mkpipe(Transformer(), TOPSIS())
+
+
+def test_pipeline_transform_inplace(decision_matrix):
+    dm = decision_matrix(seed=42)
+    pipe = pipeline.mkpipe(
+        MinMaxScaler(target="matrix"),
+        SumScaler(target="both"),
+        VectorScaler(target="matrix"),
+        RatioMOORA(),
+    )
+
+    expected = dm
+    for _, step in pipe.steps[:-1]:
+        expected = step.transform(expected)
+
+    data = methods.dm_to_arrays(dm)
+    result = pipe.transform_arrays(data)
+
+    # the original data is not modified and the first step matrix is
+    # reused by the next steps
+    assert data["matrix"] is not result["matrix"]
+    assert dm.aequals(decision_matrix(seed=42))
+    assert arrays_to_dm(result).aequals(expected)
+
+
+def test_pipeline_fit(decision_matrix):
+    dm = decision_matrix(seed=42)
+    pipe = pipeline.mkpipe(
+        MinMaxScaler(target="matrix"), SumScaler(target="both"), RatioMOORA()
+    )
+
+    assert pipe.fit(dm) is pipe
+    expected = pipe.evaluate(dm)
+
+    # every alternative gets the same score alone than with the reference
+    for idx in range(len(dm)):
+        result = pipe.evaluate(dm.iloc[[idx]])
+        np.testing.assert_allclose(result.e_.score, expected.e_.score[[idx]])
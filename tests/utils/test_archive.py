@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""test for skcriteria.utils.archive
+
+"""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import zipfile
+
+import numpy as np
+
+import pytest
+
+from skcriteria.utils import archive
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+ARRAYS = {
+    "c_order": np.arange(12, dtype=float).reshape(3, 4),
+    "f_order": np.asfortranarray(np.arange(12).reshape(3, 4)),
+    "strings": np.array(["a", "bb", "ccc"]),
+    "empty": np.empty((0, 3)),
+    "scalar": np.array(42),
+}
+
+
+@pytest.mark.parametrize("mmap_mode", [None, "r"])
+def test_save_load_arrays(tmp_path, mmap_mode):
+    path = tmp_path / "foo.skc"
+    header = {"foo": [1, 2], "faa": "bar"}
+
+    archive.save_arrays(path, header, ARRAYS)
+    result_header, result = archive.load_arrays(path, mmap_mode=mmap_mode)
+
+    assert result_header == header
+    assert set(result) == set(ARRAYS)
+    for name, arr in ARRAYS.items():
+        np.testing.assert_array_equal(result[name], arr)
+        assert result[name].dtype == arr.dtype
+
+
+def test_load_arrays_mmap(tmp_path):
+    path = tmp_path / "foo.skc"
+    archive.save_arrays(path, {}, ARRAYS)
+
+    _, result = archive.load_arrays(path, mmap_mode="r")
+
+    assert isinstance(result["c_order"], np.memmap)
+    assert isinstance(result["f_order"], np.memmap)
+    assert result["f_order"].flags.f_contiguous
+    assert not result["c_order"].flags.writeable
+
+
+def test_load_arrays_compressed_no_mmap(tmp_path):
+    path = tmp_path / "foo.skc"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(archive.HEADER_NAME, "{}")
+        with zf.open("arr.npy", "w") as fp:
+            np.lib.format.write_array(fp, ARRAYS["c_order"])
+
+    _, result = archive.load_arrays(path, mmap_mode="r")
+
+    assert not isinstance(result["arr"], np.memmap)
+    np.testing.assert_array_equal(result["arr"], ARRAYS["c_order"])
+
+
+@pytest.mark.parametrize("mmap_mode", ["w+", "readwrite", "x"])
+def test_load_arrays_invalid_mmap_mode(tmp_path, mmap_mode):
+    path = tmp_path / "foo.skc"
+    archive.save_arrays(path, {}, ARRAYS)
+    content = path.read_bytes()
+
+    with pytest.raises(ValueError):
+        archive.load_arrays(path, mmap_mode=mmap_mode)
+
+    # the container is not modified
+    assert path.read_bytes() == content
+
+
+def test_save_arrays_object_dtype(tmp_path):
+    path = tmp_path / "foo.skc"
+    with pytest.raises(ValueError):
+        archive.save_arrays(path, {}, {"obj": np.array([None, 1])})
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""test for skcriteria.utils.buffer
+
+"""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+from skcriteria.utils import buffer
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+def test_RowBuffer():
+    rbuffer = buffer.RowBuffer([[1, 2], [3, 4]], capacity=4)
+
+    assert rbuffer.capacity == 4
+    assert rbuffer.size == 2
+    assert rbuffer.dtype == int
+
+    view = rbuffer.view()
+    np.testing.assert_array_equal(view, [[1, 2], [3, 4]])
+    assert not view.flags.writeable
+
+
+def test_RowBuffer_capacity_less_than_size():
+    rbuffer = buffer.RowBuffer([1, 2, 3], capacity=1)
+    assert rbuffer.capacity == 3
+
+
+def test_RowBuffer_extend_in_place():
+    rbuffer = buffer.RowBuffer([[1, 2], [3, 4]], capacity=4)
+    old_view = rbuffer.view()
+
+    result = rbuffer.extend(2, [[5, 6]])
+
+    assert result is rbuffer
+    assert result.size == 3
+    np.testing.assert_array_equal(result.view(), [[1, 2], [3, 4], [5, 6]])
+    np.testing.assert_array_equal(old_view, [[1, 2], [3, 4]])
+    assert np.shares_memory(old_view, result.view())
+
+
+def test_RowBuffer_extend_behind_high_water_mark():
+    rbuffer = buffer.RowBuffer([1, 2], capacity=10)
+    first = rbuffer.extend(2, [3])
+    second = rbuffer.extend(2, [4])
+
+    assert first is rbuffer
+    assert second is not rbuffer
+    np.testing.assert_array_equal(first.view(3), [1, 2, 3])
+    np.testing.assert_array_equal(second.view(3), [1, 2, 4])
+
+
+def test_RowBuffer_extend_grow():
+    rbuffer = buffer.RowBuffer([1, 2])
+
+    result = rbuffer.extend(2, [3])
+
+    assert result is not rbuffer
+    assert result.capacity == 3
+    np.testing.assert_array_equal(result.view(), [1, 2, 3])
+
+    result = result.extend(3, [4, 5, 6, 7])
+    assert result.capacity == 7
+
+
+def test_RowBuffer_extend_promote_dtype():
+    rbuffer = buffer.RowBuffer(["a", "b"], capacity=10)
+
+    result = rbuffer.extend(2, ["long"])
+
+    assert result is not rbuffer
+    np.testing.assert_array_equal(result.view(), ["a", "b", "long"])
@@ -17,6 +17,8 @@
 # IMPORTS
 # =============================================================================
 
+import pickle
+
 import pytest
 
 from skcriteria.utils import bunch
@@ -65,3 +67,10 @@ def test_Bunch_repr():
 def test_Bunch_dir():
     md = bunch.Bunch("foo", {"alfa": 1})
     assert "alfa" in dir(md)
+
+
+def test_Bunch_pickle():
+    md = bunch.Bunch("foo", {"alfa": 1})
+    result = pickle.loads(pickle.dumps(md))
+    assert result.alfa == 1
+    assert repr(result) == repr(md)
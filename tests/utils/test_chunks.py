@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""test for skcriteria.utils.chunks
+
+"""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+import pytest
+
+from skcriteria.utils import chunks
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+def test_row_chunks():
+    arr = np.ones((5, 2))
+    result = list(chunks.row_chunks(arr, chunk_size=4))
+    assert result == [slice(0, 2), slice(2, 4), slice(4, 5)]
+
+
+def test_row_chunks_row_bigger_than_chunk():
+    arr = np.ones((3, 10))
+    result = list(chunks.row_chunks(arr, chunk_size=4))
+    assert result == [slice(0, 1), slice(1, 2), slice(2, 3)]
+
+
+@pytest.mark.parametrize("shape", [(0, 3), (7,), (4, 3, 2), (100, 10)])
+def test_row_chunks_cover_all_rows(shape):
+    arr = np.arange(np.prod(shape)).reshape(shape)
+    result = np.concatenate(
+        [arr[slc] for slc in chunks.row_chunks(arr, chunk_size=5)]
+        or [arr[:0]]
+    )
+    np.testing.assert_array_equal(result, arr)
+
+
+def test_row_chunks_default_size():
+    arr = np.ones((10, 3))
+    assert list(chunks.row_chunks(arr)) == [slice(0, 10)]
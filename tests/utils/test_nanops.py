@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: BSD-3 (https://tldrlegal.com/license/bsd-3-clause-license-(revised))
+# Copyright (c) 2016-2021, Cabral, Juan; Luczywo, Nadia
+# All rights reserved.
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""test for skcriteria.utils.nanops
+
+"""
+
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import numpy as np
+
+import pytest
+
+from scipy import sparse
+
+from skcriteria.utils import nanops
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "func, nanfunc",
+    [
+        (nanops.nanmin, np.nanmin),
+        (nanops.nanmax, np.nanmax),
+        (nanops.nansum, np.nansum),
+        (nanops.nanmean, np.nanmean),
+        (nanops.nanstd, np.nanstd),
+    ],
+)
+@pytest.mark.parametrize("axis", [None, 0, 1])
+def test_reductions_with_nan(func, nanfunc, axis):
+    arr = np.array([[1.0, np.nan, 3.0], [4.0, 5.0, 6.0]])
+    result = func(arr, axis=axis, keepdims=True)
+    expected = nanfunc(arr, axis=axis, keepdims=True)
+    np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize(
+    "func, npfunc",
+    [
+        (nanops.nanmin, np.min),
+        (nanops.nanmax, np.max),
+        (nanops.nansum, np.sum),
+        (nanops.nanmean, np.mean),
+        (nanops.nanstd, np.std),
+        (nanops.nannorm, np.linalg.norm),
+    ],
+)
+def test_reductions_without_nan(func, npfunc):
+    arr = np.random.default_rng(42).random((20, 4))
+    np.testing.assert_array_equal(func(arr, axis=0), npfunc(arr, axis=0))
+    np.testing.assert_array_equal(func(arr), npfunc(arr))
+
+
+def test_reductions_int():
+    arr = np.array([[1, 2], [3, 4]])
+    np.testing.assert_array_equal(nanops.nansum(arr, axis=0), [4, 6])
+    np.testing.assert_array_equal(nanops.nanmin(arr, axis=0), [1, 2])
+
+
+def test_nannorm():
+    arr = np.array([[3.0, np.nan], [4.0, 2.0]])
+    np.testing.assert_allclose(nanops.nannorm(arr, axis=0), [5.0, 2.0])
+    np.testing.assert_allclose(nanops.nannorm(arr), np.sqrt(29.0))
+
+
+def test_nanmin_all_nan():
+    arr = np.array([[1.0, np.nan], [2.0, np.nan]])
+    result = nanops.nanmin(arr, axis=0)
+    assert result[0] == 1.0
+    assert np.isnan(result[1])
+
+
+@pytest.mark.parametrize(
+    "func, nanfunc",
+    [
+        (nanops.nanmin, np.nanmin),
+        (nanops.nanmax, np.nanmax),
+        (nanops.nansum, np.nansum),
+        (nanops.nanmean, np.nanmean),
+        (nanops.nanstd, np.nanstd),
+    ],
+)
+@pytest.mark.parametrize("fmt", ["csr", "csc"])
+def test_reductions_sparse(func, nanfunc, fmt):
+    arr = np.array([[1.0, 0.0, -2.0], [0.0, 0.0, 3.0], [4.0, np.nan, 0.0]])
+    result = func(sparse.csr_matrix(arr).asformat(fmt), axis=0)
+    np.testing.assert_allclose(result, nanfunc(arr, axis=0))
+
+
+def test_reductions_sparse_axis_fail():
+    with pytest.raises(ValueError):
+        nanops.nanmin(sparse.csr_matrix(np.eye(2)), axis=1)
+
+
+def test_nancount():
+    arr = np.array([[1.0, np.nan, 0.0], [np.nan, np.nan, 3.0]])
+    np.testing.assert_array_equal(nanops.nancount(arr, axis=0), [1, 0, 2])
+    assert nanops.nancount(arr) == 3
+    np.testing.assert_array_equal(
+        nanops.nancount(sparse.csr_matrix(arr), axis=0), [1, 0, 2]
+    )
+
+
+def test_nanmatvec():
+    matrix = np.array([[1.0, np.nan], [3.0, 4.0], [np.nan, np.nan]])
+    result = nanops.nanmatvec(matrix, [1.0, 2.0])
+    np.testing.assert_array_equal(result, [1.0, 11.0, 0.0])
+
+
+def test_nanmatvec_without_nan():
+    matrix = np.random.default_rng(42).random((10, 3))
+    weights = np.array([0.2, 0.5, 0.3])
+    np.testing.assert_array_equal(
+        nanops.nanmatvec(matrix, weights), matrix @ weights
+    )
+
+
+def test_nanmatvec_batch():
+    matrix = np.array(
+        [[[1.0, np.nan], [3.0, 4.0]], [[1.0, 1.0], [np.nan, 2.0]]]
+    )
+    weights = np.array([[1.0, 2.0], [3.0, 4.0]])
+    result = nanops.nanmatvec(matrix, weights)
+    np.testing.assert_array_equal(result, [[1.0, 11.0], [7.0, 8.0]])
+
+
+def test_nanmatvec_int():
+    result = nanops.nanmatvec(np.array([[1, 2], [3, 4]]), np.array([1, 1]))
+    np.testing.assert_array_equal(result, [3, 7])
+
+
+@pytest.mark.parametrize("fmt", ["csr", "csc"])
+def test_nanmatvec_sparse(fmt):
+    matrix = np.array([[1.0, np.nan], [0.0, 4.0], [0.0, 0.0]])
+    smatrix = sparse.csr_matrix(matrix).asformat(fmt)
+    result = nanops.nanmatvec(smatrix, [1.0, 2.0])
+    np.testing.assert_array_equal(result, [1.0, 8.0, 0.0])
+    assert np.isnan(smatrix.data).any()
+
+
+def test_nanmatmul():
+    matrix = np.array([[1.0, np.nan], [3.0, 4.0], [np.nan, np.nan]])
+    other = np.array([[1.0, 2.0], [2.0, 0.0]])
+    result = nanops.nanmatmul(matrix, other)
+    np.testing.assert_array_equal(result, [[1.0, 2.0], [11.0, 6.0], [0, 0]])
+
+    sresult = nanops.nanmatmul(sparse.csr_matrix(matrix), other)
+    np.testing.assert_array_equal(sresult, result)
+
+
+def test_nanmatmul_without_nan():
+    random = np.random.default_rng(42)
+    matrix, other = random.random((10, 3)), random.random((3, 4))
+    np.testing.assert_array_equal(
+        nanops.nanmatmul(matrix, other), matrix @ other
+    )
@@ -34,6 +34,14 @@ def test_rank():
     expected = [2, 1, 3, 4]
     result = rank.rank_values(values)
     assert np.all(result == expected)
+    assert result.dtype == np.int32
+
+
+def test_rank_axis():
+    values = [[0.5, 0.2, 0.6], [0.1, 0.8, 0.3]]
+    expected = [[2, 1, 3], [1, 3, 2]]
+    result = rank.rank_values(values, axis=-1)
+    assert np.all(result == expected)
 
 
 def test_rank_reverse():
@@ -43,6 +51,50 @@ def test_rank_reverse():
     assert np.all(result == expected)
 
 
+@pytest.mark.parametrize("reverse", [True, False])
+@pytest.mark.parametrize("k", [1, 3, 7, 40])
+def test_top_k_values(k, reverse):
+    values = np.random.default_rng(42).integers(0, 5, size=30)
+    expected = np.argsort(rank.rank_values(values, reverse=reverse))[:k]
+    result = rank.top_k_values(values, k, reverse=reverse)
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_top_k_values_zero():
+    assert len(rank.top_k_values([0.5, 0.2], 0)) == 0
+
+
+def test_take_alternatives():
+    dominance = np.arange(9).reshape(3, 3)
+    by_criteria = (dominance, dominance * 2)
+    extra = {
+        "score": [140, 200, 98],
+        "stages": np.arange(6).reshape(2, 3),
+        "dominance": dominance,
+        "by_criteria": by_criteria,
+        "rank_by": 1,
+    }
+
+    result = rank.take_alternatives(
+        extra,
+        [1, 0],
+        [
+            "score",
+            ("stages", 1),
+            ("dominance", (0, 1)),
+            ("by_criteria", (1, 2)),
+        ],
+    )
+
+    np.testing.assert_array_equal(result["score"], [200, 140])
+    np.testing.assert_array_equal(result["stages"], [[1, 0], [4, 3]])
+    np.testing.assert_array_equal(result["dominance"], [[4, 3], [1, 0]])
+    assert isinstance(result["by_criteria"], tuple)
+    np.testing.assert_array_equal(result["by_criteria"][1], [[8, 6], [2, 0]])
+    assert result["rank_by"] == 1
+    assert len(extra["score"]) == 3
+
+
 @pytest.mark.parametrize(
     "ra, rb",
     [